@@ -27,6 +27,7 @@ import pytz
 # Import exchanges modules (like Mean Reversion bot)
 from hedge.exchanges.nado import NadoClient
 from hedge.exchanges.base import OrderResult
+from hedge.exchanges.nado_position_ledger import PositionLedger, PositionLedgerView, PositionReconciler, fill_key, flat
 from hedge.rollback_monitor import RollbackMonitor
 
 
@@ -83,6 +84,12 @@ class DNPairBot:
         tp_bps: float = 10.0,
         tp_timeout: int = 60,
         enable_tp_orders: bool = True,  # Set to False to disable TP
+        max_leg_skew_ms: float = None,  # Reject pair decisions on ETH/SOL quotes further apart (None = no limit)
+        # Research dataset: periodic top-of-book snapshots (None = disabled)
+        book_snapshot_dir: str = None,
+        book_snapshot_interval_ms: int = 250,
+        fill_dedupe_horizon_s: float = 3600.0,  # Seconds fill-event dedupe keys are kept
+        position_reconcile_interval_s: float = 30.0,  # Background REST position reconciliation (0 = disabled)
     ):
         self.target_notional = target_notional  # USD notional for each position
         self.iterations = iterations
@@ -108,6 +115,19 @@ class DNPairBot:
         self.tp_timeout = tp_timeout
         self.enable_tp_orders = enable_tp_orders  # Set to False to disable TP
 
+        # Joint ETH/SOL quote (created on first use from the WS BBO handlers)
+        self.max_leg_skew_ms = max_leg_skew_ms
+        self._pair_quotes = None
+
+        # Book snapshot sink (started in initialize_clients when a directory is set)
+        self.book_snapshot_dir = book_snapshot_dir
+        self.book_snapshot_interval_ms = book_snapshot_interval_ms
+        self._book_snapshot_sink = None
+
+        self.fill_dedupe_horizon_s = fill_dedupe_horizon_s
+        self.position_reconcile_interval_s = position_reconcile_interval_s
+        self._position_reconciler = None
+
         # CRITICAL: Initialize to prevent AttributeError in Phase 2
         self._tp_hit_position = None  # Track which position hit TP
         self._tp_hit_pnl_pct = None   # Track PNL % when TP hit
@@ -131,6 +151,7 @@ class DNPairBot:
         self._config_logger.info(f"[CONFIG] Partial fills: {self.enable_partial_fills} (min ratio: {self.min_partial_fill_ratio})")
         self._config_logger.info(f"[CONFIG] Dynamic timeout: {self.enable_dynamic_timeout}")
         self._config_logger.info(f"[CONFIG] Static TP: {self.enable_static_tp} (threshold: {self.tp_bps} bps, timeout: {self.tp_timeout}s)")
+        self._config_logger.info(f"[CONFIG] Max leg skew: {self.max_leg_skew_ms} ms")
 
         # Use custom CSV path if provided
         if csv_path:
@@ -204,13 +225,15 @@ class DNPairBot:
         # Real-time PNL logging task
         self._realtime_pnl_task = None
 
-        # WebSocket position tracking for startup residual detection
-        self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
+        # Position ledgers: single position truth per ticker, fed by fills,
+        # bridged order results and REST reconciliation (_ws_positions is a view)
+        self._position_ledgers = {
+            "ETH": PositionLedger(dedupe_horizon_s=self.fill_dedupe_horizon_s),
+            "SOL": PositionLedger(dedupe_horizon_s=self.fill_dedupe_horizon_s),
+        }
         self._ws_initial_sync_complete = False  # True after startup baseline is seeded and WS market-data path is warm
         self._ws_initial_sync_received = set()  # Track which tickers actually emitted position_change (diagnostic only)
         self._ws_position_change_raw = {"ETH": Decimal("0"), "SOL": Decimal("0")}  # Raw position_change values for diagnostics only
-        self._processed_fill_events = set()  # Dedupe fill-stream events
-        self._bridged_fill_order_ids = set()  # Order IDs already reflected into _ws_positions from order results
         self._last_order_target_quantities = {"ETH": Decimal("0"), "SOL": Decimal("0")}
         self._last_cycle_flat_skip = False
         self._last_cycle_outcome = None
@@ -219,12 +242,19 @@ class DNPairBot:
         self.USE_ASYNC_POSITION_WAIT = True  # Feature flag: enable async position waiting
         self.POSITION_WAIT_TIMEOUT = 30  # Max seconds to wait for WebSocket position zero
         self.POSITION_DRIFT_THRESHOLD = Decimal("0.1")  # Alert threshold for REST vs WS mismatch
-        self.POSITION_ZERO_CHECK_INTERVAL = 0.5  # Seconds between position checks during wait
-
-        # Position zero events dictionary (for signaling position zero via WebSocket)
-        self._position_zero_events = {}  # ticker -> asyncio.Event
+        self.POSITION_DUST = Decimal("0.001")  # Positions within this of a target count as reached
         self._startup_data_source = None  # Track which data source was used for startup check
 
+    @property
+    def _ws_positions(self) -> PositionLedgerView:
+        """Ledger positions as a {ticker: position} mapping (assignment sets the ledger)."""
+        return PositionLedgerView(self._position_ledgers)
+
+    @_ws_positions.setter
+    def _ws_positions(self, positions: dict) -> None:
+        for ticker, position in positions.items():
+            self._position_ledgers[ticker].set_position(Decimal(position))
+
     def _setup_logger(self):
         self.logger = logging.getLogger("dn_pair_eth_sol_nado")
         self.logger.setLevel(logging.INFO)
@@ -487,10 +517,6 @@ class DNPairBot:
             raw_value = chosen_raw if chosen_raw is not None else "0"
             amount = Decimal(str(raw_value)) / precision if raw_value else Decimal("0")
 
-            # Store in memory for real-time monitoring
-            if not hasattr(self, '_ws_positions'):
-                self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-
             # Store raw stream value separately for diagnostics only.
             old_pos = self._ws_position_change_raw.get(ticker, Decimal("0"))
             new_pos_ws = amount
@@ -541,26 +567,13 @@ class DNPairBot:
         This bot uses fill events as the primary real-time source for position
         quantity because mainnet `position_change.amount` values do not map
         cleanly to the bot's token quantity units for all products.
+
+        The fill is applied to the ticker's PositionLedger, which drops
+        replayed fills and absorbs quantity already bridged from the order
+        result (see _apply_order_result_to_ws_positions).
         """
         try:
-            order_digest = data.get("order_digest")
-            if order_digest in self._bridged_fill_order_ids:
-                # The order result already updated _ws_positions for immediate
-                # phase handoff. Ignore the first matching fill event to avoid
-                # double-counting, then forget the bridge marker.
-                self._bridged_fill_order_ids.discard(order_digest)
-                self.logger.debug(f"[FILL WS] Ignoring bridged fill event for {order_digest}")
-                return
-
-            event_key = (
-                order_digest,
-                data.get("filled_qty"),
-                data.get("remaining_qty"),
-                data.get("timestamp"),
-            )
-            if event_key in self._processed_fill_events:
-                return
-            self._processed_fill_events.add(event_key)
+            order_digest, fill_index = fill_key(data)
 
             product_id = data.get("product_id")
             if product_id == self.eth_client.config.contract_id:
@@ -576,9 +589,14 @@ class DNPairBot:
             is_bid = bool(data.get("is_bid"))
             signed_delta = filled_qty if is_bid else -filled_qty
 
-            old_pos = self._ws_positions.get(ticker, Decimal("0"))
-            new_pos = old_pos + signed_delta
-            self._ws_positions[ticker] = new_pos
+            ledger = self._position_ledgers[ticker]
+            old_pos = ledger.position
+            if not ledger.apply_fill(order_digest, fill_index, signed_delta):
+                return
+            new_pos = ledger.position
+            if new_pos == old_pos:
+                self.logger.debug(f"[FILL WS] {ticker}: fill of bridged order {order_digest} confirmed")
+                return
 
             self.logger.info(
                 f"[FILL WS] {ticker}: {old_pos} -> {new_pos} "
@@ -594,13 +612,6 @@ class DNPairBot:
                 price=None
             )
 
-            if new_pos == Decimal("0"):
-                if hasattr(self, '_position_zero_events') and ticker in self._position_zero_events:
-                    event = self._position_zero_events.get(ticker)
-                    if event and not event.is_set():
-                        event.set()
-                        self.logger.debug(f"[FILL WS] Signaled position zero for {ticker}")
-
         except Exception as e:
             self.logger.error(f"[FILL WS] Error processing fill update: {e}")
             import traceback
@@ -630,13 +641,12 @@ class DNPairBot:
             return
 
         signed_delta = filled if direction == "buy" else -filled
-        old_pos = self._ws_positions.get(ticker, Decimal("0"))
-        new_pos = old_pos + signed_delta
-        self._ws_positions[ticker] = new_pos
-
-        order_id = getattr(result, 'order_id', None)
-        if order_id:
-            self._bridged_fill_order_ids.add(order_id)
+        ledger = self._position_ledgers[ticker]
+        old_pos = ledger.position
+        # The ledger keeps the bridged quantity per order and absorbs the
+        # order's fills when they arrive, so nothing is counted twice.
+        ledger.apply_bridged(getattr(result, 'order_id', None) or None, signed_delta)
+        new_pos = ledger.position
 
         self.logger.info(
             f"[WS BRIDGE] {phase} {ticker}: {old_pos} -> {new_pos} "
@@ -648,10 +658,10 @@ class DNPairBot:
         ticker: str,
         timeout: float = None
     ) -> bool:
-        """Wait for WebSocket position to reach zero.
+        """Wait for the ledger position to reach zero (up to POSITION_DUST).
 
-        Creates a fresh asyncio.Event for each wait operation to avoid
-        race conditions and ensure clean state.
+        Wakes on the fill or reconciliation that flattens the position; any
+        number of tasks may wait on the same ticker.
 
         Args:
             ticker: Trading pair symbol (e.g., "ETH", "SOL")
@@ -660,8 +670,6 @@ class DNPairBot:
         Returns:
             True if position reached zero, False if timeout
         """
-        from decimal import Decimal
-
         # Feature flag check
         if not self.USE_ASYNC_POSITION_WAIT:
             self.logger.warning(
@@ -673,44 +681,18 @@ class DNPairBot:
         if timeout is None:
             timeout = self.POSITION_WAIT_TIMEOUT
 
-        # Check if already at zero
-        current_pos = self._ws_positions.get(ticker, Decimal("0"))
-        if current_pos == Decimal("0"):
-            self.logger.debug(f"[WAIT] {ticker} already at zero")
-            return True
-
-        # Create FRESH event for this wait operation
-        # (Do NOT reuse events - creates race conditions)
-        zero_event = asyncio.Event()
-
-        # Store event so _on_fill_message() can signal it when a leg returns to flat
-        if not hasattr(self, '_position_zero_events'):
-            self._position_zero_events = {}
-        self._position_zero_events[ticker] = zero_event
-
-        try:
-            # Wait for event to be set by _on_fill_message()
-            await asyncio.wait_for(
-                zero_event.wait(),
-                timeout=timeout
-            )
+        if await self._ws_positions.wait_for(ticker, flat(self.POSITION_DUST), timeout):
             self.logger.info(
                 f"[WAIT] {ticker} position confirmed zero via WebSocket"
             )
             return True
 
-        except asyncio.TimeoutError:
-            final_pos = self._ws_positions.get(ticker, Decimal("0"))
-            self.logger.warning(
-                f"[WAIT] Timeout waiting for {ticker} position zero. "
-                f"Current: {final_pos}, Timeout: {timeout}s"
-            )
-            return False
-
-        finally:
-            # Clean up event after use
-            if ticker in self._position_zero_events:
-                del self._position_zero_events[ticker]
+        final_pos = self._ws_positions.get(ticker, Decimal("0"))
+        self.logger.warning(
+            f"[WAIT] Timeout waiting for {ticker} position zero. "
+            f"Current: {final_pos}, Timeout: {timeout}s"
+        )
+        return False
 
     async def _detect_position_drift(
         self,
@@ -775,11 +757,8 @@ class DNPairBot:
             self.logger.warning(f"[WS SYNC] Failed to seed startup positions from REST: {e}")
             return False
 
-        if not hasattr(self, '_ws_positions'):
-            self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-
-        self._ws_positions["ETH"] = eth_pos
-        self._ws_positions["SOL"] = sol_pos
+        self._position_ledgers["ETH"].set_position(eth_pos, "rest_seed")
+        self._position_ledgers["SOL"].set_position(sol_pos, "rest_seed")
         self._ws_initial_sync_complete = True
         self._startup_data_source = "websocket_runtime + rest_seed"
 
@@ -822,19 +801,14 @@ class DNPairBot:
                 client = self.eth_client if ticker == "ETH" else self.sol_client
                 rest_pos = await client.get_account_positions()
 
-                if not hasattr(self, '_ws_positions'):
-                    self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-
-                ws_pos = self._ws_positions.get(ticker, Decimal("0"))
-                drift = abs(rest_pos - ws_pos)
-                POSITION_TOLERANCE = Decimal("0.001")
+                ws_pos = self._position_ledgers[ticker].position
+                drift = abs(self._position_ledgers[ticker].reconcile(rest_pos, Decimal("0.001")))
 
-                if drift > POSITION_TOLERANCE:
+                if drift > Decimal("0.001"):
                     self.logger.warning(
                         f"[POSITION VERIFY] {ticker} drift: WS={ws_pos}, REST={rest_pos}, "
-                        f"drift={drift}. Syncing to REST (WS may have missed events)..."
+                        f"drift={drift}. Synced to REST (WS may have missed events)"
                     )
-                    self._ws_positions[ticker] = rest_pos
                 else:
                     self.logger.info(
                         f"[POSITION VERIFY] {ticker} aligned: WS={ws_pos}, REST={rest_pos}"
@@ -899,18 +873,17 @@ class DNPairBot:
         # 1. Startup baseline was seeded after WS warmup, OR
         # 2. _ws_positions has been manually set with non-default values (for testing)
         use_websocket = False
-        if hasattr(self, '_ws_positions') and self._ws_positions:
-            if self._ws_initial_sync_complete:
-                # Startup baseline seeded - use WS-tracked state
+        if self._ws_initial_sync_complete:
+            # Startup baseline seeded - use WS-tracked state
+            use_websocket = True
+        else:
+            # Check if positions have been manually set (not the default zero initialization)
+            # This allows tests to simulate WebSocket positions
+            eth_val = self._ws_positions.get("ETH", Decimal("0"))
+            sol_val = self._ws_positions.get("SOL", Decimal("0"))
+            # If either position is non-zero, assume it was manually set for testing
+            if eth_val != Decimal("0") or sol_val != Decimal("0"):
                 use_websocket = True
-            else:
-                # Check if positions have been manually set (not the default zero initialization)
-                # This allows tests to simulate WebSocket positions
-                eth_val = self._ws_positions.get("ETH", Decimal("0"))
-                sol_val = self._ws_positions.get("SOL", Decimal("0"))
-                # If either position is non-zero, assume it was manually set for testing
-                if eth_val != Decimal("0") or sol_val != Decimal("0"):
-                    use_websocket = True
 
         if use_websocket:
             eth_pos = self._ws_positions.get("ETH", Decimal("0"))
@@ -975,6 +948,23 @@ class DNPairBot:
 
     async def cleanup(self):
         """Cleanup and disconnect all clients."""
+        if self._position_reconciler:
+            await self._position_reconciler.stop()
+            self._position_reconciler = None
+
+        # Write out queued book snapshots before the books go away
+        if self._book_snapshot_sink:
+            try:
+                await self._book_snapshot_sink.stop()
+            except Exception as e:
+                self.logger.warning(f"[CLEANUP] Book snapshot sink stop failed: {e}")
+            self._book_snapshot_sink = None
+
+        # Detach the pair quote aggregator from the BBO handlers
+        if self._pair_quotes is not None:
+            self._pair_quotes.stop()
+            self._pair_quotes = None
+
         # Disconnect ETH client
         if self.eth_client:
             try:
@@ -1564,15 +1554,11 @@ class DNPairBot:
                                 # REST is ground truth after we already confirmed the
                                 # actual position is closed. If WS still shows a stale
                                 # non-zero value here, sync it down to zero.
-                                if not hasattr(self, '_ws_positions'):
-                                    self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-                                self._ws_positions[ticker] = Decimal("0")
+                                self._position_ledgers[ticker].set_position(Decimal("0"), "rest_reset")
                                 self.logger.info(f"[FORCE] Synced stale WS position to REST zero: {ticker}=0")
                     else:
                         # Feature flag disabled - use old behavior
-                        if not hasattr(self, '_ws_positions'):
-                            self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-                        self._ws_positions[ticker] = Decimal("0")
+                        self._position_ledgers[ticker].set_position(Decimal("0"), "rest_reset")
                         self.logger.info(f"[FORCE] Synced WS position to REST: {ticker}=0 (legacy)")
 
                     return True
@@ -1616,15 +1602,11 @@ class DNPairBot:
                                 drift = await self._detect_position_drift(ticker, client)
                                 if drift > self.POSITION_DRIFT_THRESHOLD:
                                     self.logger.warning(f"[FORCE] Drift after close: {drift}")
-                                    if not hasattr(self, '_ws_positions'):
-                                        self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-                                    self._ws_positions[ticker] = Decimal("0")
+                                    self._position_ledgers[ticker].set_position(Decimal("0"), "rest_reset")
                                     self.logger.info(f"[FORCE] Synced stale WS position to REST zero after close: {ticker}=0")
                             else:
                                 # Feature flag disabled - use old behavior
-                                if not hasattr(self, '_ws_positions'):
-                                    self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-                                self._ws_positions[ticker] = Decimal("0")
+                                self._position_ledgers[ticker].set_position(Decimal("0"), "rest_reset")
                                 self.logger.info(f"[FORCE] Synced WS position to REST: {ticker}=0 (legacy)")
 
                             return True
@@ -1707,49 +1689,38 @@ class DNPairBot:
         POSITION_TOLERANCE = Decimal("0.001")
 
         try:
-            ws_healthy = False
-
-            # Primary: Use WebSocket positions if available and healthy
-            if hasattr(self, '_ws_positions') and self._ws_positions:
-                # Check if WebSocket is healthy (received update within 30 seconds)
-                ws_healthy = True
-                if hasattr(self, '_ws_last_update_time'):
-                    current_time = time.time()
-                    for ticker in ["ETH", "SOL"]:
-                        last_update = self._ws_last_update_time.get(ticker, 0)
-                        if current_time - last_update > 30:
-                            ws_healthy = False
-                            self.logger.warning(
-                                f"[SAFETY] WebSocket unhealthy for {ticker} "
-                                f"(last update {current_time - last_update:.1f}s ago)"
-                            )
+            # Primary: Use WebSocket positions if healthy (received update within 30 seconds)
+            ws_healthy = True
+            if hasattr(self, '_ws_last_update_time'):
+                current_time = time.time()
+                for ticker in ["ETH", "SOL"]:
+                    last_update = self._ws_last_update_time.get(ticker, 0)
+                    if current_time - last_update > 30:
+                        ws_healthy = False
+                        self.logger.warning(
+                            f"[SAFETY] WebSocket unhealthy for {ticker} "
+                            f"(last update {current_time - last_update:.1f}s ago)"
+                        )
 
-                if ws_healthy:
-                    eth_pos = self._ws_positions.get("ETH", Decimal("0"))
-                    sol_pos = self._ws_positions.get("SOL", Decimal("0"))
-                    self.logger.info(f"[SAFETY] WebSocket positions: ETH={eth_pos}, SOL={sol_pos}")
-                else:
-                    # Fallback to REST API if WebSocket is unhealthy
-                    self.logger.warning("[SAFETY] WebSocket unhealthy, using REST API for verification")
-                    eth_pos = await self.eth_client.get_account_positions()
-                    sol_pos = await self.sol_client.get_account_positions()
-                    self.logger.info(f"[SAFETY] REST API positions: ETH={eth_pos}, SOL={sol_pos}")
+            if ws_healthy:
+                eth_pos = self._ws_positions.get("ETH", Decimal("0"))
+                sol_pos = self._ws_positions.get("SOL", Decimal("0"))
+                self.logger.info(f"[SAFETY] WebSocket positions: ETH={eth_pos}, SOL={sol_pos}")
             else:
-                # No WebSocket data - use REST API
+                # Fallback to REST API if WebSocket is unhealthy
+                self.logger.warning("[SAFETY] WebSocket unhealthy, using REST API for verification")
                 eth_pos = await self.eth_client.get_account_positions()
                 sol_pos = await self.sol_client.get_account_positions()
-                self.logger.info(f"[SAFETY] REST API positions (no WS): ETH={eth_pos}, SOL={sol_pos}")
+                self.logger.info(f"[SAFETY] REST API positions: ETH={eth_pos}, SOL={sol_pos}")
 
             # When WS is stale or unavailable, REST becomes the bounded authority for
             # pre-BUILD flatness. Sync the stale WS cache so the next cycle does not
             # fail on an old non-zero value after actual positions are already flat.
             if not ws_healthy:
-                if not hasattr(self, '_ws_positions'):
-                    self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-                self._ws_positions["ETH"] = eth_pos
-                self._ws_positions["SOL"] = sol_pos
+                self._position_ledgers["ETH"].set_position(eth_pos, "rest_reset")
+                self._position_ledgers["SOL"].set_position(sol_pos, "rest_reset")
                 self.logger.info(
-                    f"[SAFETY] Synced stale WS cache from REST: ETH={eth_pos}, SOL={sol_pos}"
+                    f"[SAFETY] Reset position ledgers from REST: ETH={eth_pos}, SOL={sol_pos}"
                 )
 
             if abs(eth_pos) > POSITION_TOLERANCE or abs(sol_pos) > POSITION_TOLERANCE:
@@ -1794,10 +1765,12 @@ class DNPairBot:
                             )
                             return False
                 else:
-                    # Feature flag disabled - use old behavior
-                    if hasattr(self, '_ws_positions'):
-                        self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-                        self.logger.info("[SAFETY] WebSocket positions reset (legacy)")
+                    # Feature flag disabled - reset the ledgers to the REST-confirmed positions
+                    self._position_ledgers["ETH"].set_position(eth_rest, "rest_reset")
+                    self._position_ledgers["SOL"].set_position(sol_rest, "rest_reset")
+                    self.logger.info(
+                        f"[SAFETY] Position ledgers reset from REST: ETH={eth_rest}, SOL={sol_rest} (legacy)"
+                    )
 
             return True
 
@@ -2600,8 +2573,7 @@ class DNPairBot:
 
         try:
             # Get current prices
-            eth_bid, eth_ask = await self.eth_client.fetch_bbo_prices(self.eth_client.config.contract_id)
-            sol_bid, sol_ask = await self.sol_client.fetch_bbo_prices(self.sol_client.config.contract_id)
+            eth_bid, eth_ask, sol_bid, sol_ask, _ = await self._fetch_pair_prices()
 
             eth_entry_price = self.entry_prices.get("ETH") or Decimal("0")
             sol_entry_price = self.entry_prices.get("SOL") or Decimal("0")
@@ -2624,6 +2596,25 @@ class DNPairBot:
         except Exception as e:
             self.logger.error(f"[PNL] Error logging real-time PNL: {e}")
 
+    def get_dedupe_stats(self) -> dict:
+        """
+        Get sizes of the bounded fill dedupe structures.
+
+        Returns:
+            dict of name -> ExpiringDedupe stats (size, max_size, horizon_s,
+            expired, evicted) for each position ledger's applied fills and
+            each client's FillHandler ledger
+        """
+        stats = {
+            f"{ticker.lower()}_position_fills": ledger.get_dedupe_stats()
+            for ticker, ledger in self._position_ledgers.items()
+        }
+        for ticker, client in (("eth", getattr(self, 'eth_client', None)), ("sol", getattr(self, 'sol_client', None))):
+            fill_handler = getattr(client, '_fill_handler', None)
+            if fill_handler is not None:
+                stats[f"{ticker}_fill_ledger"] = fill_handler.get_ledger_stats()
+        return stats
+
     def _generate_daily_pnl_report(self) -> dict:
         """
         Generate daily PNL report from accumulated statistics.
@@ -2649,6 +2640,9 @@ class DNPairBot:
         win_rate = (profitable_cycles / total_cycles * 100) if total_cycles > 0 else 0
         avg_pnl = (total_pnl / total_cycles) if total_cycles > 0 else Decimal("0")
 
+        dedupe_stats = self.get_dedupe_stats()
+        dedupe_entries = sum(stats["size"] for stats in dedupe_stats.values())
+
         report = {
             "total_cycles": total_cycles,
             "profitable_cycles": profitable_cycles,
@@ -2658,7 +2652,8 @@ class DNPairBot:
             "total_fees": float(total_fees),
             "avg_pnl_per_cycle": float(avg_pnl),
             "best_cycle_pnl": float(best_pnl),
-            "worst_cycle_pnl": float(worst_pnl)
+            "worst_cycle_pnl": float(worst_pnl),
+            "dedupe": dedupe_stats
         }
 
         self.logger.info(
@@ -2670,6 +2665,7 @@ class DNPairBot:
             f"  Avg PNL/Cycle: ${avg_pnl:.2f}\n"
             f"  Best Cycle: ${best_pnl:.2f}\n"
             f"  Worst Cycle: ${worst_pnl:.2f}\n"
+            f"  Dedupe Entries: {dedupe_entries}\n"
             f"================================"
         )
 
@@ -2716,6 +2712,109 @@ class DNPairBot:
                 float(self.current_cycle_pnl.get("pnl_with_fee", Decimal("0")))
             ])
 
+    async def _wait_for_bbo_condition(self, predicate, timeout: float) -> bool:
+        """
+        Sleep up to timeout, waking on the BBO tick where predicate(eth_bbo, sol_bbo) holds.
+
+        Without fresh WebSocket BBO on both legs this is a plain sleep.
+
+        Args:
+            predicate: Called with the latest (ETH, SOL) BBOData on each tick
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if woken by the predicate, False on timeout
+        """
+        try:
+            from hedge.exchanges.nado_bbo_handler import BBOHandler, wait_until_pair
+
+            eth_handler = self.eth_client.get_bbo_handler()
+            sol_handler = self.sol_client.get_bbo_handler()
+            if isinstance(eth_handler, BBOHandler) and isinstance(sol_handler, BBOHandler):
+                return await wait_until_pair(eth_handler, sol_handler, predicate, timeout) is not None
+        except ImportError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"[BBO] Waiter unavailable, polling: {e}")
+
+        await asyncio.sleep(timeout)
+        return False
+
+    def _get_pair_quote(self):
+        """
+        Get the latest joint ETH/SOL quote from the WebSocket BBO feeds.
+
+        The aggregator is created on first use once both legs have a BBOHandler.
+
+        Returns:
+            PairQuote (leg_a=ETH, leg_b=SOL), or None without live BBO on both legs
+        """
+        try:
+            from hedge.exchanges.nado_bbo_handler import BBOHandler
+            from hedge.exchanges.nado_pair_quote import PairQuoteAggregator
+        except ImportError:
+            return None
+
+        if not self.eth_client or not self.sol_client:
+            return None
+        eth_handler = self.eth_client.get_bbo_handler()
+        sol_handler = self.sol_client.get_bbo_handler()
+        if not isinstance(eth_handler, BBOHandler) or not isinstance(sol_handler, BBOHandler):
+            return None
+        if eth_handler.is_stale() or sol_handler.is_stale():
+            return None
+
+        if self._pair_quotes is None or self._pair_quotes.handler_a is not eth_handler \
+                or self._pair_quotes.handler_b is not sol_handler:
+            if self._pair_quotes is not None:
+                self._pair_quotes.stop()
+            self._pair_quotes = PairQuoteAggregator(eth_handler, sol_handler)
+            self._pair_quotes.start()
+        return self._pair_quotes.get_quote()
+
+    async def _fetch_pair_prices(self) -> Tuple[Decimal, Decimal, Decimal, Decimal, Optional[float]]:
+        """
+        Fetch ETH and SOL bid/ask for a pair decision.
+
+        Both legs come from one pair quote when WebSocket BBO is live on both,
+        otherwise from one fetch_bbo_prices call per leg.
+
+        Returns:
+            (eth_bid, eth_ask, sol_bid, sol_ask, skew_ms); skew_ms is the legs'
+            exchange timestamp skew, or None for the per-leg fallback
+        """
+        quote = self._get_pair_quote()
+        if quote is not None:
+            eth_bbo, sol_bbo = quote.leg_a, quote.leg_b
+            return eth_bbo.bid_price, eth_bbo.ask_price, sol_bbo.bid_price, sol_bbo.ask_price, quote.skew_ms
+
+        eth_bid, eth_ask = await self.eth_client.fetch_bbo_prices(self.eth_client.config.contract_id)
+        sol_bid, sol_ask = await self.sol_client.fetch_bbo_prices(self.sol_client.config.contract_id)
+        return eth_bid, eth_ask, sol_bid, sol_ask, None
+
+    def _leg_skew_exceeded(self, skew_ms: Optional[float]) -> bool:
+        """True if max_leg_skew_ms is set and the pair quote's legs are further apart."""
+        return self.max_leg_skew_ms is not None and skew_ms is not None and skew_ms > self.max_leg_skew_ms
+
+    def _entry_spread(
+        self,
+        eth_bid: Decimal,
+        eth_ask: Decimal,
+        sol_bid: Decimal,
+        sol_ask: Decimal,
+        skew_ms: Optional[float]
+    ) -> Optional[float]:
+        """
+        Entry spread of a pair quote in bps, or None if it cannot be entered.
+
+        A quote can be entered when it passes _check_spread_profitability and
+        its legs are within max_leg_skew_ms.
+        """
+        is_profitable, spread_info = self._check_spread_profitability(eth_bid, eth_ask, sol_bid, sol_ask)
+        if not is_profitable or self._leg_skew_exceeded(skew_ms):
+            return None
+        return max(spread_info["eth_spread_bps"], spread_info["sol_spread_bps"])
+
     async def _wait_for_optimal_entry(self, timeout: int = 30, eth_direction: str = "buy", sol_direction: str = "sell") -> dict:
         """
         Wait for optimal entry timing based on BBO momentum and spread state.
@@ -2748,16 +2847,19 @@ class DNPairBot:
         sol_momentum = None
         spread_state = None
 
+        # One BBO snapshot per leg: momentum and spread state from the same tick
         try:
-            if self.eth_client and self.eth_client.get_bbo_handler():
-                eth_momentum = self.eth_client.get_bbo_handler().get_momentum()
-                spread_state = self.eth_client.get_bbo_handler().get_spread_state()
+            eth_bbo = self.eth_client.get_bbo_snapshot() if self.eth_client else None
+            if eth_bbo is not None:
+                eth_momentum = eth_bbo.momentum
+                spread_state = eth_bbo.spread_state
         except Exception:
             pass
 
         try:
-            if self.sol_client and self.sol_client.get_bbo_handler():
-                sol_momentum = self.sol_client.get_bbo_handler().get_momentum()
+            sol_bbo = self.sol_client.get_bbo_snapshot() if self.sol_client else None
+            if sol_bbo is not None:
+                sol_momentum = sol_bbo.momentum
         except Exception:
             pass
 
@@ -2805,14 +2907,13 @@ class DNPairBot:
         self.logger.info(f"[ENTRY] Monitoring BBO for optimal entry (timeout={timeout}s)")
 
         while time.time() - start_time < timeout:
-            eth_bid, eth_ask = await self.eth_client.fetch_bbo_prices(self.eth_client.config.contract_id)
-            sol_bid, sol_ask = await self.sol_client.fetch_bbo_prices(self.sol_client.config.contract_id)
+            eth_bid, eth_ask, sol_bid, sol_ask, skew_ms = await self._fetch_pair_prices()
 
-            is_profitable, spread_info = self._check_spread_profitability(eth_bid, eth_ask, sol_bid, sol_ask)
-
-            if is_profitable:
-                current_spread = max(spread_info["eth_spread_bps"], spread_info["sol_spread_bps"])
+            current_spread = self._entry_spread(eth_bid, eth_ask, sol_bid, sol_ask, skew_ms)
 
+            if current_spread is None and self._leg_skew_exceeded(skew_ms):
+                self.logger.debug(f"[ENTRY] Leg skew {skew_ms:.0f}ms > {self.max_leg_skew_ms}ms, waiting")
+            elif current_spread is not None:
                 if best_spread is None or current_spread > best_spread:
                     best_spread = current_spread
                     best_spread_time = time.time()
@@ -2831,7 +2932,20 @@ class DNPairBot:
                         "threshold_reason": threshold_reason
                     }
 
-            await asyncio.sleep(1)  # Check every second
+            # Check every second, waking on the BBO tick that meets the threshold.
+            # Judged on the same pair quote as _fetch_pair_prices: a tick this
+            # loop would not enter on must not wake it, or the wait never yields.
+            def entry_ready(eth_bbo, sol_bbo) -> bool:
+                quote = self._get_pair_quote()
+                if quote is None:
+                    return False
+                spread = self._entry_spread(
+                    quote.leg_a.bid_price, quote.leg_a.ask_price,
+                    quote.leg_b.bid_price, quote.leg_b.ask_price, quote.skew_ms
+                )
+                return spread is not None and spread >= dynamic_threshold
+
+            await self._wait_for_bbo_condition(entry_ready, min(1.0, max(0.0, timeout - (time.time() - start_time))))
 
         # Timeout: use best spread seen or current
         elapsed = time.time() - start_time
@@ -2876,8 +2990,7 @@ class DNPairBot:
         )
 
         # Calculate unrealized PNL
-        eth_bid, eth_ask = await self.eth_client.fetch_bbo_prices(self.eth_client.config.contract_id)
-        sol_bid, sol_ask = await self.sol_client.fetch_bbo_prices(self.sol_client.config.contract_id)
+        eth_bid, eth_ask, sol_bid, sol_ask, _ = await self._fetch_pair_prices()
 
         eth_entry_price = self.entry_prices.get("ETH") or Decimal("0")
         sol_entry_price = self.entry_prices.get("SOL") or Decimal("0")
@@ -2953,70 +3066,42 @@ class DNPairBot:
 
         # BLOCKING BEHAVIOR: This loop blocks until TP hit or timeout
         while time.time() - start_time < timeout_seconds:
-            eth_bid, eth_ask = await self.eth_client.fetch_bbo_prices(
-                self.eth_client.config.contract_id
-            )
-            sol_bid, sol_ask = await self.sol_client.fetch_bbo_prices(
-                self.sol_client.config.contract_id
-            )
-
-            eth_entry_price = self.entry_prices.get("ETH") or Decimal("0")
-            sol_entry_price = self.entry_prices.get("SOL") or Decimal("0")
-            eth_qty = self.entry_quantities.get("ETH") or Decimal("0")
-            sol_qty = self.entry_quantities.get("SOL") or Decimal("0")
+            eth_bid, eth_ask, sol_bid, sol_ask, _ = await self._fetch_pair_prices()
 
             # Allow individual position monitoring - check each separately
-            eth_available = eth_entry_price > 0 and eth_qty > 0
-            sol_available = sol_entry_price > 0 and sol_qty > 0
+            eth_pnl_pct = self._static_tp_leg_pnl("ETH", eth_bid, eth_ask)
+            sol_pnl_pct = self._static_tp_leg_pnl("SOL", sol_bid, sol_ask)
 
-            if not eth_available and not sol_available:
+            if eth_pnl_pct is None and sol_pnl_pct is None:
                 self.logger.warning("[STATIC TP] No entry data available for either position")
                 return False, "no_entry_data"
 
-            # CRITICAL: Use tracked entry_directions, not derive from quantity sign
-            # entry_quantities stores absolute values (always positive)
-            eth_entry_direction = self.entry_directions.get("ETH", "buy")
-            sol_entry_direction = self.entry_directions.get("SOL", "buy")
-            eth_direction = "long" if eth_entry_direction == "buy" else "short"
-            sol_direction = "long" if sol_entry_direction == "buy" else "short"
-
-            eth_pnl_pct = Decimal("0")
-            sol_pnl_pct = Decimal("0")
-
-            if eth_available:
-                if eth_direction == "long":
-                    eth_pnl_pct = (eth_bid - eth_entry_price) / eth_entry_price
-                else:
-                    eth_pnl_pct = (eth_entry_price - eth_ask) / eth_entry_price
-
-            if sol_available:
-                if sol_direction == "long":
-                    sol_pnl_pct = (sol_bid - sol_entry_price) / sol_entry_price
-                else:
-                    sol_pnl_pct = (sol_entry_price - sol_ask) / sol_entry_price
-
+            eth_direction = "long" if self.entry_directions.get("ETH", "buy") == "buy" else "short"
+            sol_direction = "long" if self.entry_directions.get("SOL", "buy") == "buy" else "short"
             self.logger.info(
-                f"[STATIC TP] ETH: {eth_pnl_pct*100:.2f}% ({eth_direction}, {'active' if eth_available else 'inactive'}), "
-                f"SOL: {sol_pnl_pct*100:.2f}% ({sol_direction}, {'active' if sol_available else 'inactive'}), target: +{tp_threshold_bps}bps"
+                f"[STATIC TP] ETH: {(eth_pnl_pct or 0)*100:.2f}% ({eth_direction}, {'active' if eth_pnl_pct is not None else 'inactive'}), "
+                f"SOL: {(sol_pnl_pct or 0)*100:.2f}% ({sol_direction}, {'active' if sol_pnl_pct is not None else 'inactive'}), target: +{tp_threshold_bps}bps"
             )
 
-            if eth_available and eth_pnl_pct >= tp_threshold:
+            hit = self._static_tp_hit_leg({"ETH": eth_pnl_pct, "SOL": sol_pnl_pct}, tp_threshold)
+            if hit is not None:
+                ticker, pnl_pct = hit
                 self.logger.info(
-                    f"[STATIC TP] ETH TP hit: {eth_pnl_pct*100:.2f}% >= {tp_threshold_bps}bps"
+                    f"[STATIC TP] {ticker} TP hit: {pnl_pct*100:.2f}% >= {tp_threshold_bps}bps"
                 )
-                self._tp_hit_position = "ETH"
-                self._tp_hit_pnl_pct = float(eth_pnl_pct) * 100
-                return True, f"static_tp_eth_{eth_pnl_pct*100:.2f}bps"
+                self._tp_hit_position = ticker
+                self._tp_hit_pnl_pct = float(pnl_pct) * 100
+                return True, f"static_tp_{ticker.lower()}_{pnl_pct*100:.2f}bps"
 
-            if sol_available and sol_pnl_pct >= tp_threshold:
-                self.logger.info(
-                    f"[STATIC TP] SOL TP hit: {sol_pnl_pct*100:.2f}% >= {tp_threshold_bps}bps"
-                )
-                self._tp_hit_position = "SOL"
-                self._tp_hit_pnl_pct = float(sol_pnl_pct) * 100
-                return True, f"static_tp_sol_{sol_pnl_pct*100:.2f}bps"
+            # Re-check every check_interval, or on the BBO tick where either leg hits TP
+            def tp_hit(eth_bbo, sol_bbo) -> bool:
+                pnls = {
+                    "ETH": self._static_tp_leg_pnl("ETH", eth_bbo.bid_price, eth_bbo.ask_price),
+                    "SOL": self._static_tp_leg_pnl("SOL", sol_bbo.bid_price, sol_bbo.ask_price),
+                }
+                return self._static_tp_hit_leg(pnls, tp_threshold) is not None
 
-            await asyncio.sleep(check_interval)
+            await self._wait_for_bbo_condition(tp_hit, check_interval)
 
         self.logger.info(
             f"[STATIC TP] Timeout after {timeout_seconds}s, "
@@ -3024,6 +3109,43 @@ class DNPairBot:
         )
         return False, "static_tp_timeout"
 
+    def _static_tp_leg_pnl(self, ticker: str, bid: Decimal, ask: Decimal) -> Optional[Decimal]:
+        """
+        PnL of one leg at the given BBO, as a fraction of its entry price.
+
+        Long legs exit at the bid, short legs at the ask. Uses the tracked
+        entry_directions, since entry_quantities are absolute values.
+
+        Returns:
+            PnL fraction, or None if the leg has no entry data
+        """
+        entry_price = self.entry_prices.get(ticker) or Decimal("0")
+        entry_qty = self.entry_quantities.get(ticker) or Decimal("0")
+        if entry_price <= 0 or entry_qty <= 0:
+            return None
+        if self.entry_directions.get(ticker, "buy") == "buy":
+            return (bid - entry_price) / entry_price
+        return (entry_price - ask) / entry_price
+
+    @staticmethod
+    def _static_tp_hit_leg(
+        pnls: dict, tp_threshold: Decimal
+    ) -> Optional[Tuple[str, Decimal]]:
+        """
+        First leg (in pnls order) whose PnL reaches the static TP threshold.
+
+        Args:
+            pnls: ticker -> _static_tp_leg_pnl() result
+            tp_threshold: TP threshold as a fraction
+
+        Returns:
+            (ticker, pnl) of the leg that hit TP, or None
+        """
+        for ticker, pnl in pnls.items():
+            if pnl is not None and pnl >= tp_threshold:
+                return ticker, pnl
+        return None
+
     async def _place_tp_orders(self) -> bool:
         """
         Place TP orders for both positions using trigger_client.
@@ -3126,39 +3248,36 @@ class DNPairBot:
             self.logger.warning("[TP] Failed to place TP orders, continuing without TP")
 
     async def _verify_position_closed(self, ticker: str, max_wait_seconds: int = 10) -> bool:
-        """Verify position is actually closed via both REST and WebSocket."""
-        from decimal import Decimal
-        import asyncio
-
+        """Verify position is actually closed: wait on the ledger, REST only as bounded verification."""
         POSITION_TOLERANCE = Decimal("0.001")
-        start_time = time.time()
+        REST_VERIFY_AFTER = 3  # Seconds of waiting on the ledger before one REST check
 
         self.logger.info(f"[VERIFY] Starting position verification for {ticker}")
 
-        while time.time() - start_time < max_wait_seconds:
-            client = self.eth_client if ticker == "ETH" else self.sol_client
-            ws_pos = self._ws_positions.get(ticker, Decimal("0")) if hasattr(self, '_ws_positions') else Decimal("0")
+        client = self.eth_client if ticker == "ETH" else self.sol_client
+        is_flat = flat(POSITION_TOLERANCE)
 
-            # Fast path: trust WS when it already shows flat.
-            if abs(ws_pos) < POSITION_TOLERANCE:
-                self.logger.info(f"[VERIFY] {ticker} confirmed closed via WS={ws_pos}")
-                return True
+        # Fast path: wakes on the fill that flattens the ledger.
+        if await self._ws_positions.wait_for(ticker, is_flat, min(REST_VERIFY_AFTER, max_wait_seconds)):
+            self.logger.info(f"[VERIFY] {ticker} confirmed closed via WS={self._ws_positions[ticker]}")
+            return True
 
-            # Slow path: only use REST as bounded verification, not as the main loop source.
-            elapsed = time.time() - start_time
-            should_verify_rest = elapsed >= max_wait_seconds or elapsed >= 3
-            if should_verify_rest:
-                rest_pos = await client.get_account_positions()
-                self.logger.info(f"[VERIFY] {ticker} - WS={ws_pos}, REST={rest_pos}")
-                if abs(rest_pos) < POSITION_TOLERANCE:
-                    if hasattr(self, '_ws_positions'):
-                        self._ws_positions[ticker] = Decimal("0")
-                    self.logger.info(f"[VERIFY] {ticker} confirmed closed via REST fallback; syncing WS to 0")
-                    return True
+        # Slow path: one REST check, in case the ledger missed the closing fill.
+        ws_pos = self._ws_positions[ticker]
+        rest_pos = await client.get_account_positions()
+        self.logger.info(f"[VERIFY] {ticker} - WS={ws_pos}, REST={rest_pos}")
+        if abs(rest_pos) < POSITION_TOLERANCE:
+            self._position_ledgers[ticker].set_position(Decimal("0"), "rest_reset")
+            self.logger.info(f"[VERIFY] {ticker} confirmed closed via REST fallback; syncing WS to 0")
+            return True
 
-            await asyncio.sleep(1)
+        remaining = max_wait_seconds - REST_VERIFY_AFTER
+        if remaining > 0 and await self._ws_positions.wait_for(ticker, is_flat, remaining):
+            self.logger.info(f"[VERIFY] {ticker} confirmed closed via WS={self._ws_positions[ticker]}")
+            return True
 
         # CRITICAL: Position not closed after timeout
+        ws_pos = self._ws_positions[ticker]
         rest_pos = await client.get_account_positions()
         self.logger.critical(f"[VERIFY] CRITICAL: {ticker} NOT CLOSED after {max_wait_seconds}s - WS={ws_pos}, REST={rest_pos}")
         return False
@@ -3324,26 +3443,13 @@ class DNPairBot:
         Returns:
             True if all positions closed, False if error occurred
         """
-        from decimal import Decimal
-
         POSITION_TOLERANCE = Decimal("0.001")
 
         remaining_ticker = "SOL" if closed_position == "ETH" else "ETH"
-        remaining_client = self.eth_client if remaining_ticker == "ETH" else self.sol_client
-
-        # Use WebSocket positions if available (more accurate, no settlement lag)
-        if hasattr(self, '_ws_positions') and remaining_ticker in self._ws_positions:
-            ws_pos = self._ws_positions[remaining_ticker]
-            # Also check REST as backup
-            rest_pos = await remaining_client.get_account_positions()
-            self.logger.info(f"[CLOSE] {remaining_ticker} position check - WS={ws_pos}, REST={rest_pos}")
 
-            # Use WebSocket position (more accurate)
-            remaining_pos = ws_pos
-        else:
-            # Fallback to REST only
-            remaining_pos = await remaining_client.get_account_positions()
-            self.logger.info(f"[CLOSE] {remaining_ticker} position check (REST only) - {remaining_pos}")
+        # Ledger position (fills + bridged results, REST-reconciled in the background)
+        remaining_pos = self._ws_positions[remaining_ticker]
+        self.logger.info(f"[CLOSE] {remaining_ticker} position check - WS={remaining_pos}")
 
         if abs(remaining_pos) < POSITION_TOLERANCE:
             self.logger.info(f"[CLOSE] No remaining {remaining_ticker} position")
@@ -3474,9 +3580,9 @@ class DNPairBot:
         if queue_size is None or queue_size == 0:
             return False, Decimal('0'), f"No {side} liquidity"
 
-        # Calculate average queue size (top 5 levels)
-        total_liquidity = handler.get_available_liquidity(side, max_depth=5)
-        avg_queue_size = total_liquidity / 5 if total_liquidity > 0 else Decimal('0')
+        # Calculate average queue size (top levels, maintained per book update)
+        total_liquidity = handler.get_top_depth(side)
+        avg_queue_size = total_liquidity / handler.FEATURE_LEVELS if total_liquidity > 0 else Decimal('0')
 
         # Check if current queue is too deep
         if avg_queue_size > 0:
@@ -3545,9 +3651,7 @@ class DNPairBot:
                 f"[VERIFY] {ticker} REST is flat but WS still shows {ws_pos}. "
                 f"Treating WS as stale for close verification."
             )
-            if not hasattr(self, '_ws_positions'):
-                self._ws_positions = {"ETH": Decimal("0"), "SOL": Decimal("0")}
-            self._ws_positions[ticker] = Decimal("0")
+            self._position_ledgers[ticker].set_position(Decimal("0"), "rest_reset")
             return Decimal("0")
         return ws_pos
 
@@ -3676,8 +3780,13 @@ class DNPairBot:
             return False
 
         # SPREAD FILTER: Check if spread is profitable
-        eth_bid, eth_ask = await self.eth_client.fetch_bbo_prices(self.eth_client.config.contract_id)
-        sol_bid, sol_ask = await self.sol_client.fetch_bbo_prices(self.sol_client.config.contract_id)
+        eth_bid, eth_ask, sol_bid, sol_ask, skew_ms = await self._fetch_pair_prices()
+
+        if self._leg_skew_exceeded(skew_ms):
+            reason = f"LEG_SKEW: {skew_ms:.0f}ms > {self.max_leg_skew_ms}ms"
+            self.logger.warning(f"[BUILD] {reason}")
+            self._log_skipped_cycle(reason)
+            return False
 
         is_profitable, spread_info = self._check_spread_profitability(eth_bid, eth_ask, sol_bid, sol_ask)
 
@@ -3854,10 +3963,10 @@ class DNPairBot:
                         self.logger.error(f"[CSV] Error logging spread analysis: {e}")
                     return True
 
-                # Check positions for logging only (may show 0.0 before settlement)
-                eth_pos = await self.eth_client.get_account_positions()
-                sol_pos = await self.sol_client.get_account_positions()
-                self.logger.info(f"[BUILD] Current positions (may lag): ETH={eth_pos}, SOL={sol_pos}")
+                # Ledger positions for logging (no REST round-trip on the retry path)
+                eth_pos = self._position_ledgers["ETH"].position
+                sol_pos = self._position_ledgers["SOL"].position
+                self.logger.info(f"[BUILD] Current positions (ledger): ETH={eth_pos}, SOL={sol_pos}")
 
                 # Retry missing sides with filter bypass on 3rd attempt
                 bypass_filter = (attempt >= 2)
@@ -4069,8 +4178,7 @@ class DNPairBot:
         self._had_safety_stop = exit_reason.startswith("stop_loss_")
 
         # Get exit spread information for analysis
-        eth_bid, eth_ask = await self.eth_client.fetch_bbo_prices(self.eth_client.config.contract_id)
-        sol_bid, sol_ask = await self.sol_client.fetch_bbo_prices(self.sol_client.config.contract_id)
+        eth_bid, eth_ask, sol_bid, sol_ask, _ = await self._fetch_pair_prices()
         _, exit_spread_info = self._check_spread_profitability(eth_bid, eth_ask, sol_bid, sol_ask)
         self._exit_spread_info = exit_spread_info
 
@@ -4211,10 +4319,10 @@ class DNPairBot:
                     f"retry_eth={retry_eth}, retry_sol={retry_sol}"
                 )
 
-                # Log positions for reference (may lag actual fills)
-                eth_pos = await self.eth_client.get_account_positions()
-                sol_pos = await self.sol_client.get_account_positions()
-                self.logger.info(f"[UNWIND] Current positions (may lag): ETH={eth_pos}, SOL={sol_pos}")
+                # Ledger positions for reference (no REST round-trip on the retry path)
+                eth_pos = self._position_ledgers["ETH"].position
+                sol_pos = self._position_ledgers["SOL"].position
+                self.logger.info(f"[UNWIND] Current positions (ledger): ETH={eth_pos}, SOL={sol_pos}")
 
                 if not retry_eth and not retry_sol:
                     self.logger.info("[UNWIND] Both positions now closed, no retry needed")
@@ -4386,15 +4494,14 @@ class DNPairBot:
                     await self._log_realtime_pnl()
 
                     # Check for position imbalance using WebSocket data
-                    if hasattr(self, '_ws_positions'):
-                        eth_pos = abs(self._ws_positions.get("ETH", Decimal("0")))
-                        sol_pos = abs(self._ws_positions.get("SOL", Decimal("0")))
-                        if sol_pos > 0:
-                            ratio = float(eth_pos / sol_pos)
-                            if ratio > 1.5 or ratio < 0.67:  # More than 50% imbalance
-                                self.logger.warning(
-                                    f"[POSITION IMBALANCE] ETH={eth_pos}, SOL={sol_pos}, ratio={ratio:.2f}"
-                                )
+                    eth_pos = abs(self._ws_positions.get("ETH", Decimal("0")))
+                    sol_pos = abs(self._ws_positions.get("SOL", Decimal("0")))
+                    if sol_pos > 0:
+                        ratio = float(eth_pos / sol_pos)
+                        if ratio > 1.5 or ratio < 0.67:  # More than 50% imbalance
+                            self.logger.warning(
+                                f"[POSITION IMBALANCE] ETH={eth_pos}, SOL={sol_pos}, ratio={ratio:.2f}"
+                            )
 
                     elapsed += sleep_interval
 
@@ -4448,15 +4555,14 @@ class DNPairBot:
                     await self._log_realtime_pnl()
 
                     # Check for position imbalance using WebSocket data
-                    if hasattr(self, '_ws_positions'):
-                        eth_pos = abs(self._ws_positions.get("ETH", Decimal("0")))
-                        sol_pos = abs(self._ws_positions.get("SOL", Decimal("0")))
-                        if sol_pos > 0:
-                            ratio = float(eth_pos / sol_pos)
-                            if ratio > 1.5 or ratio < 0.67:  # More than 50% imbalance
-                                self.logger.warning(
-                                    f"[POSITION IMBALANCE] ETH={eth_pos}, SOL={sol_pos}, ratio={ratio:.2f}"
-                                )
+                    eth_pos = abs(self._ws_positions.get("ETH", Decimal("0")))
+                    sol_pos = abs(self._ws_positions.get("SOL", Decimal("0")))
+                    if sol_pos > 0:
+                        ratio = float(eth_pos / sol_pos)
+                        if ratio > 1.5 or ratio < 0.67:  # More than 50% imbalance
+                            self.logger.warning(
+                                f"[POSITION IMBALANCE] ETH={eth_pos}, SOL={sol_pos}, ratio={ratio:.2f}"
+                            )
 
                     elapsed += sleep_interval
 
@@ -4520,15 +4626,14 @@ class DNPairBot:
                     await self._log_realtime_pnl()
 
                     # Check for position imbalance using WebSocket data
-                    if hasattr(self, '_ws_positions'):
-                        eth_pos = abs(self._ws_positions.get("ETH", Decimal("0")))
-                        sol_pos = abs(self._ws_positions.get("SOL", Decimal("0")))
-                        if sol_pos > 0:
-                            ratio = float(eth_pos / sol_pos)
-                            if ratio > 1.5 or ratio < 0.67:  # More than 50% imbalance
-                                self.logger.warning(
-                                    f"[POSITION IMBALANCE] ETH={eth_pos}, SOL={sol_pos}, ratio={ratio:.2f}"
-                                )
+                    eth_pos = abs(self._ws_positions.get("ETH", Decimal("0")))
+                    sol_pos = abs(self._ws_positions.get("SOL", Decimal("0")))
+                    if sol_pos > 0:
+                        ratio = float(eth_pos / sol_pos)
+                        if ratio > 1.5 or ratio < 0.67:  # More than 50% imbalance
+                            self.logger.warning(
+                                f"[POSITION IMBALANCE] ETH={eth_pos}, SOL={sol_pos}, ratio={ratio:.2f}"
+                            )
 
                     elapsed += sleep_interval
 
@@ -4691,6 +4796,12 @@ class DNPairBot:
             f"[INIT] SOL client initialized (contract: {self.sol_contract_id}, tick: {self.sol_tick_size}, ws: {self.sol_client._ws_connected})"
         )
 
+        for ticker, client in (("ETH", self.eth_client), ("SOL", self.sol_client)):
+            ledger = self._position_ledgers[ticker]
+            ledger.product_id = client.config.contract_id
+            ledger.subaccount = getattr(client, 'subaccount_hex', None)
+            ledger.logger = self.logger
+
         # Subscribe to position changes for real-time monitoring
         from hedge.exchanges.nado import WEBSOCKET_AVAILABLE
 
@@ -4749,6 +4860,67 @@ class DNPairBot:
         else:
             self.logger.info("[INIT] WebSocket not available - position_change streaming disabled")
 
+        if self.book_snapshot_dir:
+            await self._start_book_snapshots()
+
+    async def _start_position_reconciler(self):
+        """Start background REST reconciliation of the position ledgers."""
+        if self.position_reconcile_interval_s <= 0 or self._position_reconciler is not None:
+            return
+        self._position_reconciler = PositionReconciler(
+            {
+                "ETH": (self._position_ledgers["ETH"], self.eth_client.get_account_positions),
+                "SOL": (self._position_ledgers["SOL"], self.sol_client.get_account_positions),
+            },
+            interval_s=self.position_reconcile_interval_s,
+            on_drift=self._on_position_drift,
+            logger=self.logger,
+        )
+        await self._position_reconciler.start()
+        self.logger.info(f"[INIT] Position reconciliation every {self.position_reconcile_interval_s}s")
+
+    def _on_position_drift(self, ticker: str, ledger_position: Decimal, rest_position: Decimal) -> None:
+        """Alert on a confirmed ledger/REST drift (the ledger has adopted REST)."""
+        self.logger.warning(
+            f"[DRIFT] {ticker} ledger drifted from REST: ledger={ledger_position}, REST={rest_position}. "
+            f"Adopted REST position"
+        )
+        self.log_position_update(
+            ticker=ticker,
+            old_position=ledger_position,
+            new_position=rest_position,
+            cycle_id=str(self.iteration) if hasattr(self, 'iteration') else "",
+            source="rest_reconciliation",
+            price=None
+        )
+
+    async def _start_book_snapshots(self):
+        """Start writing ETH/SOL top-of-book snapshots to book_snapshot_dir (optional pyarrow)."""
+        handlers = [
+            handler for handler in (self.eth_client.get_bookdepth_handler(), self.sol_client.get_bookdepth_handler())
+            if handler is not None
+        ]
+        if not handlers:
+            self.logger.warning("[INIT] Book snapshots disabled: no WebSocket BookDepth handlers")
+            return
+
+        try:
+            from hedge.exchanges.nado_book_snapshot_sink import BookSnapshotSink
+
+            self._book_snapshot_sink = BookSnapshotSink(
+                handlers,
+                self.book_snapshot_dir,
+                interval_s=self.book_snapshot_interval_ms / 1000,
+            )
+        except ImportError as e:
+            self.logger.warning(f"[INIT] Book snapshots disabled: {e}")
+            return
+
+        await self._book_snapshot_sink.start()
+        self.logger.info(
+            f"[INIT] Book snapshots every {self.book_snapshot_interval_ms}ms -> {self.book_snapshot_dir}"
+        )
+
 
 
 
@@ -4879,6 +5051,40 @@ Examples:
         default=60,
         help='Max wait time for TP hit before fallback in seconds (default: 60)'
     )
+    parser.add_argument(
+        '--max-leg-skew-ms',
+        type=float,
+        default=None,
+        help='Skip entry decisions when ETH and SOL quotes are further apart in ms; '
+             'with live streams this is the difference of the legs\' feed lag, so a quiet leg '
+             'does not count (default: no limit)'
+    )
+
+    # Research dataset
+    parser.add_argument(
+        '--book-snapshot-dir',
+        type=str,
+        default=None,
+        help='Write periodic top-of-book snapshots as Parquet under this directory (requires pyarrow)'
+    )
+    parser.add_argument(
+        '--book-snapshot-interval-ms',
+        type=int,
+        default=250,
+        help='Book snapshot interval in ms (default: 250)'
+    )
+    parser.add_argument(
+        '--fill-dedupe-horizon',
+        type=float,
+        default=3600.0,
+        help='Seconds fill events are remembered for deduplication (default: 3600)'
+    )
+    parser.add_argument(
+        '--position-reconcile-interval',
+        type=float,
+        default=30.0,
+        help='Seconds between background REST position reconciliations, 0 to disable (default: 30)'
+    )
 
     return parser.parse_args()
 
@@ -4917,6 +5123,11 @@ async def main():
         enable_static_tp=getattr(args, 'enable_static_tp', False),
         tp_bps=getattr(args, 'tp_bps', 10.0),
         tp_timeout=getattr(args, 'tp_timeout', 60),
+        max_leg_skew_ms=getattr(args, 'max_leg_skew_ms', None),
+        book_snapshot_dir=getattr(args, 'book_snapshot_dir', None),
+        book_snapshot_interval_ms=getattr(args, 'book_snapshot_interval_ms', 250),
+        fill_dedupe_horizon_s=getattr(args, 'fill_dedupe_horizon', 3600.0),
+        position_reconcile_interval_s=getattr(args, 'position_reconcile_interval', 30.0),
     )
 
     # Initialize clients
@@ -4932,6 +5143,9 @@ async def main():
     # Check for residual positions using WebSocket priority
     await bot._check_residual_positions_at_startup()
 
+    # Positions are read from the ledgers from here on; REST only reconciles in the background
+    await bot._start_position_reconciler()
+
     # Run alternating strategy
     await bot.run_alternating_strategy()
 
@@ -25,7 +25,8 @@ from helpers.logger import TradingLogger
 # WebSocket imports (optional - only if available)
 try:
     from .nado_websocket_client import NadoWebSocketClient
-    from .nado_bbo_handler import BBOHandler
+    from .nado_websocket_hub import NadoWebSocketHub
+    from .nado_bbo_handler import BBOData, BBOHandler
     from .nado_bookdepth_handler import BookDepthHandler
     from .nado_fill_handler import FillHandler
     WEBSOCKET_AVAILABLE = True
@@ -34,6 +35,8 @@ try:
 except ImportError as e:
     WEBSOCKET_AVAILABLE = False
     NadoWebSocketClient = None
+    NadoWebSocketHub = None
+    BBOData = None
     BBOHandler = None
     BookDepthHandler = None
     FillHandler = None
@@ -46,6 +49,11 @@ except ImportError as e:
 class NadoClient(BaseExchangeClient):
     """Nado exchange client implementation."""
 
+    # Order fill waits: REST reconciliation cadence while a WebSocket fill
+    # future is pending, and REST polling cadence without one (seconds)
+    FILL_RECONCILE_INTERVAL = 2.0
+    REST_POLL_INTERVAL = 0.1
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize Nado client."""
         super().__init__(config)
@@ -192,10 +200,12 @@ class NadoClient(BaseExchangeClient):
         product_id = self._get_product_id_from_contract(self.config.ticker)
         self.logger.log(f"WebSocket: Creating client for {self.config.ticker} (product_id={product_id})", "INFO")
 
-        # Create WebSocket client (with credentials for private stream authentication)
-        self._ws_client = NadoWebSocketClient(
+        # Acquire the process-wide shared WebSocket connection (one socket per
+        # endpoint and account for all NadoClients; credentials used for private stream auth)
+        self.logger.log(f"WebSocket: Acquiring shared connection for {self.config.ticker}...", "INFO")
+        self._ws_client = await NadoWebSocketHub.acquire(
             product_ids=[product_id],
-            auto_reconnect=True,
+            logger=self.logger.logger,
             private_key=self.private_key,
             owner=self.owner,
             subaccount_name=self.subaccount_name
@@ -212,7 +222,8 @@ class NadoClient(BaseExchangeClient):
         self._bookdepth_handler = BookDepthHandler(
             product_id=product_id,
             ws_client=self._ws_client,
-            logger=self.logger.logger  # Use internal logger
+            logger=self.logger.logger,  # Use internal logger
+            snapshot_fetcher=lambda: self._fetch_book_snapshot(product_id)
         )
 
         # Create Fill handler for real-time fill detection
@@ -223,10 +234,7 @@ class NadoClient(BaseExchangeClient):
             logger=self.logger.logger
         )
 
-        # Connect and subscribe
-        self.logger.log(f"WebSocket: Connecting to server for {self.config.ticker}...", "INFO")
-        await self._ws_client.connect()
-
+        # Subscribe (connection is already open via the hub)
         self.logger.log(f"WebSocket: Starting BBO handler for {self.config.ticker}...", "INFO")
         await self._bbo_handler.start()
 
@@ -241,10 +249,13 @@ class NadoClient(BaseExchangeClient):
 
     async def disconnect(self) -> None:
         """Disconnect from Nado."""
-        # Disconnect WebSocket if connected
+        # Stop this client's streams and release the shared WebSocket
         if self._ws_connected and self._ws_client:
             try:
-                await self._ws_client.disconnect()
+                for handler in (self._bbo_handler, self._bookdepth_handler, self._fill_handler):
+                    if handler is not None:
+                        await handler.stop()
+                await NadoWebSocketHub.release(self._ws_client)
                 self._ws_connected = False
                 self.logger.log("WebSocket disconnected", "INFO")
             except Exception as e:
@@ -275,8 +286,8 @@ class NadoClient(BaseExchangeClient):
 
         Uses WebSocket BBO if available, otherwise falls back to REST API.
         """
-        # Try WebSocket first (real-time, no rate limit)
-        if self._ws_connected and self._bbo_handler:
+        # Try WebSocket first (real-time, no rate limit); a stale feed falls through to REST
+        if self._ws_connected and self._bbo_handler and not self._bbo_handler.is_stale():
             bid_price, ask_price = self._bbo_handler.get_prices()
             if bid_price is not None and bid_price > 0 and ask_price is not None and ask_price > 0:
                 # Got valid data from WebSocket
@@ -310,17 +321,58 @@ class NadoClient(BaseExchangeClient):
             self.logger.log(f"Error fetching BBO prices: {e}", "ERROR")
             return Decimal(0), Decimal(0)
 
+    async def _fetch_book_snapshot(self, product_id: int, depth: int = 100) -> Tuple[int, list, list]:
+        """
+        Fetch a REST order book snapshot for BookDepthHandler resyncs.
+
+        Returns:
+            (timestamp in ns, [(price, qty), ...] bids, [(price, qty), ...] asks)
+        """
+        ticker_id = self._get_ticker_id(product_id)
+        # Blocking SDK call; run off the event loop so stream reading continues
+        order_book = await asyncio.to_thread(
+            self.client.context.engine_client.get_orderbook, ticker_id=ticker_id, depth=depth
+        )
+
+        # The v2 orderbook endpoint reports milliseconds; BookDepth uses nanoseconds
+        timestamp = int(order_book.timestamp)
+        if timestamp < 10 ** 15:
+            timestamp *= 1_000_000
+
+        bids = [(Decimal(str(price)), Decimal(str(qty))) for price, qty in order_book.bids]
+        asks = [(Decimal(str(price)), Decimal(str(qty))) for price, qty in order_book.asks]
+        return timestamp, bids, asks
+
     def get_bookdepth_handler(self) -> Optional['BookDepthHandler']:
-        """Get the BookDepth handler for this client (if WebSocket is connected)."""
-        return self._bookdepth_handler if self._ws_connected else None
+        """Get the BookDepth handler for this client (if WebSocket is connected and its data is fresh)."""
+        if not self._ws_connected or self._bookdepth_handler is None or self._bookdepth_handler.is_stale():
+            return None
+        return self._bookdepth_handler
 
     def get_bbo_handler(self) -> Optional['BBOHandler']:
-        """Get the BBO handler for this client (if WebSocket is connected).
+        """Get the BBO handler for this client (if WebSocket is connected and its data is fresh).
 
         Returns:
-            BBOHandler instance if WebSocket is connected, None otherwise
+            BBOHandler instance if WebSocket is connected and BBO is not stale, None otherwise
         """
-        return self._bbo_handler if self._ws_connected else None
+        if not self._ws_connected or self._bbo_handler is None or self._bbo_handler.is_stale():
+            return None
+        return self._bbo_handler
+
+    def get_bbo_snapshot(self) -> Optional['BBOData']:
+        """
+        Get the latest WebSocket BBO snapshot (prices and spread/momentum state of one tick).
+
+        Returns:
+            Immutable BBOData, or None without fresh BBO data
+        """
+        handler = self.get_bbo_handler()
+        if handler is None:
+            return None
+        bbo = handler.get_latest_bbo()
+        if bbo is None or bbo.bid_price <= 0 or bbo.ask_price <= 0:
+            return None
+        return bbo
 
     def has_ws_market_data(self) -> bool:
         """Return True when WS is connected and both BBO + BookDepth are warm."""
@@ -401,6 +453,19 @@ class NadoClient(BaseExchangeClient):
 
         return handler.get_available_liquidity(side, max_depth)
 
+    def get_book_features(self) -> Optional[Dict]:
+        """
+        Get top-of-book features (depth, imbalance, microprice, band notionals).
+
+        Returns:
+            Feature dict from BookDepthHandler.get_features(), or None without
+            fresh BookDepth data
+        """
+        handler = self.get_bookdepth_handler()
+        if handler is None:
+            return None
+        return handler.get_features()
+
     def _get_product_id_from_contract(self, contract_id: str) -> int:
         """Convert contract_id (ticker) to product_id."""
         # Try to parse as int first
@@ -820,24 +885,25 @@ class NadoClient(BaseExchangeClient):
 
                 order_id = order_result.order_id
 
-                # Track order so WS fill messages can resolve fills without
+                # Track order so the WS fill that completes it wakes us without
                 # waiting for REST polling lag.
+                fill_future = None
                 if self._ws_connected and self._fill_handler and order_id:
                     try:
-                        self._fill_handler.track_order(order_id, remaining_quantity)
+                        fill_future = self._fill_handler.track_order(order_id, remaining_quantity)
                     except Exception as e:
                         self.logger.log(f"Fill handler track_order failed: {e}", "WARNING")
 
-                # Step 5: Poll for fill using helper
-                poll_result = await self._poll_until_fill_or_timeout(order_id, timeout_seconds)
+                # Step 5: Wait for fill using helper
+                poll_result = await self._poll_until_fill_or_timeout(order_id, timeout_seconds, fill_future)
 
                 # Track fills
                 attempt_filled_size = poll_result['filled_size']
                 cumulative_filled_size += attempt_filled_size
 
-                # Calculate fill value for average price
+                # Calculate fill value for average price (fill-stream VWAP when known)
                 if attempt_filled_size > 0:
-                    cumulative_fill_value += attempt_filled_size * price
+                    cumulative_fill_value += attempt_filled_size * self._get_fill_vwap(order_id, poll_result, price)
 
                 # Step 6: Handle partial fills - retry with remaining quantity
                 if poll_result['status'] == 'FILLED':
@@ -932,85 +998,146 @@ class NadoClient(BaseExchangeClient):
     async def _poll_until_fill_or_timeout(
         self,
         order_id: str,
-        timeout_seconds: int
+        timeout_seconds: int,
+        fill_future: Optional['FillFuture'] = None
     ) -> dict:
-        """Poll order status until filled or timeout.
+        """Wait for an order to fill, or cancel it on timeout.
+
+        With a WebSocket fill future the wait is event-driven and REST
+        get_order_info only runs as a reconciliation safety net every
+        FILL_RECONCILE_INTERVAL seconds (every REST_POLL_INTERVAL while the
+        fill stream is not live: socket dropped, dead or silent). Without one,
+        REST is polled every REST_POLL_INTERVAL.
 
         Args:
             order_id: Order ID to poll
             timeout_seconds: Maximum time to wait for fill
+            fill_future: FillHandler.track_order() result for this order
 
         Returns:
             dict with:
                 - 'status': 'FILLED', 'TIMEOUT', 'CANCELED', or 'ERROR'
                 - 'filled_size': Decimal filled quantity
+                - 'avg_price': Decimal VWAP when filled via WebSocket (optional)
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         polling_retries = 0
+        fill_waiter = asyncio.ensure_future(fill_future) if fill_future is not None else None
+
+        try:
+            while True:
+                # Wait for the WS fill event, reconciling over REST at the slow cadence
+                if fill_waiter is not None:
+                    remaining = timeout_seconds - (loop.time() - start_time)
+                    if not fill_waiter.done() and remaining > 0:
+                        await self._wait_fill_or_reconcile(fill_waiter, remaining)
+
+                if fill_waiter is not None and fill_waiter.done():
+                    fill_info = fill_waiter.result()
+                    if fill_info is not None and fill_info['filled_quantity'] > 0:
+                        self.logger.log(f"Order {order_id} filled via WebSocket fill stream", "INFO")
+                        return {
+                            'status': 'FILLED',
+                            'filled_size': fill_info['filled_quantity'],
+                            'avg_price': fill_info['price'],
+                        }
+                    # No longer tracked: REST decides from here
+                    fill_waiter = None
 
-        while True:
-            # Prefer real-time fill stream when available.
-            if self._ws_connected and self._fill_handler:
                 try:
-                    fill_info = self._fill_handler.get_fill_info(order_id)
-                    if fill_info is not None:
-                        filled = fill_info.get('filled_quantity', Decimal('0'))
-                        if filled > 0:
-                            self.logger.log(f"Order {order_id} filled via WebSocket fill stream", "INFO")
-                            return {'status': 'FILLED', 'filled_size': filled}
-                except Exception as e:
-                    self.logger.log(f"Fill stream lookup error for order {order_id}: {e}", "WARN")
+                    order_info = await self.get_order_info(order_id)
 
-            try:
-                order_info = await self.get_order_info(order_id)
+                    if order_info is None:
+                        # Order not found, might be canceled or too old
+                        self.logger.log(f"Order {order_id} not found (may be canceled)", "WARN")
+                        return {'status': 'CANCELED', 'filled_size': Decimal('0')}
 
-                if order_info is None:
-                    # Order not found, might be canceled or too old
-                    self.logger.log(f"Order {order_id} not found (may be canceled)", "WARN")
-                    return {'status': 'CANCELED', 'filled_size': Decimal('0')}
+                    # Check if fully filled
+                    if order_info.remaining_size == 0:
+                        self.logger.log(f"Order {order_id} fully filled", "INFO")
+                        return {'status': 'FILLED', 'filled_size': order_info.filled_size}
 
-                # Check if fully filled
-                if order_info.remaining_size == 0:
-                    self.logger.log(f"Order {order_id} fully filled", "INFO")
-                    return {'status': 'FILLED', 'filled_size': order_info.filled_size}
+                    # Check if canceled/expired
+                    if order_info.status in ('CANCELLED', 'EXPIRED', 'CANCELED'):
+                        self.logger.log(f"Order {order_id} status: {order_info.status}", "INFO")
+                        return {'status': 'CANCELED', 'filled_size': order_info.filled_size}
 
-                # Check if canceled/expired
-                if order_info.status in ('CANCELLED', 'EXPIRED', 'CANCELED'):
-                    self.logger.log(f"Order {order_id} status: {order_info.status}", "INFO")
-                    return {'status': 'CANCELED', 'filled_size': order_info.filled_size}
+                except Exception as e:
+                    self.logger.log(f"Polling error for order {order_id}: {e}", "WARN")
+                    polling_retries += 1
+                    if polling_retries >= 3:
+                        # Too many polling errors, cancel order
+                        self.logger.log(f"Too many polling errors for order {order_id}, canceling", "ERROR")
+                        try:
+                            await self.cancel_order(order_id)
+                        except:
+                            pass
+                        return {'status': 'ERROR', 'filled_size': Decimal('0')}
+
+                # Check timeout
+                elapsed = loop.time() - start_time
+                if elapsed >= timeout_seconds:
+                    return await self._cancel_unfilled_order(order_id, elapsed)
+
+                if fill_waiter is None:
+                    await asyncio.sleep(self.REST_POLL_INTERVAL)  # Poll every 0.1s
+        finally:
+            if fill_waiter is not None and not fill_waiter.done():
+                fill_waiter.cancel()
+            if fill_future is not None and self._fill_handler is not None:
+                self._fill_handler.untrack_order(order_id)
+
+    def _fill_stream_live(self) -> bool:
+        """True while the WebSocket fill stream can be relied on to report fills."""
+        return (
+            self._ws_client is not None
+            and self._fill_handler is not None
+            and self._ws_client.is_stream_live("fill", self._fill_handler.product_id)
+        )
 
-            except Exception as e:
-                self.logger.log(f"Polling error for order {order_id}: {e}", "WARN")
-                polling_retries += 1
-                if polling_retries >= 3:
-                    # Too many polling errors, cancel order
-                    self.logger.log(f"Too many polling errors for order {order_id}, canceling", "ERROR")
-                    try:
-                        await self.cancel_order(order_id)
-                    except:
-                        pass
-                    return {'status': 'ERROR', 'filled_size': Decimal('0')}
-                await asyncio.sleep(0.1)
-
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout_seconds:
-                # Cancel order on timeout
-                self.logger.log(f"Order {order_id} timeout after {elapsed:.1f}s, canceling", "INFO")
-                try:
-                    await self.cancel_order(order_id)
-                except:
-                    pass  # Already canceled
-                # Get final status
-                try:
-                    final_info = await self.get_order_info(order_id)
-                    filled = final_info.filled_size if final_info else Decimal('0')
-                    self.logger.log(f"Order {order_id} timed out with partial fill: {filled}", "INFO")
-                    return {'status': 'TIMEOUT', 'filled_size': filled}
-                except:
-                    return {'status': 'TIMEOUT', 'filled_size': Decimal('0')}
+    async def _wait_fill_or_reconcile(self, fill_waiter: asyncio.Future, timeout: float) -> None:
+        """
+        Wait on a fill future until it resolves or REST reconciliation is due.
 
-            await asyncio.sleep(0.1)  # Poll every 0.1s
+        Reconciliation is due after FILL_RECONCILE_INTERVAL seconds while the
+        fill stream is live, and within REST_POLL_INTERVAL once it is not;
+        liveness is re-checked every REST_POLL_INTERVAL.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(self.FILL_RECONCILE_INTERVAL, timeout)
+        while not fill_waiter.done():
+            step = min(self.REST_POLL_INTERVAL, deadline - loop.time())
+            if step <= 0:
+                return
+            await asyncio.wait({fill_waiter}, timeout=step)
+            if not self._fill_stream_live():
+                return
+
+    def _get_fill_vwap(self, order_id: str, poll_result: dict, limit_price: Decimal) -> Decimal:
+        """Average fill price of an order: WS fill ledger VWAP, else its limit price."""
+        avg_price = poll_result.get('avg_price')
+        if not avg_price and self._fill_handler is not None:
+            fills = self._fill_handler.get_order_fills(order_id)
+            if fills is not None and fills.filled_quantity > 0:
+                avg_price = fills.vwap
+        return avg_price or limit_price
+
+    async def _cancel_unfilled_order(self, order_id: str, elapsed: float) -> dict:
+        """Cancel an order that timed out and report how much of it filled."""
+        self.logger.log(f"Order {order_id} timeout after {elapsed:.1f}s, canceling", "INFO")
+        try:
+            await self.cancel_order(order_id)
+        except:
+            pass  # Already canceled
+        # Get final status
+        try:
+            final_info = await self.get_order_info(order_id)
+            filled = final_info.filled_size if final_info else Decimal('0')
+            self.logger.log(f"Order {order_id} timed out with partial fill: {filled}", "INFO")
+            return {'status': 'TIMEOUT', 'filled_size': filled}
+        except:
+            return {'status': 'TIMEOUT', 'filled_size': Decimal('0')}
 
     async def place_ioc_order(self, contract_id: str, quantity: Decimal, direction: str) -> OrderResult:
         """Place an IOC (Immediate-Or-Cancel) order for immediate execution.
@@ -1027,7 +1154,13 @@ class NadoClient(BaseExchangeClient):
 
         while retry_count < max_retries:
             try:
-                best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
+                # Prices and spread state from one WebSocket tick; REST prices otherwise
+                spread_state = None
+                bbo = self.get_bbo_snapshot()
+                if bbo is not None:
+                    best_bid, best_ask, spread_state = bbo.bid_price, bbo.ask_price, bbo.spread_state
+                else:
+                    best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
 
                 if best_bid <= 0 or best_ask <= 0:
                     return OrderResult(success=False, error_message='Invalid bid/ask prices')
@@ -1038,15 +1171,10 @@ class NadoClient(BaseExchangeClient):
 
                 # Volatility-regime-based slippage tolerance
                 slippage_bps = 1
-                try:
-                    if hasattr(self, 'get_bbo_handler') and self.get_bbo_handler():
-                        spread_state = self.get_bbo_handler().get_spread_state()
-                        if spread_state == "WIDENING":
-                            slippage_bps = 2
-                        elif spread_state == "NARROWING":
-                            slippage_bps = 0.5
-                except Exception as e:
-                    self.logger.debug(f"[IOC] Using default slippage: {e}")
+                if spread_state == "WIDENING":
+                    slippage_bps = 2
+                elif spread_state == "NARROWING":
+                    slippage_bps = 0.5
 
                 # Progressive price improvement on retry
                 retry_improvement_bps = retry_count * 2  # 0, 2, 4 bps
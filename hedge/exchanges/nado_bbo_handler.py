@@ -7,16 +7,29 @@ Provides spread monitoring, momentum detection, and fair value calculation.
 
 import asyncio
 import logging
+import math
 from collections import deque
-from decimal import Decimal
-from statistics import mean
-from typing import Dict, Optional, Tuple, List
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal
+from typing import Callable, Dict, Optional, Tuple, List
 
+from .nado_message_decoder import x18_to_decimal
 from .nado_websocket_client import NadoWebSocketClient
 
 
 class BBOData:
-    """Container for BBO data."""
+    """
+    Immutable BBO snapshot.
+
+    Derived fields (spread, mid_price, spread_bps) are computed once at
+    construction. BBOHandler publishes each tick as a new snapshot by swapping
+    one reference, so a reader holding a snapshot always sees prices and
+    analyzer states from the same tick.
+    """
+
+    __slots__ = (
+        "product_id", "bid_price", "bid_qty", "ask_price", "ask_qty", "timestamp",
+        "spread", "mid_price", "spread_bps", "spread_state", "momentum",
+    )
 
     def __init__(
         self,
@@ -25,36 +38,154 @@ class BBOData:
         bid_qty: Decimal,
         ask_price: Decimal,
         ask_qty: Decimal,
-        timestamp: int
+        timestamp: int,
+        spread_state: str = "STABLE",
+        momentum: str = "NEUTRAL"
     ):
-        self.product_id = product_id
-        self.bid_price = bid_price
-        self.bid_qty = bid_qty
-        self.ask_price = ask_price
-        self.ask_qty = ask_qty
-        self.timestamp = timestamp
+        set_field = object.__setattr__
+        set_field(self, "product_id", product_id)
+        set_field(self, "bid_price", bid_price)
+        set_field(self, "bid_qty", bid_qty)
+        set_field(self, "ask_price", ask_price)
+        set_field(self, "ask_qty", ask_qty)
+        set_field(self, "timestamp", timestamp)
+
+        spread = ask_price - bid_price
+        mid_price = (bid_price + ask_price) / 2
+        set_field(self, "spread", spread)
+        set_field(self, "mid_price", mid_price)
+        set_field(self, "spread_bps", spread / mid_price * 10000 if mid_price != 0 else Decimal(0))
+
+        # Analyzer states at this tick (see BBOHandler)
+        set_field(self, "spread_state", spread_state)
+        set_field(self, "momentum", momentum)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BBOData is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("BBOData is immutable")
+
+    def with_states(self, spread_state: str, momentum: str) -> "BBOData":
+        """
+        Copy of this snapshot with analyzer states attached (derived fields reused).
+
+        Args:
+            spread_state: "WIDENING", "NARROWING", or "STABLE"
+            momentum: "BULLISH", "BEARISH", or "NEUTRAL"
+
+        Returns:
+            New BBOData
+        """
+        snapshot = object.__new__(BBOData)
+        set_field = object.__setattr__
+        for name in BBOData.__slots__:
+            set_field(snapshot, name, getattr(self, name))
+        set_field(snapshot, "spread_state", spread_state)
+        set_field(snapshot, "momentum", momentum)
+        return snapshot
+
+    def __repr__(self) -> str:
+        return (
+            f"BBOData(product_id={self.product_id}, bid={self.bid_price}x{self.bid_qty}, "
+            f"ask={self.ask_price}x{self.ask_qty}, ts={self.timestamp}, "
+            f"spread_state={self.spread_state}, momentum={self.momentum})"
+        )
+
+
+# Unbounded precision: additions and subtractions of Decimals are exact
+_EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+class RollingStats:
+    """
+    Rolling mean/stdev and EWMA of a float64 series, O(1) per update.
+
+    Window sums are kept relative to a shift value (an early sample) so the
+    variance does not lose precision on large prices, and are recomputed from
+    the window every window_size updates to bound add/subtract drift.
+    """
+
+    def __init__(self, window_size: int, ewma_alpha: Optional[float] = None):
+        """
+        Initialize rolling stats.
+
+        Args:
+            window_size: Number of recent values in the rolling mean/stdev
+            ewma_alpha: EWMA smoothing factor (default 2 / (window_size + 1))
+        """
+        self.window_size = window_size
+        self.ewma_alpha = ewma_alpha if ewma_alpha is not None else 2.0 / (window_size + 1)
+        self.ewma: Optional[float] = None
+
+        self._values: deque = deque(maxlen=window_size)
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._updates_since_resum = 0
+
+    def update(self, value: float) -> None:
+        """Add one value."""
+        values = self._values
+        if not values:
+            self._shift = value
+        elif len(values) == self.window_size:
+            evicted = values[0] - self._shift
+            self._sum -= evicted
+            self._sum_sq -= evicted * evicted
+
+        values.append(value)
+        delta = value - self._shift
+        self._sum += delta
+        self._sum_sq += delta * delta
+
+        self._updates_since_resum += 1
+        if self._updates_since_resum >= self.window_size:
+            self._resum()
+
+        self.ewma = value if self.ewma is None else self.ewma + self.ewma_alpha * (value - self.ewma)
+
+    def _resum(self) -> None:
+        """Recompute the window sums around the oldest value."""
+        values = self._values
+        self._shift = shift = values[0]
+        self._sum = sum(value - shift for value in values)
+        self._sum_sq = sum((value - shift) ** 2 for value in values)
+        self._updates_since_resum = 0
 
     @property
-    def spread(self) -> Decimal:
-        """Calculate spread in absolute terms."""
-        return self.ask_price - self.bid_price
+    def count(self) -> int:
+        return len(self._values)
 
     @property
-    def spread_bps(self) -> Decimal:
-        """Calculate spread in basis points."""
-        mid_price = (self.bid_price + self.ask_price) / 2
-        if mid_price == 0:
-            return Decimal(0)
-        return self.spread / mid_price * 10000
+    def mean(self) -> Optional[float]:
+        """Mean of the window, or None if empty."""
+        if not self._values:
+            return None
+        return self._shift + self._sum / len(self._values)
 
     @property
-    def mid_price(self) -> Decimal:
-        """Calculate mid price."""
-        return (self.bid_price + self.ask_price) / 2
+    def stdev(self) -> Optional[float]:
+        """Sample standard deviation of the window, or None with fewer than 2 values."""
+        n = len(self._values)
+        if n < 2:
+            return None
+        variance = (self._sum_sq - self._sum * self._sum / n) / (n - 1)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Current statistics as a dict."""
+        return {"count": self.count, "mean": self.mean, "stdev": self.stdev, "ewma": self.ewma}
 
 
 class SpreadMonitor:
-    """Monitor spread changes for market making decisions."""
+    """
+    Monitor spread changes for market making decisions.
+
+    The spread state compares each spread against the float64 rolling mean of
+    the window, so a tick is O(1) with no Decimal arithmetic. Ties at exactly
+    x1.5 / x0.5 the average may round differently than Decimal would.
+    """
 
     def __init__(self, window_size: int = 100):
         """
@@ -64,7 +195,8 @@ class SpreadMonitor:
             window_size: Number of recent spreads to track
         """
         self.window_size = window_size
-        self.spread_history: deque = deque(maxlen=window_size)
+        # float64 analytics of spread in bps (spread / bid)
+        self.spread_bps_stats = RollingStats(window_size)
 
     def on_bbo(self, bbo: BBOData) -> str:
         """
@@ -73,32 +205,47 @@ class SpreadMonitor:
         Returns:
             Spread state: "WIDENING", "NARROWING", or "STABLE"
         """
-        spread_pct = bbo.spread / bbo.bid_price if bbo.bid_price > 0 else Decimal(0)
-        self.spread_history.append(spread_pct)
+        return self.update(float(bbo.bid_price), float(bbo.spread))
 
-        if len(self.spread_history) < 10:
-            return "STABLE"
+    def update(self, bid: float, spread: float) -> str:
+        """
+        Process one tick's bid and spread (ask - bid) and return spread state.
 
-        # Calculate average spread
-        avg_spread = mean(self.spread_history)
+        Returns:
+            Spread state: "WIDENING", "NARROWING", or "STABLE"
+        """
+        spread_bps = spread / bid * 10000 if bid > 0 else 0.0
+        stats = self.spread_bps_stats
+        stats.update(spread_bps)
 
-        # Detect spread changes
-        if spread_pct > avg_spread * Decimal('1.5'):
+        if stats.count < 10:
+            return "STABLE"
+
+        # Detect spread changes against the window average
+        avg_spread_bps = stats.mean
+        if spread_bps > avg_spread_bps * 1.5:
             return "WIDENING"  # Volatility increasing
-        elif spread_pct < avg_spread * Decimal('0.5'):
+        elif spread_bps < avg_spread_bps * 0.5:
             return "NARROWING"  # Market stabilizing
         else:
             return "STABLE"
 
     def get_avg_spread_bps(self) -> Optional[Decimal]:
         """Get average spread in basis points."""
-        if not self.spread_history:
-            return None
-        return Decimal(str(mean(self.spread_history))) * 10000
+        mean = self.spread_bps_stats.mean
+        return Decimal(str(mean)) if mean is not None else None
 
 
 class MomentumDetector:
-    """Detect price momentum from BBO stream."""
+    """
+    Detect price momentum from BBO stream.
+
+    Prices are kept as float64, so a tick costs a few float operations; a
+    slope of exactly the threshold may round differently than Decimal would.
+    """
+
+    TREND_POINTS = 5  # Ticks the bid/ask trend is measured over
+    THRESHOLD = 0.001  # 0.1% change threshold
 
     def __init__(self, window_size: int = 20):
         """
@@ -108,8 +255,10 @@ class MomentumDetector:
             window_size: Number of price points to analyze
         """
         self.window_size = window_size
-        self.bid_history: deque = deque(maxlen=window_size)
-        self.ask_history: deque = deque(maxlen=window_size)
+        self.bid_history: deque = deque(maxlen=self.TREND_POINTS)
+        self.ask_history: deque = deque(maxlen=self.TREND_POINTS)
+        # float64 analytics of mid price
+        self.mid_stats = RollingStats(window_size)
 
     def on_bbo(self, bbo: BBOData) -> str:
         """
@@ -118,22 +267,29 @@ class MomentumDetector:
         Returns:
             Momentum state: "BULLISH", "BEARISH", or "NEUTRAL"
         """
-        self.bid_history.append((bbo.timestamp, bbo.bid_price))
-        self.ask_history.append((bbo.timestamp, bbo.ask_price))
+        return self.update(float(bbo.bid_price), float(bbo.ask_price))
 
-        if len(self.bid_history) < 5:
-            return "NEUTRAL"
+    def update(self, bid: float, ask: float) -> str:
+        """
+        Process one tick's bid and ask and return momentum state.
 
-        # Calculate price trend
-        recent_bids = [price for _, price in list(self.bid_history)[-5:]]
-        recent_asks = [price for _, price in list(self.ask_history)[-5:]]
+        Returns:
+            Momentum state: "BULLISH", "BEARISH", or "NEUTRAL"
+        """
+        bids, asks = self.bid_history, self.ask_history
+        bids.append(bid)
+        asks.append(ask)
+        self.mid_stats.update((bid + ask) / 2)
 
-        bid_slope = (recent_bids[-1] - recent_bids[0]) / recent_bids[0] if recent_bids[0] > 0 else Decimal(0)
-        ask_slope = (recent_asks[-1] - recent_asks[0]) / recent_asks[0] if recent_asks[0] > 0 else Decimal(0)
+        if len(bids) < self.TREND_POINTS:
+            return "NEUTRAL"
 
-        # Detect momentum
-        threshold = Decimal('0.001')  # 0.1% change threshold
+        # Price trend over the last TREND_POINTS ticks
+        first_bid, first_ask = bids[0], asks[0]
+        bid_slope = (bid - first_bid) / first_bid if first_bid > 0 else 0.0
+        ask_slope = (ask - first_ask) / first_ask if first_ask > 0 else 0.0
 
+        threshold = self.THRESHOLD
         if bid_slope > threshold and ask_slope > threshold:
             return "BULLISH"  # Both rising
         elif bid_slope < -threshold and ask_slope < -threshold:
@@ -142,6 +298,165 @@ class MomentumDetector:
             return "NEUTRAL"
 
 
+class TimeWindowAnalyzer:
+    """
+    Spread and momentum state over wall-clock windows of exchange time.
+
+    The tick-count windows of SpreadMonitor/MomentumDetector cover a fraction
+    of a second in a busy market and minutes in a quiet one; these windows
+    (e.g. the last 2s/10s/60s by BBO timestamp) keep the same meaning under
+    any message rate. All windows share one sample buffer: each window keeps
+    a start index and an exact Decimal running spread sum, advanced as
+    samples age out, and samples older than the longest window are popped
+    off the buffer front. Each sample is added and removed once per window,
+    so a tick costs O(1) per window plus its evictions, with no periodic
+    re-sum.
+
+    Same decision rules as the tick versions: spread vs the window's average
+    spread (x1.5 / x0.5), and bid/ask change from the window's first sample
+    against momentum_threshold.
+    """
+
+    DEFAULT_WINDOWS_S = (2, 10, 60)
+
+    def __init__(
+        self,
+        windows_s: Tuple[float, ...] = DEFAULT_WINDOWS_S,
+        min_spread_samples: int = 10,
+        min_momentum_samples: int = 5,
+        momentum_threshold: float = 0.001
+    ):
+        """
+        Initialize time-window analyzer.
+
+        Args:
+            windows_s: Window lengths in seconds
+            min_spread_samples: Samples a window needs before reporting a spread state
+            min_momentum_samples: Samples a window needs before reporting momentum
+            momentum_threshold: Relative price change for BULLISH/BEARISH (0.001 = 0.1%)
+        """
+        self.windows_s = tuple(sorted(windows_s))
+        self.min_spread_samples = min_spread_samples
+        self.min_momentum_samples = min_momentum_samples
+        self.momentum_threshold = momentum_threshold
+
+        self._window_ns = {w: int(w * 1e9) for w in self.windows_s}
+        # Sample buffer: timestamps (ns) and (spread_pct, bid, ask) in parallel;
+        # _base is the sequence number of the oldest buffered sample
+        self._timestamps: deque = deque()
+        self._samples: deque = deque()
+        self._base = 0
+        # Per window: sequence number of its first sample and exact spread_pct sum over it
+        self._start = {w: 0 for w in self.windows_s}
+        self._spread_sum = {w: Decimal(0) for w in self.windows_s}
+        self._last_timestamp = 0
+
+    def on_bbo(self, bbo: BBOData) -> None:
+        """Add one BBO sample and age out samples that left each window."""
+        self.add_sample(bbo.timestamp, bbo.bid_price, bbo.ask_price)
+
+    def add_sample(self, timestamp: int, bid_price: Decimal, ask_price: Decimal) -> None:
+        """Add one tick's exchange timestamp and prices and age out samples that left each window."""
+        bid = float(bid_price)
+        ask = float(ask_price)
+        spread_pct = (ask_price - bid_price) / bid_price if bid_price > 0 else Decimal(0)
+        # Exchange timestamps should not go backwards; clamp if they do
+        timestamp = max(int(timestamp), self._last_timestamp)
+        self._last_timestamp = timestamp
+
+        self._timestamps.append(timestamp)
+        self._samples.append((spread_pct, bid, ask))
+
+        timestamps, samples, base = self._timestamps, self._samples, self._base
+        add, subtract = _EXACT_CONTEXT.add, _EXACT_CONTEXT.subtract
+        for window, window_ns in self._window_ns.items():
+            start = self._start[window]
+            total = add(self._spread_sum[window], spread_pct)
+            cutoff = timestamp - window_ns
+            while timestamps[start - base] <= cutoff:
+                total = subtract(total, samples[start - base][0])
+                start += 1
+            self._start[window] = start
+            self._spread_sum[window] = total
+
+        # The longest window starts last; no window covers anything before it
+        for _ in range(self._start[self.windows_s[-1]] - base):
+            timestamps.popleft()
+            samples.popleft()
+        self._base = self._start[self.windows_s[-1]]
+
+    def _count(self, window: float) -> int:
+        return self._base + len(self._samples) - self._start[window]
+
+    def get_spread_state(self, window_s: float) -> str:
+        """
+        Get spread state over a window.
+
+        Args:
+            window_s: One of windows_s
+
+        Returns:
+            "WIDENING", "NARROWING", or "STABLE" (STABLE until the window holds
+            min_spread_samples samples)
+        """
+        count = self._count(window_s)
+        if count < self.min_spread_samples:
+            return "STABLE"
+
+        spread_pct = self._samples[-1][0]
+        avg_spread = self._spread_sum[window_s] / count
+        if spread_pct > avg_spread * Decimal('1.5'):
+            return "WIDENING"
+        elif spread_pct < avg_spread * Decimal('0.5'):
+            return "NARROWING"
+        return "STABLE"
+
+    def get_momentum(self, window_s: float) -> str:
+        """
+        Get price momentum over a window.
+
+        Args:
+            window_s: One of windows_s
+
+        Returns:
+            "BULLISH", "BEARISH", or "NEUTRAL" (NEUTRAL until the window holds
+            min_momentum_samples samples)
+        """
+        if self._count(window_s) < self.min_momentum_samples:
+            return "NEUTRAL"
+
+        _, first_bid, first_ask = self._samples[self._start[window_s] - self._base]
+        _, last_bid, last_ask = self._samples[-1]
+        bid_slope = (last_bid - first_bid) / first_bid if first_bid > 0 else 0.0
+        ask_slope = (last_ask - first_ask) / first_ask if first_ask > 0 else 0.0
+
+        threshold = self.momentum_threshold
+        if bid_slope > threshold and ask_slope > threshold:
+            return "BULLISH"
+        elif bid_slope < -threshold and ask_slope < -threshold:
+            return "BEARISH"
+        return "NEUTRAL"
+
+    def get_window_stats(self, window_s: float) -> Dict:
+        """
+        Get sample count, average spread and states for a window.
+
+        Args:
+            window_s: One of windows_s
+
+        Returns:
+            Dict with samples, avg_spread_bps, spread_state and momentum
+        """
+        count = self._count(window_s)
+        return {
+            "window_s": window_s,
+            "samples": count,
+            "avg_spread_bps": float(self._spread_sum[window_s] / count) * 10000 if count else None,
+            "spread_state": self.get_spread_state(window_s),
+            "momentum": self.get_momentum(window_s),
+        }
+
+
 class BBOHandler:
     """
     Handle Best Bid Offer stream data.
@@ -177,6 +492,7 @@ class BBOHandler:
         # Analyzers
         self.spread_monitor = SpreadMonitor()
         self.momentum_detector = MomentumDetector()
+        self.time_windows = TimeWindowAnalyzer()
 
         # Cached state for public getters (avoids side effects in getter methods)
         self._cached_spread_state = "STABLE"
@@ -185,6 +501,10 @@ class BBOHandler:
         # Callbacks
         self._callbacks: List = []
 
+        # Tick listeners: called synchronously with each new snapshot; used by
+        # wait_until()/wait_until_pair() to wake on the satisfying tick
+        self._tick_listeners: List[Callable[[BBOData], None]] = []
+
     async def start(self) -> None:
         """Start subscribing to BBO stream."""
         await self.ws_client.subscribe(
@@ -194,6 +514,14 @@ class BBOHandler:
         )
         self.logger.info(f"BBO handler started for product_id={self.product_id}")
 
+    async def stop(self) -> None:
+        """Stop receiving BBO stream messages (shared connection stays open)."""
+        await self.ws_client.unsubscribe(
+            "best_bid_offer",
+            self.product_id,
+            callback=self._on_bbo_message
+        )
+
     async def _on_bbo_message(self, message: Dict) -> None:
         """
         Process BBO message from WebSocket.
@@ -203,22 +531,32 @@ class BBOHandler:
         """
         try:
             # Parse BBO data
+            bid_price = x18_to_decimal(message["bid_price"])
+            bid_qty = x18_to_decimal(message["bid_qty"])
+            ask_price = x18_to_decimal(message["ask_price"])
+            ask_qty = x18_to_decimal(message["ask_qty"])
+            timestamp = int(message.get("timestamp", 0))
+
+            # Run analyzers on the raw prices and cache results
+            bid = float(bid_price)
+            self._cached_spread_state = self.spread_monitor.update(bid, float(ask_price - bid_price))
+            self._cached_momentum = self.momentum_detector.update(bid, float(ask_price))
+            self.time_windows.add_sample(timestamp, bid_price, ask_price)
+
+            # Build the tick's snapshot once with its states and publish it
+            # (one reference swap)
             bbo = BBOData(
                 product_id=message.get("product_id", self.product_id),
-                bid_price=Decimal(message["bid_price"]) / Decimal(1e18),
-                bid_qty=Decimal(message["bid_qty"]) / Decimal(1e18),
-                ask_price=Decimal(message["ask_price"]) / Decimal(1e18),
-                ask_qty=Decimal(message["ask_qty"]) / Decimal(1e18),
-                timestamp=int(message.get("timestamp", 0))
+                bid_price=bid_price,
+                bid_qty=bid_qty,
+                ask_price=ask_price,
+                ask_qty=ask_qty,
+                timestamp=timestamp,
+                spread_state=self._cached_spread_state,
+                momentum=self._cached_momentum
             )
-
-            # Update latest BBO
             self._latest_bbo = bbo
 
-            # Run analyzers and cache results
-            self._cached_spread_state = self.spread_monitor.on_bbo(bbo)
-            self._cached_momentum = self.momentum_detector.on_bbo(bbo)
-
             # Log significant changes
             if self._cached_spread_state != "STABLE":
                 self.logger.info(
@@ -233,6 +571,11 @@ class BBOHandler:
                     f"{bbo.mid_price:.2f}"
                 )
 
+            # Wake waiters before callbacks, which may await
+            if self._tick_listeners:
+                for listener in list(self._tick_listeners):
+                    listener(bbo)
+
             # Call registered callbacks with cached values
             for callback in self._callbacks:
                 try:
@@ -247,7 +590,13 @@ class BBOHandler:
             self.logger.error(f"Failed to parse BBO message: {e}")
 
     def get_latest_bbo(self) -> Optional[BBOData]:
-        """Get the latest BBO data."""
+        """
+        Get the latest BBO snapshot.
+
+        Read fields from the returned snapshot rather than calling several
+        getters: it cannot change underneath the caller, while consecutive
+        getter calls may straddle a tick.
+        """
         return self._latest_bbo
 
     def get_prices(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
@@ -257,38 +606,132 @@ class BBOHandler:
         Returns:
             Tuple of (bid_price, ask_price) or (None, None) if no data
         """
-        if self._latest_bbo is None:
+        bbo = self._latest_bbo
+        if bbo is None:
             return None, None
-        return self._latest_bbo.bid_price, self._latest_bbo.ask_price
+        return bbo.bid_price, bbo.ask_price
 
     def get_spread(self) -> Optional[Decimal]:
         """Get current spread in price units."""
-        if self._latest_bbo is None:
+        bbo = self._latest_bbo
+        if bbo is None:
             return None
-        return self._latest_bbo.spread
+        return bbo.spread
 
     def get_fair_value(self) -> Optional[Decimal]:
         """Get fair value (mid price)."""
-        if self._latest_bbo is None:
+        bbo = self._latest_bbo
+        if bbo is None:
             return None
-        return self._latest_bbo.mid_price
+        return bbo.mid_price
 
-    def get_spread_state(self) -> str:
+    def get_spread_state(self, window_s: Optional[float] = None) -> str:
         """Get current cached spread state (pure getter, no side effects).
 
+        Args:
+            window_s: Time window in seconds (one of time_windows.windows_s);
+                      None for the tick-count SpreadMonitor state
+
         Returns:
             Current spread state: "WIDENING", "NARROWING", or "STABLE"
         """
+        if window_s is not None:
+            return self.time_windows.get_spread_state(window_s)
         return self._cached_spread_state
 
-    def get_momentum(self) -> str:
+    def get_momentum(self, window_s: Optional[float] = None) -> str:
         """Get current cached momentum state (pure getter, no side effects).
 
+        Args:
+            window_s: Time window in seconds (one of time_windows.windows_s);
+                      None for the tick-count MomentumDetector state
+
         Returns:
             Current momentum state: "BULLISH", "BEARISH", or "NEUTRAL"
         """
+        if window_s is not None:
+            return self.time_windows.get_momentum(window_s)
         return self._cached_momentum
 
+    def get_spread_stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get rolling spread analytics (float64, maintained per tick).
+
+        Returns:
+            Dict with count, mean, stdev and ewma of spread in bps
+        """
+        return self.spread_monitor.spread_bps_stats.summary()
+
+    def get_mid_stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get rolling mid price analytics (float64, maintained per tick).
+
+        Returns:
+            Dict with count, mean, stdev and ewma of mid price
+        """
+        return self.momentum_detector.mid_stats.summary()
+
+    def is_stale(self) -> bool:
+        """Check whether BBO messages stopped arriving (see NadoWebSocketClient.is_stale)."""
+        return self.ws_client.is_stale("best_bid_offer", self.product_id)
+
+    async def wait_until(
+        self,
+        predicate: Callable[[BBOData], bool],
+        timeout: Optional[float] = None
+    ) -> Optional[BBOData]:
+        """
+        Wait for the first BBO snapshot satisfying predicate.
+
+        The latest snapshot is checked first; after that the predicate runs on
+        every tick as it arrives, so the caller wakes on the tick that
+        satisfies it rather than on its next poll.
+
+        Args:
+            predicate: Called with each BBOData; must not block
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            The satisfying snapshot, or None on timeout
+
+        Raises:
+            Exception: Whatever predicate raises
+        """
+        latest = self._latest_bbo
+        if latest is not None and predicate(latest):
+            return latest
+
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(bbo: BBOData) -> None:
+            if future.done():
+                return
+            try:
+                if predicate(bbo):
+                    future.set_result(bbo)
+            except Exception as e:
+                future.set_exception(e)
+
+        self._tick_listeners.append(listener)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._tick_listeners.remove(listener)
+
+    def add_tick_listener(self, listener: Callable[[BBOData], None]) -> None:
+        """
+        Call listener synchronously with each published snapshot.
+
+        Listeners run before registered callbacks and must not block or raise.
+        """
+        self._tick_listeners.append(listener)
+
+    def remove_tick_listener(self, listener: Callable[[BBOData], None]) -> None:
+        """Stop calling a listener added with add_tick_listener()."""
+        self._tick_listeners.remove(listener)
+
     def register_callback(self, callback) -> None:
         """
         Register callback for BBO updates.
@@ -297,3 +740,61 @@ class BBOHandler:
             callback: Function that receives (bbo, spread_state, momentum)
         """
         self._callbacks.append(callback)
+
+
+async def wait_until_pair(
+    handler_a: BBOHandler,
+    handler_b: BBOHandler,
+    predicate: Callable[[BBOData, BBOData], bool],
+    timeout: Optional[float] = None
+) -> Optional[Tuple[BBOData, BBOData]]:
+    """
+    Wait until a condition on two products' BBOs holds.
+
+    predicate(bbo_a, bbo_b) is evaluated with both latest snapshots on every
+    tick of either product (once both have data), so pair conditions such as
+    a cross-leg spread threshold wake on the tick that satisfies them.
+
+    Args:
+        handler_a: First BBO handler (e.g. ETH)
+        handler_b: Second BBO handler (e.g. SOL)
+        predicate: Called with (bbo_a, bbo_b); must not block
+        timeout: Seconds to wait (None = no limit)
+
+    Returns:
+        The satisfying (bbo_a, bbo_b) snapshots, or None on timeout
+
+    Raises:
+        Exception: Whatever predicate raises
+    """
+    def check() -> Optional[Tuple[BBOData, BBOData]]:
+        bbo_a, bbo_b = handler_a.get_latest_bbo(), handler_b.get_latest_bbo()
+        if bbo_a is not None and bbo_b is not None and predicate(bbo_a, bbo_b):
+            return bbo_a, bbo_b
+        return None
+
+    pair = check()
+    if pair is not None:
+        return pair
+
+    future = asyncio.get_running_loop().create_future()
+
+    def listener(_: BBOData) -> None:
+        if future.done():
+            return
+        try:
+            result = check()
+            if result is not None:
+                future.set_result(result)
+        except Exception as e:
+            future.set_exception(e)
+
+    handler_a.add_tick_listener(listener)
+    handler_b.add_tick_listener(listener)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        handler_a.remove_tick_listener(listener)
+        handler_b.remove_tick_listener(listener)
@@ -0,0 +1,262 @@
+"""
+Nado Book Snapshot Sink
+
+Periodic top-N order book snapshots from BookDepthHandlers, written to
+columnar files for offline slippage and queue-depth research.
+
+Sampling runs on the event loop and only copies the top N raw x18 levels of
+each book into a queue. A background thread converts rows, batches them and
+writes one file per (product, UTC hour) partition:
+
+    <root>/product_id=<id>/hour=<YYYY-MM-DDTHH>/part-<session>.<parquet|arrow>
+
+Columns: timestamp_ns (sample wall time), book_timestamp (exchange time of
+the last applied book update), product_id, bid_price, bid_qty, ask_price,
+ask_qty (float64 lists, best level first). Requires the optional pyarrow
+package.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pq = None
+
+from .nado_bookdepth_handler import BookDepthHandler
+
+FILE_FORMATS = ("parquet", "arrow")
+
+# (timestamp_ns, book_timestamp, product_id, bid [(price_x18, qty_x18)], ask [(price_x18, qty_x18)])
+SnapshotRow = Tuple[int, int, int, List[Tuple[int, int]], List[Tuple[int, int]]]
+
+_STOP = object()
+
+
+def partition_dir(root_dir: str, product_id: int, timestamp_ns: int) -> str:
+    """Directory of the (product, UTC hour) partition a sample belongs to."""
+    hour = datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).strftime("%Y-%m-%dT%H")
+    return os.path.join(root_dir, f"product_id={product_id}", f"hour={hour}")
+
+
+class BookSnapshotSink:
+    """
+    Write periodic top-N book snapshots of several products to Parquet/Arrow.
+
+    Usage:
+        sink = BookSnapshotSink([eth_book, sol_book], "data/book_snapshots")
+        await sink.start()
+        ...
+        await sink.stop()
+
+    The trading loop never waits on disk: if the writer falls behind and the
+    queue fills, samples are dropped and counted in dropped.
+    """
+
+    def __init__(
+        self,
+        handlers: Iterable[BookDepthHandler],
+        root_dir: str,
+        interval_s: float = 0.25,
+        levels: int = 10,
+        batch_size: int = 1000,
+        flush_interval_s: float = 5.0,
+        file_format: str = "parquet",
+        max_queue: int = 100_000,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize book snapshot sink.
+
+        Args:
+            handlers: BookDepth handlers to sample
+            root_dir: Output directory (partition directories are created under it)
+            interval_s: Seconds between samples
+            levels: Levels per side in each snapshot
+            batch_size: Rows buffered before a write
+            flush_interval_s: Maximum seconds a buffered row waits for a write
+            file_format: "parquet" or "arrow" (Arrow IPC file)
+            max_queue: Maximum samples waiting for the writer thread
+            logger: Optional logger instance
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            ValueError: If file_format is unknown
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow library is required for book snapshots. Install with: pip install pyarrow")
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"file_format must be one of {FILE_FORMATS}, got {file_format!r}")
+
+        self.handlers: List[BookDepthHandler] = list(handlers)
+        self.root_dir = root_dir
+        self.interval_s = interval_s
+        self.levels = levels
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.file_format = file_format
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.rows_written = 0
+        self.dropped = 0
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._sample_task: Optional[asyncio.Task] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._session = time.time_ns()
+
+        # Writer thread state: product_id -> (partition dir, open file writer)
+        self._writers: Dict[int, Tuple[str, object]] = {}
+        self._schema = pa.schema([
+            ("timestamp_ns", pa.int64()),
+            ("book_timestamp", pa.int64()),
+            ("product_id", pa.int32()),
+            ("bid_price", pa.list_(pa.float64())),
+            ("bid_qty", pa.list_(pa.float64())),
+            ("ask_price", pa.list_(pa.float64())),
+            ("ask_qty", pa.list_(pa.float64())),
+        ])
+
+    async def start(self) -> None:
+        """Start the writer thread and the sampling task."""
+        if self._sample_task is not None:
+            return
+        self._writer_thread = threading.Thread(target=self._run_writer, name="book-snapshot-writer", daemon=True)
+        self._writer_thread.start()
+        self._sample_task = asyncio.create_task(self._run_sampler())
+        self.logger.info(
+            f"Book snapshots: {len(self.handlers)} products every {self.interval_s}s "
+            f"(top {self.levels}) -> {self.root_dir}"
+        )
+
+    async def stop(self) -> None:
+        """Stop sampling, write everything queued and close the files."""
+        if self._sample_task is None:
+            return
+        self._sample_task.cancel()
+        try:
+            await self._sample_task
+        except asyncio.CancelledError:
+            pass
+        self._sample_task = None
+
+        self._queue.put(_STOP)
+        await asyncio.get_running_loop().run_in_executor(None, self._writer_thread.join)
+        self._writer_thread = None
+        self.logger.info(f"Book snapshots: wrote {self.rows_written} rows, dropped {self.dropped}")
+
+    async def _run_sampler(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            self.sample()
+            next_at += self.interval_s
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+
+    def sample(self) -> int:
+        """
+        Queue one snapshot of every warm book.
+
+        Books that are resyncing or have not received data are skipped.
+
+        Returns:
+            Number of snapshots queued
+        """
+        now_ns = time.time_ns()
+        queued = 0
+        for handler in self.handlers:
+            if not handler.last_timestamp or handler.is_resyncing:
+                continue
+            row = (
+                now_ns,
+                handler.last_timestamp,
+                handler.product_id,
+                handler.get_top_levels_x18("bid", self.levels),
+                handler.get_top_levels_x18("ask", self.levels),
+            )
+            try:
+                self._queue.put_nowait(row)
+                queued += 1
+            except queue.Full:
+                self.dropped += 1
+        return queued
+
+    def _run_writer(self) -> None:
+        """Writer thread: batch queued rows and write them per partition."""
+        batch: List[SnapshotRow] = []
+        deadline = time.monotonic() + self.flush_interval_s
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            if stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                if batch:
+                    try:
+                        self._write_batch(batch)
+                    except Exception as e:
+                        self.logger.error(f"Book snapshot write failed ({len(batch)} rows lost): {e}")
+                    batch = []
+                deadline = time.monotonic() + self.flush_interval_s
+
+        for _, writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def _write_batch(self, batch: List[SnapshotRow]) -> None:
+        """Convert rows to columns and append them to their partition files."""
+        # Rows are in sample order, so each product's partitions come in hour order
+        partitions: Dict[Tuple[int, str], List[SnapshotRow]] = {}
+        for row in batch:
+            key = (row[2], partition_dir(self.root_dir, row[2], row[0]))
+            partitions.setdefault(key, []).append(row)
+
+        for (product_id, directory), rows in partitions.items():
+            self._get_writer(product_id, directory).write_table(self._to_table(rows))
+            self.rows_written += len(rows)
+
+    def _get_writer(self, product_id: int, directory: str):
+        """Open writer of a product's current partition; a new hour closes the previous file."""
+        current = self._writers.get(product_id)
+        if current is not None:
+            if current[0] == directory:
+                return current[1]
+            current[1].close()
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{self._session}.{self.file_format}")
+        if self.file_format == "parquet":
+            writer = pq.ParquetWriter(path, self._schema)
+        else:
+            writer = pa.ipc.new_file(path, self._schema)
+        self._writers[product_id] = (directory, writer)
+        return writer
+
+    def _to_table(self, rows: List[SnapshotRow]):
+        scale = 10 ** 18  # int / int true division is correctly rounded
+        return pa.table({
+            "timestamp_ns": [row[0] for row in rows],
+            "book_timestamp": [row[1] for row in rows],
+            "product_id": [row[2] for row in rows],
+            "bid_price": [[price / scale for price, _ in row[3]] for row in rows],
+            "bid_qty": [[qty / scale for _, qty in row[3]] for row in rows],
+            "ask_price": [[price / scale for price, _ in row[4]] for row in rows],
+            "ask_qty": [[qty / scale for _, qty in row[4]] for row in rows],
+        }, schema=self._schema)
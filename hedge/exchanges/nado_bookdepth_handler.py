@@ -7,13 +7,169 @@ Maintains local order book state and provides slippage estimation.
 
 import asyncio
 import logging
+from bisect import bisect_left
+from collections.abc import Mapping
 from decimal import Decimal
+from fractions import Fraction
+from itertools import islice
 from sortedcontainers import SortedDict
-from typing import Dict, Optional, Tuple, List
+from typing import Awaitable, Callable, Dict, Iterator, Optional, Tuple, List
 
+from .nado_message_decoder import X18, decimal_to_x18, x18_to_decimal
 from .nado_websocket_client import NadoWebSocketClient
 
 
+# Order book snapshot: (timestamp_ns, [(price, qty), ...] bids, [(price, qty), ...] asks)
+BookSnapshot = Tuple[int, List[Tuple[Decimal, Decimal]], List[Tuple[Decimal, Decimal]]]
+
+
+class BookSideView(Mapping):
+    """
+    Read-only Decimal view of one side of the x18 integer book.
+
+    Iterates prices best level first and converts keys/values to Decimal on
+    access, so the book itself never holds Decimals.
+    """
+
+    __slots__ = ("_levels", "_sign")
+
+    def __init__(self, levels: SortedDict, sign: int):
+        self._levels = levels
+        self._sign = sign  # -1 for bids (stored under negated price), 1 for asks
+
+    def __getitem__(self, price) -> Decimal:
+        return x18_to_decimal(self._levels[self._sign * decimal_to_x18(price)])
+
+    def __contains__(self, price) -> bool:
+        return self._sign * decimal_to_x18(price) in self._levels
+
+    def __iter__(self) -> Iterator[Decimal]:
+        sign = self._sign
+        for key in self._levels:
+            yield x18_to_decimal(sign * key)
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+
+class DepthLadder:
+    """
+    Cumulative depth of one book side, best level first, in x18 integers.
+
+    cum_qty[i] / cum_notional[i] are the quantity and price*qty notional of
+    levels 0..i, so the cost of any order size is one bisect plus a partial
+    level instead of a walk over the book.
+    """
+
+    __slots__ = ("prices", "cum_qty", "cum_notional")
+
+    def __init__(self, levels: SortedDict, sign: int):
+        prices, cum_qty, cum_notional = [], [], []
+        total_qty = total_notional = 0
+        for key, qty in levels.items():
+            price = sign * key
+            total_qty += qty
+            total_notional += price * qty
+            prices.append(price)
+            cum_qty.append(total_qty)
+            cum_notional.append(total_notional)
+        self.prices: List[int] = prices
+        self.cum_qty: List[int] = cum_qty
+        self.cum_notional: List[int] = cum_notional
+
+    @property
+    def total_qty(self) -> int:
+        return self.cum_qty[-1] if self.cum_qty else 0
+
+    def notional_for(self, quantity_x18: int) -> Optional[int]:
+        """
+        Notional (price_x18 * qty_x18) of filling quantity_x18 from the best level.
+
+        Returns:
+            Notional, or None if the side holds less than quantity_x18
+        """
+        cum_qty = self.cum_qty
+        if not cum_qty or quantity_x18 > cum_qty[-1]:
+            return None
+        i = bisect_left(cum_qty, quantity_x18)
+        if i == 0:
+            return self.prices[0] * quantity_x18
+        return self.cum_notional[i - 1] + self.prices[i] * (quantity_x18 - cum_qty[i - 1])
+
+    def max_quantity_within(self, limit_vwap: Fraction, ascending: bool) -> int:
+        """
+        Largest quantity whose VWAP stays on the best side of limit_vwap.
+
+        VWAP only worsens as levels are consumed, so the last full level within
+        the limit is found by bisection and the partial fill of the next level
+        is solved exactly.
+
+        Args:
+            limit_vwap: Worst acceptable VWAP (price_x18 units)
+            ascending: True for asks (VWAP rises with size), False for bids
+
+        Returns:
+            Quantity in x18 (0 if the side is empty)
+        """
+        prices, cum_qty, cum_notional = self.prices, self.cum_qty, self.cum_notional
+        if not prices:
+            return 0
+
+        def within(i: int) -> bool:
+            # VWAP of levels 0..i vs limit, without dividing
+            if ascending:
+                return cum_notional[i] <= cum_qty[i] * limit_vwap
+            return cum_notional[i] >= cum_qty[i] * limit_vwap
+
+        if not within(0):
+            return 0
+
+        # Last level index whose cumulative VWAP is within the limit
+        low, high = 0, len(prices) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if within(mid):
+                low = mid
+            else:
+                high = mid - 1
+
+        if low == len(prices) - 1:
+            return cum_qty[low]
+
+        # (N + p*x) / (Q + x) = limit  =>  x = (Q*limit - N) / (p - limit)
+        price = prices[low + 1]
+        partial = (cum_qty[low] * limit_vwap - cum_notional[low]) / (price - limit_vwap)
+        return min(cum_qty[low] + int(partial), cum_qty[low + 1])
+
+
+class BookFeatures:
+    """
+    Top-of-book features of one book state, in x18 integers.
+
+    Replaced on every book change (BookDepthHandler._update_features), so the
+    handler's feature getters are O(1) reads. Band notionals are computed at
+    most once per book state, on first read.
+    """
+
+    __slots__ = (
+        "bid_price", "bid_qty", "ask_price", "ask_qty",
+        "bid_depth", "ask_depth", "bid_band_notional", "ask_band_notional",
+    )
+
+    def __init__(self):
+        self.bid_price: int = 0
+        self.bid_qty: int = 0
+        self.ask_price: int = 0
+        self.ask_qty: int = 0
+        # Quantity in the top FEATURE_LEVELS levels
+        self.bid_depth: int = 0
+        self.ask_depth: int = 0
+        # bps -> price_x18 * qty_x18 within bps of mid (FEATURE_BANDS_BPS),
+        # None until first read for this book state
+        self.bid_band_notional: Optional[Dict[int, int]] = None
+        self.ask_band_notional: Optional[Dict[int, int]] = None
+
+
 class BookDepthHandler:
     """
     Handle BookDepth stream data.
@@ -24,13 +180,26 @@ class BookDepthHandler:
     - Full depth by level
     - Slippage estimation
     - Liquidity analysis
+
+    Deltas only make sense on top of the book they were computed against, so
+    the book is rebuilt whenever continuity is lost: on start, after a
+    WebSocket reconnect, and when a message's last_max_timestamp does not match
+    the previous max_timestamp (gap). With a snapshot_fetcher the book is
+    reloaded from a REST snapshot and deltas received meanwhile are replayed if
+    newer than the snapshot; without one it is cleared and rebuilt from deltas.
     """
 
+    # Levels per side in the top-of-book depth/imbalance features
+    FEATURE_LEVELS = 5
+    # Bands (bps from mid) whose notional is cached per book state
+    FEATURE_BANDS_BPS = (5, 10, 20)
+
     def __init__(
         self,
         product_id: int,
         ws_client: NadoWebSocketClient,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        snapshot_fetcher: Optional[Callable[[], Awaitable[BookSnapshot]]] = None
     ):
         """
         Initialize BookDepth handler.
@@ -39,23 +208,61 @@ class BookDepthHandler:
             product_id: Product ID (4 for ETH, 8 for SOL)
             ws_client: WebSocket client instance
             logger: Optional logger instance
+            snapshot_fetcher: Optional coroutine function returning a BookSnapshot
+                              (REST order book) used to resync the local book
         """
         self.product_id = product_id
         self.ws_client = ws_client
         self.logger = logger or logging.getLogger(__name__)
+        self._snapshot_fetcher = snapshot_fetcher
+
+        # Local order book state in x18 integers (price_x18 -> qty_x18);
+        # Decimal conversion only happens in the public getters.
+        # bids: keyed by -price_x18 so iteration is descending (highest first)
+        # without a key function
+        self._bids: SortedDict = SortedDict()
+        # asks: keyed by price_x18, ascending (lowest first)
+        self._asks: SortedDict = SortedDict()
+
+        # Cumulative depth per side ("buy" walks asks, "sell" walks bids),
+        # rebuilt lazily on the first query after the book changes
+        self._ladders: Dict[str, DepthLadder] = {}
 
-        # Local order book state
-        # bids: sorted in descending order (highest first)
-        self.bids: SortedDict = SortedDict(lambda x: -x)
-        # asks: sorted in ascending order (lowest first)
-        self.asks: SortedDict = SortedDict()
+        # Top-of-book features, recomputed after every book change
+        self._features = BookFeatures()
 
         # Timestamp tracking
         self.last_timestamp: int = 0
 
+        # Resync state: while a snapshot is being fetched, deltas are buffered
+        self._resync_task: Optional[asyncio.Task] = None
+        self._pending_deltas: List[Dict] = []
+        self.resync_count: int = 0
+
+        # max_timestamp of the last applied delta; gap detection compares the
+        # next message's last_max_timestamp against it. None until a delta is
+        # applied on top of the current book (snapshot timestamps are coarser
+        # than the stream's, so they cannot anchor the chain).
+        self._last_delta_timestamp: Optional[int] = None
+
         # Callbacks
         self._callbacks: List = []
 
+    @property
+    def bids(self) -> BookSideView:
+        """Bid levels as a read-only {Decimal price: Decimal qty} view, highest first."""
+        return BookSideView(self._bids, -1)
+
+    @property
+    def asks(self) -> BookSideView:
+        """Ask levels as a read-only {Decimal price: Decimal qty} view, lowest first."""
+        return BookSideView(self._asks, 1)
+
+    @property
+    def is_resyncing(self) -> bool:
+        """True while the book is being rebuilt from a snapshot."""
+        return self._resync_task is not None and not self._resync_task.done()
+
     async def start(self) -> None:
         """Start subscribing to BookDepth stream."""
         await self.ws_client.subscribe(
@@ -63,8 +270,92 @@ class BookDepthHandler:
             self.product_id,
             self._on_bookdepth_message
         )
+        self.ws_client.register_reconnect_callback(self._on_reconnect)
         self.logger.info(f"BookDepth handler started for product_id={self.product_id}")
 
+        # Deltas are relative to a book we have never seen; seed it
+        if self._snapshot_fetcher is not None:
+            self.invalidate("initial snapshot")
+
+    async def stop(self) -> None:
+        """Stop receiving BookDepth stream messages (shared connection stays open)."""
+        self.ws_client.unregister_reconnect_callback(self._on_reconnect)
+        if self.is_resyncing:
+            self._resync_task.cancel()
+        await self.ws_client.unsubscribe(
+            "book_depth",
+            self.product_id,
+            callback=self._on_bookdepth_message
+        )
+
+    def _on_reconnect(self) -> None:
+        """Messages were lost while disconnected; the local book is stale."""
+        self.invalidate("WebSocket reconnected")
+
+    def invalidate(self, reason: str) -> None:
+        """
+        Discard the local book and rebuild it.
+
+        The book is cleared immediately (last_timestamp=0, so callers see it as
+        not warm). With a snapshot fetcher a resync task is started, unless one
+        is already running.
+
+        Args:
+            reason: Why the book is invalid (logged)
+        """
+        self.logger.warning(f"BookDepth product_id={self.product_id}: invalidating book ({reason})")
+        self._bids.clear()
+        self._asks.clear()
+        self._ladders.clear()
+        self._features = BookFeatures()
+        self.last_timestamp = 0
+        self._last_delta_timestamp = None
+
+        if self._snapshot_fetcher is not None and not self.is_resyncing:
+            self._pending_deltas = []
+            self._resync_task = asyncio.create_task(self._resync())
+
+    async def _resync(self) -> None:
+        """Load a REST snapshot, then replay buffered deltas newer than it."""
+        try:
+            snapshot_timestamp, bids, asks = await self._snapshot_fetcher()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Fall back to rebuilding from deltas; the next gap retries
+            self.logger.error(f"BookDepth product_id={self.product_id}: snapshot failed: {e}")
+            snapshot_timestamp, bids, asks = 0, [], []
+
+        self._bids.clear()
+        self._asks.clear()
+        self._ladders.clear()
+        for price, qty in bids:
+            if qty > 0:
+                self._bids[-decimal_to_x18(price)] = decimal_to_x18(qty)
+        for price, qty in asks:
+            if qty > 0:
+                self._asks[decimal_to_x18(price)] = decimal_to_x18(qty)
+        self.last_timestamp = snapshot_timestamp
+        self._update_features()
+
+        # Resync is over once the buffer is swapped out (the replay below never
+        # awaits, so live messages cannot interleave with it)
+        pending, self._pending_deltas = self._pending_deltas, []
+        self._resync_task = None
+        replayed = 0
+        for message in pending:
+            if int(message.get("max_timestamp", 0)) > snapshot_timestamp:
+                self._apply_delta(message)
+                replayed += 1
+
+        self.resync_count += 1
+        self.logger.info(
+            f"BookDepth product_id={self.product_id}: resynced from snapshot "
+            f"(ts={snapshot_timestamp}, bids={len(self._bids)}, asks={len(self._asks)}, "
+            f"replayed={replayed}/{len(pending)} deltas)"
+        )
+        await self._notify_callbacks()
+
     async def _on_bookdepth_message(self, message: Dict) -> None:
         """
         Process BookDepth message from WebSocket.
@@ -73,46 +364,147 @@ class BookDepthHandler:
             message: Raw message from WebSocket
         """
         try:
-            # Update timestamp
+            if self.is_resyncing:
+                self._pending_deltas.append(message)
+                return
+
             if "max_timestamp" in message:
-                self.last_timestamp = int(message["max_timestamp"])
+                # Already contained in the snapshot the book was loaded from
+                if int(message["max_timestamp"]) <= self.last_timestamp:
+                    return
+
+                # Gap: the previous message this one builds on was never applied
+                last_max = message.get("last_max_timestamp")
+                if (
+                    last_max is not None
+                    and self._last_delta_timestamp is not None
+                    and int(last_max) != self._last_delta_timestamp
+                ):
+                    self.invalidate(f"gap: last_max_timestamp={last_max}, have={self._last_delta_timestamp}")
+                    if self.is_resyncing:
+                        self._pending_deltas.append(message)
+                        return
+
+            self._apply_delta(message)
+            await self._notify_callbacks()
 
-            # Process bids (incremental deltas)
-            for price_str, qty_str in message.get("bids", []):
-                price = Decimal(price_str) / Decimal(1e18)
-                qty = Decimal(qty_str) / Decimal(1e18)
+        except (KeyError, ValueError) as e:
+            self.logger.error(f"Failed to parse BookDepth message: {e}")
 
-                if qty == 0:
-                    # Delete level
-                    self.bids.pop(price, None)
-                else:
-                    # Add/update level
-                    self.bids[price] = qty
+    def _apply_delta(self, message: Dict) -> None:
+        """Apply one incremental BookDepth message to the local book."""
+        self._ladders.clear()
+
+        # Update timestamp
+        if "max_timestamp" in message:
+            self.last_timestamp = int(message["max_timestamp"])
+            self._last_delta_timestamp = self.last_timestamp
+
+        # Process bids (incremental deltas, stored under -price)
+        bids = self._bids
+        for price_str, qty_str in message.get("bids", ()):
+            qty = int(qty_str)
+            if qty == 0:
+                # Delete level
+                bids.pop(-int(price_str), None)
+            else:
+                # Add/update level
+                bids[-int(price_str)] = qty
+
+        # Process asks (incremental deltas)
+        asks = self._asks
+        for price_str, qty_str in message.get("asks", ()):
+            qty = int(qty_str)
+            if qty == 0:
+                # Delete level
+                asks.pop(int(price_str), None)
+            else:
+                # Add/update level
+                asks[int(price_str)] = qty
+
+        self._update_features()
+
+    def _update_features(self) -> None:
+        """
+        Recompute top-of-book features for the current book.
 
-            # Process asks (incremental deltas)
-            for price_str, qty_str in message.get("asks", []):
-                price = Decimal(price_str) / Decimal(1e18)
-                qty = Decimal(qty_str) / Decimal(1e18)
+        Touches only the top FEATURE_LEVELS levels; band notionals are filled
+        in on first read (get_notional_within_bps) for the same book state.
+        """
+        bids, asks = self._bids, self._asks
+        features = BookFeatures()
 
-                if qty == 0:
-                    # Delete level
-                    self.asks.pop(price, None)
-                else:
-                    # Add/update level
-                    self.asks[price] = qty
-
-            # Call registered callbacks
-            for callback in self._callbacks:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback()
-                    else:
-                        callback()
-                except Exception as e:
-                    self.logger.error(f"Error in BookDepth callback: {e}")
+        n = self.FEATURE_LEVELS
+        features.bid_depth = sum(map(bids.__getitem__, bids.keys()[:n]))
+        features.ask_depth = sum(map(asks.__getitem__, asks.keys()[:n]))
 
-        except (KeyError, ValueError) as e:
-            self.logger.error(f"Failed to parse BookDepth message: {e}")
+        if bids:
+            neg_price, features.bid_qty = bids.peekitem(0)
+            features.bid_price = -neg_price
+        if asks:
+            features.ask_price, features.ask_qty = asks.peekitem(0)
+
+        self._features = features
+
+    def _band_notional(self, side: str, bands_bps, features: BookFeatures) -> Dict[int, int]:
+        """
+        Notional (price_x18 * qty_x18) of one side within each band of mid.
+
+        Walks only the levels inside the widest band, best first, with one
+        running sum for all bands.
+
+        Args:
+            side: "bid" or "ask"
+            bands_bps: Band widths in bps
+            features: Features holding the current best bid/ask
+
+        Returns:
+            Dict of bps -> notional (all 0 without both a bid and an ask)
+        """
+        bands = sorted(bands_bps)
+        if not features.bid_qty or not features.ask_qty:
+            return dict.fromkeys(bands, 0)
+
+        # price within b bps of mid, compared without division:
+        # bids: price * 20000 >= (bid + ask) * (10000 - b)
+        # asks: price * 20000 <= (bid + ask) * (10000 + b)
+        mid2 = features.bid_price + features.ask_price
+        notional: Dict[int, int] = {}
+        total = 0
+        band = 0
+        if side == "bid":
+            levels = self._bids
+            limits = [mid2 * (10000 - b) for b in bands]
+            # Keys are -price: -price <= -ceil(widest / 20000)
+            for key in levels.irange(maximum=(-limits[-1]) // 20000):
+                scaled = -key * 20000
+                while scaled < limits[band]:
+                    notional[bands[band]] = total
+                    band += 1
+                total -= key * levels[key]
+        else:  # ask
+            levels = self._asks
+            limits = [mid2 * (10000 + b) for b in bands]
+            for key in levels.irange(maximum=limits[-1] // 20000):
+                scaled = key * 20000
+                while scaled > limits[band]:
+                    notional[bands[band]] = total
+                    band += 1
+                total += key * levels[key]
+        for b in bands[band:]:
+            notional[b] = total
+        return notional
+
+    async def _notify_callbacks(self) -> None:
+        """Call registered update callbacks."""
+        for callback in self._callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback()
+                else:
+                    callback()
+            except Exception as e:
+                self.logger.error(f"Error in BookDepth callback: {e}")
 
     def get_best_bid(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
         """
@@ -121,10 +513,10 @@ class BookDepthHandler:
         Returns:
             Tuple of (price, quantity) or (None, None) if no bids
         """
-        if not self.bids:
+        if not self._bids:
             return None, None
-        best_price = next(iter(self.bids.keys()))
-        return best_price, self.bids[best_price]
+        neg_price, qty = self._bids.peekitem(0)
+        return x18_to_decimal(-neg_price), x18_to_decimal(qty)
 
     def get_best_ask(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
         """
@@ -133,10 +525,10 @@ class BookDepthHandler:
         Returns:
             Tuple of (price, quantity) or (None, None) if no asks
         """
-        if not self.asks:
+        if not self._asks:
             return None, None
-        best_price = next(iter(self.asks.keys()))
-        return best_price, self.asks[best_price]
+        price, qty = self._asks.peekitem(0)
+        return x18_to_decimal(price), x18_to_decimal(qty)
 
     def get_depth_at_level(
         self,
@@ -153,16 +545,65 @@ class BookDepthHandler:
         Returns:
             Tuple of (price, quantity) or (None, None) if level doesn't exist
         """
+        levels = self._bids if side == "bid" else self._asks
+        if level < 0 or level >= len(levels):
+            return None, None
+        key, qty = levels.peekitem(level)  # O(log n) positional lookup
+        price = -key if side == "bid" else key
+        return x18_to_decimal(price), x18_to_decimal(qty)
+
+    def iter_levels(
+        self,
+        side: str,
+        max_levels: Optional[int] = None
+    ) -> Iterator[Tuple[Decimal, Decimal]]:
+        """
+        Iterate (price, quantity) levels best first.
+
+        Only the levels consumed are converted, so the top N of a deep book
+        costs O(N).
+
+        Args:
+            side: "bid" or "ask"
+            max_levels: Stop after this many levels (None = whole side)
+
+        Yields:
+            (price, quantity) tuples
+        """
         if side == "bid":
-            if level >= len(self.bids):
-                return None, None
-            price = list(self.bids.keys())[level]
-            return price, self.bids[price]
+            for neg_price, qty in islice(self._bids.items(), max_levels):
+                yield x18_to_decimal(-neg_price), x18_to_decimal(qty)
         else:  # ask
-            if level >= len(self.asks):
-                return None, None
-            price = list(self.asks.keys())[level]
-            return price, self.asks[price]
+            for price, qty in islice(self._asks.items(), max_levels):
+                yield x18_to_decimal(price), x18_to_decimal(qty)
+
+    def get_top_levels(self, side: str, n: int) -> List[Tuple[Decimal, Decimal]]:
+        """
+        Get the best n levels of one side.
+
+        Args:
+            side: "bid" or "ask"
+            n: Number of levels
+
+        Returns:
+            List of (price, quantity), best first (shorter if the book is thinner)
+        """
+        return list(self.iter_levels(side, n))
+
+    def get_top_levels_x18(self, side: str, n: int) -> List[Tuple[int, int]]:
+        """
+        Get the best n levels of one side as raw x18 integers (no Decimal conversion).
+
+        Args:
+            side: "bid" or "ask"
+            n: Number of levels
+
+        Returns:
+            List of (price_x18, quantity_x18), best first
+        """
+        if side == "bid":
+            return [(-neg_price, qty) for neg_price, qty in islice(self._bids.items(), n)]
+        return list(islice(self._asks.items(), n))
 
     def estimate_slippage(
         self,
@@ -180,58 +621,92 @@ class BookDepthHandler:
             Slippage in basis points, or 999999 if insufficient liquidity
         """
         # Handle zero quantity - error condition
-        if quantity == 0:
+        quantity_x18 = decimal_to_x18(quantity)
+        if quantity_x18 == 0:
             return Decimal(999999)  # Error code: invalid quantity
 
-        if side == "buy":
-            best_price, _ = self.get_best_ask()
-            if best_price is None or best_price == 0:
-                return Decimal(999999)
+        ladder = self.get_depth_ladder(side)
+        if not ladder.prices:
+            return Decimal(999999)
+        best_price = ladder.prices[0]
+        if best_price == 0:
+            return Decimal(999999)
 
-            remaining = quantity
-            vwap = Decimal(0)
-            total_qty = Decimal(0)
+        notional = ladder.notional_for(quantity_x18)
+        if notional is None:
+            return Decimal(999999)  # Not enough liquidity
 
-            for price in sorted(self.asks.keys()):
-                if remaining <= 0:
-                    break
+        vwap = Decimal(notional) / quantity_x18
+        if side == "buy":
+            return (vwap - best_price) / best_price * 10000
+        return (best_price - vwap) / best_price * 10000
 
-                qty = min(remaining, self.asks[price])
-                vwap += price * qty
-                total_qty += qty
-                remaining -= qty
+    def get_depth_ladder(self, side: str) -> DepthLadder:
+        """
+        Get the cumulative depth of the side an order would fill against.
 
-            if total_qty < quantity:
-                return Decimal(999999)  # Not enough liquidity
+        Args:
+            side: "buy" (walks asks) or "sell" (walks bids)
 
-            vwap /= total_qty
-            slippage = (vwap - best_price) / best_price * 10000
-            return slippage
+        Returns:
+            DepthLadder, shared until the next book update
+        """
+        ladder = self._ladders.get(side)
+        if ladder is None:
+            if side == "buy":
+                ladder = DepthLadder(self._asks, 1)
+            else:  # sell
+                ladder = DepthLadder(self._bids, -1)
+            self._ladders[side] = ladder
+        return ladder
+
+    def get_vwap(self, side: str, quantity: Decimal) -> Optional[Decimal]:
+        """
+        Get the average fill price of a market order of the given size.
 
-        else:  # sell
-            best_price, _ = self.get_best_bid()
-            if best_price is None or best_price == 0:
-                return Decimal(999999)
+        Args:
+            side: "buy" or "sell"
+            quantity: Order quantity
 
-            remaining = quantity
-            vwap = Decimal(0)
-            total_qty = Decimal(0)
+        Returns:
+            VWAP, or None if quantity is not positive or exceeds the book
+        """
+        quantity_x18 = decimal_to_x18(quantity)
+        if quantity_x18 <= 0:
+            return None
+        notional = self.get_depth_ladder(side).notional_for(quantity_x18)
+        if notional is None:
+            return None
+        return x18_to_decimal(notional) / quantity_x18
+
+    def get_max_quantity_within_slippage(
+        self,
+        side: str,
+        max_slippage_bps
+    ) -> Decimal:
+        """
+        Get the largest order size whose slippage stays within max_slippage_bps.
 
-            for price in sorted(self.bids.keys(), reverse=True):
-                if remaining <= 0:
-                    break
+        Same slippage definition as estimate_slippage (VWAP vs best price).
 
-                qty = min(remaining, self.bids[price])
-                vwap += price * qty
-                total_qty += qty
-                remaining -= qty
+        Args:
+            side: "buy" or "sell"
+            max_slippage_bps: Maximum acceptable slippage in bps
 
-            if total_qty < quantity:
-                return Decimal(999999)
+        Returns:
+            Quantity (0 if the side is empty or max_slippage_bps is negative)
+        """
+        ladder = self.get_depth_ladder(side)
+        if not ladder.prices or max_slippage_bps < 0:
+            return Decimal(0)
 
-            vwap /= total_qty
-            slippage = (best_price - vwap) / best_price * 10000
-            return slippage
+        bps = Fraction(max_slippage_bps) / 10000
+        best_price = ladder.prices[0]
+        if side == "buy":
+            quantity_x18 = ladder.max_quantity_within(best_price * (1 + bps), ascending=True)
+        else:  # sell
+            quantity_x18 = ladder.max_quantity_within(best_price * (1 - bps), ascending=False)
+        return x18_to_decimal(quantity_x18)
 
     def get_available_liquidity(
         self,
@@ -248,20 +723,12 @@ class BookDepthHandler:
         Returns:
             Total liquidity quantity
         """
-        if side == "bid":
-            total = Decimal(0)
-            for i, (price, qty) in enumerate(self.bids.items()):
-                if i >= max_depth:
-                    break
-                total += qty
-            return total
-        else:
-            total = Decimal(0)
-            for i, (price, qty) in enumerate(self.asks.items()):
-                if i >= max_depth:
-                    break
-                total += qty
-            return total
+        if max_depth <= 0:
+            return Decimal(0)
+        cum_qty = self.get_depth_ladder("sell" if side == "bid" else "buy").cum_qty
+        if not cum_qty:
+            return Decimal(0)
+        return x18_to_decimal(cum_qty[min(max_depth, len(cum_qty)) - 1])
 
     def estimate_exit_capacity(
         self,
@@ -288,19 +755,9 @@ class BookDepthHandler:
 
         if slippage <= max_slippage_bps:
             return True, abs_position
-        else:
-            # Binary search for max exitable quantity
-            low, high = Decimal(0), abs_position
-            for _ in range(10):  # 10 iterations enough
-                mid = (low + high) / 2
-                slippage_mid = self.estimate_slippage(side, mid)
-
-                if slippage_mid <= max_slippage_bps:
-                    low = mid
-                else:
-                    high = mid
 
-            return False, low
+        exitable = self.get_max_quantity_within_slippage(side, max_slippage_bps)
+        return False, min(exitable, abs_position)
 
     def get_order_book_summary(self, max_levels: int = 5) -> Dict:
         """
@@ -315,25 +772,19 @@ class BookDepthHandler:
         best_bid, bid_qty = self.get_best_bid()
         best_ask, ask_qty = self.get_best_ask()
 
-        bid_levels = []
-        for i in range(min(max_levels, len(self.bids))):
-            price = list(self.bids.keys())[i]
-            qty = self.bids[price]
-            bid_levels.append({
-                "level": i,
-                "price": str(price),
-                "quantity": str(qty)
-            })
-
-        ask_levels = []
-        for i in range(min(max_levels, len(self.asks))):
-            price = list(self.asks.keys())[i]
-            qty = self.asks[price]
-            ask_levels.append({
-                "level": i,
-                "price": str(price),
-                "quantity": str(qty)
-            })
+        # Totals are order-independent: sum the plain dict values (C iteration)
+        # rather than SortedDict's sorted values view
+        total_bid_qty = sum(dict.values(self._bids))
+        total_ask_qty = sum(dict.values(self._asks))
+
+        bid_levels = [
+            {"level": i, "price": str(price), "quantity": str(qty)}
+            for i, (price, qty) in enumerate(self.iter_levels("bid", max_levels))
+        ]
+        ask_levels = [
+            {"level": i, "price": str(price), "quantity": str(qty)}
+            for i, (price, qty) in enumerate(self.iter_levels("ask", max_levels))
+        ]
 
         return {
             "product_id": self.product_id,
@@ -344,9 +795,105 @@ class BookDepthHandler:
             "spread": str(best_ask - best_bid) if best_bid and best_ask else None,
             "bid_levels": bid_levels,
             "ask_levels": ask_levels,
-            "total_bid_liquidity": str(sum(self.bids.values())),
-            "total_ask_liquidity": str(sum(self.asks.values()))
+            "total_bid_liquidity": str(x18_to_decimal(total_bid_qty)),
+            "total_ask_liquidity": str(x18_to_decimal(total_ask_qty))
+        }
+
+    def get_top_depth(self, side: str) -> Decimal:
+        """
+        Get the quantity in the top FEATURE_LEVELS levels of one side (O(1)).
+
+        Args:
+            side: "bid" or "ask"
+
+        Returns:
+            Total quantity
+        """
+        features = self._features
+        return x18_to_decimal(features.bid_depth if side == "bid" else features.ask_depth)
+
+    def get_imbalance(self) -> Optional[Decimal]:
+        """
+        Get the top-of-book order imbalance (O(1)).
+
+        (bid depth - ask depth) / (bid depth + ask depth) over the top
+        FEATURE_LEVELS levels; positive means more resting bids.
+
+        Returns:
+            Imbalance in [-1, 1], or None if the book is empty
+        """
+        features = self._features
+        total = features.bid_depth + features.ask_depth
+        if total == 0:
+            return None
+        return Decimal(features.bid_depth - features.ask_depth) / total
+
+    def get_microprice(self) -> Optional[Decimal]:
+        """
+        Get the size-weighted mid price of the best levels (O(1)).
+
+        (bid * ask_qty + ask * bid_qty) / (bid_qty + ask_qty): leans toward the
+        side with less resting size, where the price is more likely to move.
+
+        Returns:
+            Microprice, or None without both a bid and an ask
+        """
+        features = self._features
+        if not features.bid_qty or not features.ask_qty:
+            return None
+        numerator = features.bid_price * features.ask_qty + features.ask_price * features.bid_qty
+        return x18_to_decimal(numerator) / (features.bid_qty + features.ask_qty)
+
+    def get_notional_within_bps(self, side: str, bps: int) -> Decimal:
+        """
+        Get the quote notional resting within bps of mid on one side.
+
+        For the FEATURE_BANDS_BPS bands the levels inside the band are walked
+        once per book update and later reads are O(1); other widths walk them
+        on every call.
+
+        Args:
+            side: "bid" or "ask"
+            bps: Distance from mid in basis points
+
+        Returns:
+            Sum of price * quantity (0 without both a bid and an ask)
+        """
+        features = self._features
+        if bps not in self.FEATURE_BANDS_BPS:
+            notional = self._band_notional(side, (bps,), features)[bps]
+        elif side == "bid":
+            if features.bid_band_notional is None:
+                features.bid_band_notional = self._band_notional("bid", self.FEATURE_BANDS_BPS, features)
+            notional = features.bid_band_notional[bps]
+        else:  # ask
+            if features.ask_band_notional is None:
+                features.ask_band_notional = self._band_notional("ask", self.FEATURE_BANDS_BPS, features)
+            notional = features.ask_band_notional[bps]
+        return x18_to_decimal(notional) / X18
+
+    def get_features(self) -> Dict:
+        """
+        Get all top-of-book features.
+
+        Returns:
+            Dictionary with top depth per side, imbalance, microprice and
+            notional within each FEATURE_BANDS_BPS band
+        """
+        features = {
+            "bid_depth": self.get_top_depth("bid"),
+            "ask_depth": self.get_top_depth("ask"),
+            "imbalance": self.get_imbalance(),
+            "microprice": self.get_microprice(),
         }
+        for bps in self.FEATURE_BANDS_BPS:
+            features[f"bid_notional_{bps}bps"] = self.get_notional_within_bps("bid", bps)
+            features[f"ask_notional_{bps}bps"] = self.get_notional_within_bps("ask", bps)
+        return features
+
+    def is_stale(self) -> bool:
+        """Check whether BookDepth messages stopped arriving (see NadoWebSocketClient.is_stale)."""
+        return self.ws_client.is_stale("book_depth", self.product_id)
 
     def register_callback(self, callback) -> None:
         """
@@ -0,0 +1,129 @@
+"""
+Nado Dedupe Cache
+
+Bounded, time-indexed key store for fill-event deduplication and per-order
+fill state on long-running bots.
+
+Entries live in an OrderedDict ordered by last touch. Entries older than the
+horizon are popped from the front, and the least recently touched entries
+are evicted once max_size is exceeded. Add and lookup stay O(1) amortized,
+and memory stays bounded no matter how many cycles the bot runs.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Tuple
+
+
+class ExpiringDedupe:
+    """
+    Set/map of keys that are forgotten after a horizon (TTL + LRU bound).
+
+    Supports the set operations used for dedupe (add, in, discard) and map
+    lookups for state kept per key (get, pop, items):
+
+        seen = ExpiringDedupe(horizon_s=3600)
+        if event_key in seen:
+            return
+        seen.add(event_key)
+
+    Re-adding a key refreshes its age. Lookups do not.
+    """
+
+    def __init__(
+        self,
+        horizon_s: float = 3600.0,
+        max_size: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize dedupe cache.
+
+        Args:
+            horizon_s: Seconds an entry is kept after it was last added
+            max_size: Maximum entries (least recently added are evicted first)
+            clock: Monotonic time source
+        """
+        if horizon_s <= 0 or max_size <= 0:
+            raise ValueError("horizon_s and max_size must be positive")
+        self.horizon_s = horizon_s
+        self.max_size = max_size
+        self._clock = clock
+
+        # key -> (touched_at, value), oldest first
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        self.expired = 0
+        self.evicted = 0
+
+    def add(self, key: Hashable, value: Any = None) -> None:
+        """Insert or refresh a key (optionally storing a value with it)."""
+        now = self._clock()
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        self._prune(now)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value stored with a live key."""
+        entry = self._entries.get(key)
+        if entry is None or self._clock() - entry[0] > self.horizon_s:
+            return default
+        return entry[1]
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and self._clock() - entry[0] <= self.horizon_s
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value (default if absent or expired)."""
+        entry = self._entries.pop(key, None)
+        if entry is None or self._clock() - entry[0] > self.horizon_s:
+            return default
+        return entry[1]
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate (key, value) of live entries, oldest first."""
+        self._prune(self._clock())
+        for key, (_, value) in list(self._entries.items()):
+            yield key, value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        self._prune(self._clock())
+        return len(self._entries)
+
+    def _prune(self, now: float) -> None:
+        entries = self._entries
+        cutoff = now - self.horizon_s
+        while entries:
+            key, (touched_at, _) = next(iter(entries.items()))
+            if touched_at >= cutoff:
+                break
+            del entries[key]
+            self.expired += 1
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evicted += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with size, max_size, horizon_s, and the expired/evicted
+            counts since creation
+        """
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "horizon_s": self.horizon_s,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
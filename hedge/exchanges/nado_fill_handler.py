@@ -9,7 +9,125 @@ import asyncio
 import logging
 import time
 from decimal import Decimal
-from typing import Dict, Optional, Tuple, Callable
+from typing import Dict, Hashable, Optional, Set, Tuple, Callable
+
+from .nado_dedupe import ExpiringDedupe
+from .nado_message_decoder import X18
+from .nado_position_ledger import fill_key
+
+
+def _parse_quantity(value, always_x18: bool) -> Decimal:
+    """Parse a fill quantity/price field (x18 string; legacy fields may be plain decimals)."""
+    raw = Decimal(value)
+    if always_x18 or abs(raw) > 1000000:
+        return raw / X18
+    return raw
+
+
+class OrderFills:
+    """
+    Fill ledger entry of one order: totals across all of its (partial) fills.
+
+    Fields:
+        filled_quantity, notional, fee: Sums over the order's fills
+        fill_count: Number of fills applied
+        remaining_quantity: remaining_qty of the latest fill (None if the
+                            stream does not send it)
+        timestamp: Local time of the latest fill
+    """
+
+    __slots__ = (
+        "order_id", "filled_quantity", "notional", "fee", "fill_count", "remaining_quantity", "timestamp",
+        "_fill_indexes",
+    )
+
+    def __init__(self, order_id: str):
+        self.order_id = order_id
+        self.filled_quantity = Decimal(0)
+        self.notional = Decimal(0)
+        self.fee = Decimal(0)
+        self.fill_count = 0
+        self.remaining_quantity: Optional[Decimal] = None
+        self.timestamp = 0.0
+        self._fill_indexes: Set[Hashable] = set()
+
+    def add(
+        self,
+        quantity: Decimal,
+        price: Decimal,
+        fee: Decimal,
+        remaining_quantity: Optional[Decimal],
+        fill_index: Optional[Hashable] = None
+    ) -> bool:
+        """
+        Apply one fill.
+
+        Args:
+            fill_index: Index of the fill within the order (see
+                        nado_position_ledger.fill_key); None skips the check
+
+        Returns:
+            False if the fill was ignored as a replay (fill_index already
+            applied, or remaining_qty did not decrease), True otherwise
+        """
+        if fill_index is not None and fill_index in self._fill_indexes:
+            return False
+        if (
+            remaining_quantity is not None
+            and self.remaining_quantity is not None
+            and remaining_quantity >= self.remaining_quantity
+        ):
+            return False
+        self.filled_quantity += quantity
+        self.notional += quantity * price
+        self.fee += fee
+        self.fill_count += 1
+        if fill_index is not None:
+            self._fill_indexes.add(fill_index)
+        if remaining_quantity is not None:
+            self.remaining_quantity = remaining_quantity
+        self.timestamp = time.time()
+        return True
+
+    @property
+    def vwap(self) -> Decimal:
+        """Volume-weighted average fill price (0 before any fill)."""
+        return self.notional / self.filled_quantity if self.filled_quantity > 0 else Decimal(0)
+
+    def to_fill_info(self) -> Dict:
+        """Fill info dict as returned by FillHandler.get_fill_info()."""
+        return {
+            "order_id": self.order_id,
+            "filled_quantity": self.filled_quantity,
+            "price": self.vwap,
+            "fee": self.fee,
+            "fill_count": self.fill_count,
+            "timestamp": self.timestamp
+        }
+
+
+class FillFuture:
+    """
+    Awaitable completion of one tracked order (returned by FillHandler.track_order).
+
+    Awaiting it waits for the WebSocket fill that completes the order and
+    returns its fill info (cumulative filled_quantity, VWAP price), or None if
+    the order stops being tracked first. The event loop is only bound when
+    awaited, so callers that do not need it can ignore it.
+    """
+
+    __slots__ = ("order_id", "_handler")
+
+    def __init__(self, handler: "FillHandler", order_id: str):
+        self._handler = handler
+        self.order_id = order_id
+
+    def done(self) -> bool:
+        """True once the order is complete or no longer tracked."""
+        return not self._handler.is_pending(self.order_id)
+
+    def __await__(self):
+        return self._handler.wait_for_fill(self.order_id).__await__()
 
 
 class FillHandler:
@@ -26,7 +144,9 @@ class FillHandler:
         subaccount: str,
         ws_client,
         logger: Optional[logging.Logger] = None,
-        timeout_seconds: int = 30
+        timeout_seconds: int = 30,
+        ledger_horizon_seconds: float = 3600.0,
+        ledger_max_orders: int = 100_000
     ):
         """
         Initialize Fill handler.
@@ -37,6 +157,9 @@ class FillHandler:
             ws_client: WebSocket client instance
             logger: Optional logger instance
             timeout_seconds: Timeout for pending orders (default 30s)
+            ledger_horizon_seconds: Seconds an order's fill ledger is kept
+                                    after its last fill
+            ledger_max_orders: Maximum orders kept in the fill ledger
         """
         self.product_id = product_id
         self.subaccount = subaccount
@@ -44,11 +167,14 @@ class FillHandler:
         self.logger = logger or logging.getLogger(__name__)
         self.timeout_seconds = timeout_seconds
 
-        # Track pending orders: order_id -> {quantity, timestamp, fill_info}
+        # Track pending orders: order_id -> {quantity, timestamp, waiters}
         self._pending_orders: Dict[str, Dict] = {}
 
-        # Track completed orders: order_id -> fill_info
-        self._completed_orders: Dict[str, Dict] = {}
+        # Fill ledger of every order seen on the stream, tracked or not:
+        # order_id -> OrderFills (partial fills accumulate here). Also dedupes
+        # replayed fills; entries expire ledger_horizon_seconds after the
+        # order's last fill, so the ledger stays bounded on long runs.
+        self._fills = ExpiringDedupe(horizon_s=ledger_horizon_seconds, max_size=ledger_max_orders)
 
         # Callbacks for fill events
         self._fill_callbacks: list = []
@@ -63,72 +189,165 @@ class FillHandler:
         )
         self.logger.info(f"Fill handler started for product_id={self.product_id}, subaccount={self.subaccount[:10]}...")
 
+    async def stop(self) -> None:
+        """Stop receiving Fill stream messages (shared connection stays open)."""
+        await self.ws_client.unsubscribe(
+            "fill",
+            self.product_id,
+            callback=self._on_fill_message,
+            subaccount=self.subaccount
+        )
+
     async def _on_fill_message(self, message: Dict) -> None:
         """
         Process Fill message from WebSocket.
 
+        Nado fill messages carry order_digest, filled_qty (this fill),
+        remaining_qty, price and fee as x18 strings; order_id/filled_size are
+        accepted as well. Every fill is added to the order's ledger entry; a
+        tracked order completes when its cumulative fill reaches the tracked
+        quantity or remaining_qty reaches zero.
+
         Args:
             message: Raw message from WebSocket
         """
         try:
-            order_id = message.get("order_id")
+            order_id = message.get("order_digest") or message.get("order_id")
             if not order_id:
                 self.logger.warning(f"Fill message missing order_id: {message}")
                 return
 
-            # Parse filled size from x18 format
-            filled_size_x18 = message.get("filled_size", "0")
-            filled_quantity = Decimal(filled_size_x18) / Decimal(1e18) if int(filled_size_x18) > 1000000 else Decimal(filled_size_x18)
-
-            # Parse price from x18 format
-            price_x18 = message.get("price", "0")
-            price = Decimal(price_x18) / Decimal(1e18) if int(price_x18) > 1000000 else Decimal(price_x18)
-
-            fill_info = {
-                "order_id": order_id,
-                "filled_quantity": filled_quantity,
-                "price": price,
-                "timestamp": time.time()
-            }
-
-            # If this order was pending, move to completed
-            if order_id in self._pending_orders:
-                del self._pending_orders[order_id]
-                self._completed_orders[order_id] = fill_info
-                self.logger.info(f"Order {order_id[:10]}... filled: {filled_quantity} @ ${price}")
-
-                # Notify callbacks
-                for callback in self._fill_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(fill_info)
-                        else:
-                            callback(fill_info)
-                    except Exception as e:
-                        self.logger.error(f"Error in fill callback: {e}")
-
-            # Store fill info even if not tracked
+            is_x18 = "filled_qty" in message
+            if is_x18:
+                filled_quantity = _parse_quantity(message["filled_qty"], True)
             else:
-                self._completed_orders[order_id] = fill_info
+                filled_quantity = _parse_quantity(message.get("filled_size", "0"), False)
+            price = _parse_quantity(message.get("price", "0"), is_x18)
+            fee = _parse_quantity(message.get("fee", "0"), is_x18)
+            remaining_qty = message.get("remaining_qty")
+            remaining_quantity = _parse_quantity(remaining_qty, True) if remaining_qty is not None else None
+
+            fills = self._fills.get(order_id) or OrderFills(order_id)
+            if not fills.add(filled_quantity, price, fee, remaining_quantity, fill_key(message)[1]):
+                self.logger.debug(f"Ignoring replayed fill for order {order_id[:10]}...")
+                return
+            self._fills.add(order_id, fills)
+
+            pending = self._pending_orders.get(order_id)
+            if pending is None:
+                # Kept in the ledger even if not tracked (track_order picks it up)
                 self.logger.debug(f"Fill received for untracked order {order_id[:10]}...")
+                return
 
-        except (KeyError, ValueError) as e:
+            if not self._is_complete(fills, pending["quantity"]):
+                self.logger.info(
+                    f"Order {order_id[:10]}... partial fill: {filled_quantity} @ ${price} "
+                    f"({fills.filled_quantity}/{pending['quantity']})"
+                )
+                return
+
+            fill_info = self._complete_order(order_id)
+            self.logger.info(
+                f"Order {order_id[:10]}... filled: {fill_info['filled_quantity']} @ ${fill_info['price']} "
+                f"({fill_info['fill_count']} fills)"
+            )
+
+            # Notify callbacks
+            for callback in self._fill_callbacks:
+                try:
+                    if asyncio.iscoroutinefunction(callback):
+                        await callback(fill_info)
+                    else:
+                        callback(fill_info)
+                except Exception as e:
+                    self.logger.error(f"Error in fill callback: {e}")
+
+        except (KeyError, ValueError, ArithmeticError) as e:
             self.logger.error(f"Failed to parse Fill message: {e}")
 
-    def track_order(self, order_id: str, quantity: Decimal) -> None:
+    @staticmethod
+    def _is_complete(fills: OrderFills, quantity: Decimal) -> bool:
+        return fills.filled_quantity >= quantity or fills.remaining_quantity == 0
+
+    def _complete_order(self, order_id: str) -> Dict:
+        """Stop tracking a completed order and wake its waiters."""
+        pending = self._pending_orders.pop(order_id)
+        fill_info = self._fills.get(order_id).to_fill_info()
+        self._resolve_waiters(pending, fill_info)
+        return fill_info
+
+    @staticmethod
+    def _resolve_waiters(pending: Dict, result: Optional[Dict]) -> None:
+        for future in pending["waiters"]:
+            if not future.done():
+                future.set_result(result)
+
+    def track_order(self, order_id: str, quantity: Decimal) -> FillFuture:
         """
         Start tracking a pending order.
 
+        Fills that arrived before tracking started count towards it.
+
         Args:
             order_id: Order ID to track
             quantity: Expected fill quantity
+
+        Returns:
+            FillFuture resolving to the completed order's fill info
+            (cumulative filled_quantity, VWAP price, fee, fill_count)
         """
         self._pending_orders[order_id] = {
             "quantity": quantity,
-            "timestamp": time.time()
+            "timestamp": time.time(),
+            "waiters": []
         }
         self.logger.debug(f"Tracking order {order_id[:10]}... (qty: {quantity})")
 
+        fills = self._fills.get(order_id)
+        if fills is not None and self._is_complete(fills, quantity):
+            self._complete_order(order_id)
+
+        return FillFuture(self, order_id)
+
+    async def wait_for_fill(self, order_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Wait for a tracked order to complete.
+
+        Args:
+            order_id: Order ID passed to track_order
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            Fill info of the completed order; None on timeout or if the order
+            is not (or no longer) tracked
+        """
+        pending = self._pending_orders.get(order_id)
+        if pending is None:
+            return self.get_fill_info(order_id)
+
+        future = asyncio.get_running_loop().create_future()
+        pending["waiters"].append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if future in pending["waiters"]:
+                pending["waiters"].remove(future)
+
+    def untrack_order(self, order_id: str) -> Decimal:
+        """
+        Stop tracking an order (e.g. after it was cancelled); waiters get None.
+
+        Returns:
+            Quantity filled via WebSocket so far
+        """
+        pending = self._pending_orders.pop(order_id, None)
+        if pending is not None:
+            self._resolve_waiters(pending, None)
+        fills = self._fills.get(order_id)
+        return fills.filled_quantity if fills is not None else Decimal(0)
+
     def is_pending(self, order_id: str) -> bool:
         """Check if order is still pending."""
         return order_id in self._pending_orders
@@ -155,9 +374,26 @@ class FillHandler:
             order_id: Order ID
 
         Returns:
-            Fill info dict or None if not filled
+            Fill info dict (cumulative filled_quantity, VWAP price, fee,
+            fill_count) or None if not filled or still pending
+        """
+        if order_id in self._pending_orders:
+            return None
+        fills = self._fills.get(order_id)
+        return fills.to_fill_info() if fills is not None else None
+
+    def get_order_fills(self, order_id: str) -> Optional[OrderFills]:
+        """
+        Get the fill ledger entry of an order, including partial fills of
+        orders still pending.
+
+        Args:
+            order_id: Order ID
+
+        Returns:
+            OrderFills or None if no fill was received for the order
         """
-        return self._completed_orders.get(order_id)
+        return self._fills.get(order_id)
 
     def register_callback(self, callback: Callable) -> None:
         """Register callback for fill events."""
@@ -174,7 +410,7 @@ class FillHandler:
         for order_id in list(self._pending_orders.keys()):
             if self.is_timed_out(order_id):
                 timed_out.append(order_id)
-                del self._pending_orders[order_id]
+                self._resolve_waiters(self._pending_orders.pop(order_id), None)
 
         if timed_out:
             self.logger.warning(f"{len(timed_out)} orders timed out")
@@ -185,6 +421,16 @@ class FillHandler:
         """Get number of pending orders."""
         return len(self._pending_orders)
 
+    def get_ledger_stats(self) -> Dict:
+        """
+        Get fill ledger statistics.
+
+        Returns:
+            Dict with size (orders kept), max_size, horizon_s and the
+            expired/evicted counts
+        """
+        return self._fills.get_stats()
+
     def clear_completed(self, older_than_seconds: int = 3600) -> int:
         """
         Clear old completed orders from memory.
@@ -198,9 +444,9 @@ class FillHandler:
         cutoff = time.time() - older_than_seconds
         cleared = 0
 
-        for order_id in list(self._completed_orders.keys()):
-            if self._completed_orders[order_id]["timestamp"] < cutoff:
-                del self._completed_orders[order_id]
+        for order_id, fills in self._fills.items():
+            if order_id not in self._pending_orders and fills.timestamp < cutoff:
+                self._fills.discard(order_id)
                 cleared += 1
 
         if cleared > 0:
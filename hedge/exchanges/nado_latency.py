@@ -0,0 +1,143 @@
+"""
+Nado WebSocket Latency Histograms
+
+Fixed-bucket latency histograms for the Nado stream pipeline. Recording is a
+bisect over a short bucket list plus a few integer updates, cheap enough to
+run for every message.
+
+Stages recorded per stream type by NadoWebSocketClient:
+- exchange_to_receive: exchange timestamp -> local receive (wall clock, so it
+  includes any clock offset between the exchange and this host)
+- receive_to_parsed: frame received -> decoded
+- parsed_to_handled: decoded -> last callback returned (includes the wait on
+  the dispatch lane; for coalesced BookDepth, from the oldest merged delta)
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+# Bucket upper bounds in microseconds (last bucket is open-ended)
+LATENCY_BUCKETS_US = (
+    50, 100, 250, 500,
+    1_000, 2_500, 5_000, 10_000, 25_000, 50_000,
+    100_000, 250_000, 500_000, 1_000_000, 2_500_000, 5_000_000,
+)
+
+STAGES = ("exchange_to_receive", "receive_to_parsed", "parsed_to_handled")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (microsecond resolution)."""
+
+    def __init__(self, buckets_us=LATENCY_BUCKETS_US):
+        self.buckets_us = tuple(buckets_us)
+        self.counts: List[int] = [0] * (len(self.buckets_us) + 1)
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+        self.min_us: Optional[int] = None
+
+    def record_ns(self, value_ns: int) -> None:
+        """Record one latency sample given in nanoseconds (negatives count as 0)."""
+        value_us = value_ns // 1000 if value_ns > 0 else 0
+        self.counts[bisect_left(self.buckets_us, value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+
+    def percentile(self, pct: float) -> Optional[int]:
+        """
+        Estimate a percentile as the upper bound of the bucket containing it.
+
+        Args:
+            pct: Percentile in [0, 100]
+
+        Returns:
+            Latency in microseconds (capped at the observed max), or None if empty
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, int(self.count * pct / 100 + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.buckets_us):
+                    return min(self.buckets_us[index], self.max_us)
+                return self.max_us
+        return self.max_us
+
+    def fraction_above(self, threshold_us: int) -> float:
+        """Fraction of samples in buckets entirely above threshold_us."""
+        if self.count == 0:
+            return 0.0
+        first = bisect_left(self.buckets_us, threshold_us) + 1
+        return sum(self.counts[first:]) / self.count
+
+    def reset(self) -> None:
+        """Clear all samples."""
+        self.counts = [0] * (len(self.buckets_us) + 1)
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+        self.min_us = None
+
+    def summary(self) -> Dict:
+        """Get count, mean, min, max and p50/p90/p99 (microseconds)."""
+        return {
+            "count": self.count,
+            "mean_us": self.total_us / self.count if self.count else None,
+            "min_us": self.min_us,
+            "max_us": self.max_us if self.count else None,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+        }
+
+
+class StreamLatencyStats:
+    """Per stream type histograms for each pipeline stage."""
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    def histograms_for(self, stream_type: str) -> Dict[str, LatencyHistogram]:
+        """Get (creating on first use) the stage histograms of a stream type."""
+        histograms = self._histograms.get(stream_type)
+        if histograms is None:
+            histograms = {stage: LatencyHistogram() for stage in STAGES}
+            self._histograms[stream_type] = histograms
+        return histograms
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict]]:
+        """Get {stream_type: {stage: summary}}."""
+        return {
+            stream_type: {stage: hist.summary() for stage, hist in histograms.items()}
+            for stream_type, histograms in self._histograms.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all histograms."""
+        for histograms in self._histograms.values():
+            for hist in histograms.values():
+                hist.reset()
+
+    def format_summary(self) -> str:
+        """One-line p50/p99 summary per stream and stage (milliseconds)."""
+        def ms(value_us: Optional[int]) -> str:
+            return "-" if value_us is None else f"{value_us / 1000:.2f}"
+
+        parts = []
+        for stream_type, histograms in sorted(self._histograms.items()):
+            count = histograms["receive_to_parsed"].count
+            if count == 0:
+                continue
+            stages = " ".join(
+                f"{stage}={ms(hist.percentile(50))}/{ms(hist.percentile(99))}"
+                for stage, hist in histograms.items()
+            )
+            parts.append(f"{stream_type}[n={count}] {stages}")
+        return "; ".join(parts)
@@ -0,0 +1,121 @@
+"""
+Nado WebSocket Message Decoder
+
+Pluggable JSON decoding for Nado stream frames.
+
+Backends (fastest available is used by default):
+- msgspec: msgspec.json.Decoder (optional dependency)
+- orjson: orjson.loads (optional dependency)
+- json: stdlib json.loads (always available)
+
+All backends return plain dicts so stream handlers work unchanged whichever
+backend is active. Also provides the shared x18 -> Decimal conversion used by
+the handlers, so the 1e18 divisor is built once instead of per field.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+
+# Nado encodes prices and quantities as 18-decimal fixed point strings
+X18 = Decimal(10 ** 18)
+
+
+def x18_to_decimal(value: Union[str, int]) -> Decimal:
+    """Convert an x18 fixed point value (string or int) to Decimal."""
+    return Decimal(value) / X18
+
+
+def decimal_to_x18(value: Union[Decimal, str, int]) -> int:
+    """Convert a Decimal (or numeric string/int) to an x18 integer, truncating beyond 18 decimals."""
+    return int(Decimal(value) * X18)
+
+
+class JsonDecoder:
+    """Stdlib json decoder (fallback, always available)."""
+
+    name = "json"
+    decode_errors: Tuple[type, ...] = (ValueError,)
+
+    def decode(self, frame: Union[str, bytes]) -> Dict[str, Any]:
+        return json.loads(frame)
+
+
+class OrjsonDecoder:
+    """orjson decoder."""
+
+    name = "orjson"
+    decode_errors: Tuple[type, ...] = (ValueError,)
+
+    def __init__(self):
+        if not ORJSON_AVAILABLE:
+            raise ImportError("orjson library is required. Install with: pip install orjson")
+        self.decode = orjson.loads
+
+
+class MsgspecDecoder:
+    """msgspec JSON decoder (untyped, decodes to dicts)."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec library is required. Install with: pip install msgspec")
+        self.decode = msgspec.json.Decoder().decode
+        self.decode_errors: Tuple[type, ...] = (ValueError, msgspec.DecodeError)
+
+
+DECODERS = {
+    "msgspec": MsgspecDecoder,
+    "orjson": OrjsonDecoder,
+    "json": JsonDecoder,
+}
+
+
+def available_decoders() -> list:
+    """Get names of decoder backends usable in this environment, fastest first."""
+    names = []
+    if MSGSPEC_AVAILABLE:
+        names.append("msgspec")
+    if ORJSON_AVAILABLE:
+        names.append("orjson")
+    names.append("json")
+    return names
+
+
+def get_decoder(name: Optional[str] = None):
+    """
+    Create a decoder backend.
+
+    Args:
+        name: "msgspec", "orjson" or "json"; None picks the fastest available
+
+    Returns:
+        Decoder with decode(frame) -> dict and a decode_errors tuple
+
+    Raises:
+        ValueError: If name is not a known backend
+        ImportError: If the requested backend is not installed
+    """
+    if name is None:
+        name = available_decoders()[0]
+
+    if name not in DECODERS:
+        raise ValueError(f"Invalid decoder: {name}. Must be one of {list(DECODERS)}")
+
+    return DECODERS[name]()
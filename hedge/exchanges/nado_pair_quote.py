@@ -0,0 +1,218 @@
+"""
+Nado Pair Quote Aggregator
+
+Joins the BBO streams of two products (e.g. ETH/SOL) into one synchronized
+pair view. Each leg keeps its latest BBOData snapshot with its exchange
+timestamp; on every tick of either leg one immutable PairQuote is published
+carrying both legs, their skew and the pair ratio/spread.
+"""
+
+import time
+from decimal import Decimal
+from typing import Dict, Optional
+
+from .nado_bbo_handler import BBOData, BBOHandler, RollingStats
+
+NS_PER_MS = 1_000_000
+
+
+class PairQuote:
+    """
+    Immutable joint snapshot of two legs' BBOs.
+
+    Fields:
+        leg_a, leg_b: Latest BBOData of each leg
+        skew_ns: How far apart in time the legs' quotes are known to hold
+                 (defaults to timestamp_skew_ns; see PairQuoteAggregator)
+        ratio: leg_a mid / leg_b mid
+        ratio_spread_bps: Deviation of ratio from its rolling mean in bps
+                          (None until two ratios have been seen)
+    """
+
+    __slots__ = ("leg_a", "leg_b", "skew_ns", "ratio", "ratio_spread_bps")
+
+    def __init__(
+        self,
+        leg_a: BBOData,
+        leg_b: BBOData,
+        ratio: Decimal,
+        ratio_spread_bps: Optional[float] = None,
+        skew_ns: Optional[int] = None
+    ):
+        set_field = object.__setattr__
+        set_field(self, "leg_a", leg_a)
+        set_field(self, "leg_b", leg_b)
+        set_field(self, "skew_ns", abs(leg_a.timestamp - leg_b.timestamp) if skew_ns is None else skew_ns)
+        set_field(self, "ratio", ratio)
+        set_field(self, "ratio_spread_bps", ratio_spread_bps)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PairQuote is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("PairQuote is immutable")
+
+    @property
+    def skew_ms(self) -> float:
+        """Leg timestamp skew in milliseconds."""
+        return self.skew_ns / NS_PER_MS
+
+    @property
+    def timestamp_skew_ns(self) -> int:
+        """Absolute difference of the legs' exchange timestamps (ns)."""
+        return abs(self.leg_a.timestamp - self.leg_b.timestamp)
+
+    @property
+    def timestamp(self) -> int:
+        """Exchange timestamp of the newer leg (ns)."""
+        return max(self.leg_a.timestamp, self.leg_b.timestamp)
+
+    def is_synchronized(self, max_skew_ms: Optional[float]) -> bool:
+        """
+        Check whether the legs are close enough in time for a pair decision.
+
+        Args:
+            max_skew_ms: Maximum leg skew in ms (None = no limit)
+        """
+        return max_skew_ms is None or self.skew_ns <= max_skew_ms * NS_PER_MS
+
+    def __repr__(self) -> str:
+        return (
+            f"PairQuote(a={self.leg_a.product_id}@{self.leg_a.mid_price}, "
+            f"b={self.leg_b.product_id}@{self.leg_b.mid_price}, "
+            f"skew_ms={self.skew_ms:.3f}, ratio={self.ratio})"
+        )
+
+
+class PairQuoteAggregator:
+    """
+    Maintain a synchronized pair quote from two BBOHandlers.
+
+    Usage:
+        pair = PairQuoteAggregator(eth_handler, sol_handler)
+        pair.start()
+        quote = pair.get_quote(max_skew_ms=250)
+        if quote is not None:
+            eth_bbo, sol_bbo = quote.leg_a, quote.leg_b
+
+    Only the leg that ticked is replaced; the ratio and its rolling stats are
+    updated once per tick, so readers never recompute pair state.
+
+    BBO is only sent when the book top changes, so a quiet leg's exchange
+    timestamp ages although its quote still holds. While both legs' streams
+    are live (BBOHandler.is_stale() is False) the quote's skew is therefore
+    the difference of the legs' feed lag (local receive time minus exchange
+    timestamp of their last ticks), which does not grow while a leg is quiet.
+    Otherwise, e.g. for legs seeded at start(), it is the exchange timestamp
+    difference.
+    """
+
+    def __init__(
+        self,
+        handler_a: BBOHandler,
+        handler_b: BBOHandler,
+        window_size: int = 100,
+        ewma_alpha: Optional[float] = None
+    ):
+        """
+        Initialize pair quote aggregator.
+
+        Args:
+            handler_a: First leg BBO handler (e.g. ETH)
+            handler_b: Second leg BBO handler (e.g. SOL)
+            window_size: Number of pair ticks in the ratio rolling window
+            ewma_alpha: Optional EWMA smoothing factor for the ratio
+        """
+        self.handler_a = handler_a
+        self.handler_b = handler_b
+
+        self.ratio_stats = RollingStats(window_size, ewma_alpha)
+
+        self._bbo_a: Optional[BBOData] = None
+        self._bbo_b: Optional[BBOData] = None
+        # Feed lag of each leg's last tick: time.time_ns() at receipt minus its
+        # exchange timestamp (None until the leg ticks after start())
+        self._lag_a: Optional[int] = None
+        self._lag_b: Optional[int] = None
+        self._latest_quote: Optional[PairQuote] = None
+        self._started = False
+
+    def start(self) -> None:
+        """Seed legs from the handlers' latest snapshots and follow their ticks."""
+        if self._started:
+            return
+        self._bbo_a = self.handler_a.get_latest_bbo()
+        self._bbo_b = self.handler_b.get_latest_bbo()
+        self._publish()
+        self.handler_a.add_tick_listener(self._on_tick_a)
+        self.handler_b.add_tick_listener(self._on_tick_b)
+        self._started = True
+
+    def stop(self) -> None:
+        """Stop following the handlers (the last quote stays readable)."""
+        if not self._started:
+            return
+        self.handler_a.remove_tick_listener(self._on_tick_a)
+        self.handler_b.remove_tick_listener(self._on_tick_b)
+        self._started = False
+
+    def _on_tick_a(self, bbo: BBOData) -> None:
+        self._bbo_a = bbo
+        self._lag_a = time.time_ns() - bbo.timestamp
+        self._publish()
+
+    def _on_tick_b(self, bbo: BBOData) -> None:
+        self._bbo_b = bbo
+        self._lag_b = time.time_ns() - bbo.timestamp
+        self._publish()
+
+    def _skew_ns(self, bbo_a: BBOData, bbo_b: BBOData) -> int:
+        """Leg skew: feed lag difference while both legs are live, else timestamp difference."""
+        lag_a, lag_b = self._lag_a, self._lag_b
+        if (
+            lag_a is not None and lag_b is not None
+            and not self.handler_a.is_stale() and not self.handler_b.is_stale()
+        ):
+            return abs(lag_a - lag_b)
+        return abs(bbo_a.timestamp - bbo_b.timestamp)
+
+    def _publish(self) -> None:
+        """Build the pair quote for the current legs (one reference swap)."""
+        bbo_a, bbo_b = self._bbo_a, self._bbo_b
+        if bbo_a is None or bbo_b is None or bbo_a.mid_price <= 0 or bbo_b.mid_price <= 0:
+            return
+
+        ratio = bbo_a.mid_price / bbo_b.mid_price
+        ratio_float = float(ratio)
+        self.ratio_stats.update(ratio_float)
+
+        ratio_spread_bps = None
+        if self.ratio_stats.count > 1:
+            ratio_spread_bps = (ratio_float / self.ratio_stats.mean - 1) * 10000
+
+        self._latest_quote = PairQuote(bbo_a, bbo_b, ratio, ratio_spread_bps, self._skew_ns(bbo_a, bbo_b))
+
+    def get_quote(self, max_skew_ms: Optional[float] = None) -> Optional[PairQuote]:
+        """
+        Get the latest pair quote.
+
+        Args:
+            max_skew_ms: Reject the quote if the legs' skew exceeds this
+                         (None = no limit)
+
+        Returns:
+            PairQuote, or None if a leg has no data or skew exceeds max_skew_ms
+        """
+        quote = self._latest_quote
+        if quote is None or not quote.is_synchronized(max_skew_ms):
+            return None
+        return quote
+
+    def get_ratio_stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get rolling pair ratio analytics (float64, maintained per tick).
+
+        Returns:
+            Dict with count, mean, stdev and ewma of leg_a mid / leg_b mid
+        """
+        return self.ratio_stats.summary()
@@ -10,6 +10,8 @@ import logging
 from decimal import Decimal
 from typing import Dict, Optional, List, Callable
 
+from .nado_message_decoder import X18
+
 
 class PositionChangeHandler:
     """
@@ -58,6 +60,15 @@ class PositionChangeHandler:
         )
         self.logger.info(f"PositionChange handler started for product_id={self.product_id}")
 
+    async def stop(self) -> None:
+        """Stop receiving PositionChange stream messages (shared connection stays open)."""
+        await self.ws_client.unsubscribe(
+            "position_change",
+            self.product_id,
+            callback=self._on_position_message,
+            subaccount=self.subaccount
+        )
+
     async def _on_position_message(self, message: Dict) -> None:
         """
         Process PositionChange message from WebSocket.
@@ -73,7 +84,7 @@ class PositionChangeHandler:
 
             # Parse position size from x18 format
             position_size_x18 = message.get("position_size", "0")
-            new_position = Decimal(position_size_x18) / Decimal(1e18) if int(position_size_x18) > 1000000 else Decimal(position_size_x18)
+            new_position = Decimal(position_size_x18) / X18 if int(position_size_x18) > 1000000 else Decimal(position_size_x18)
 
             old_position = self._current_position
             self._current_position = new_position
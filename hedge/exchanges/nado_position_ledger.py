@@ -0,0 +1,439 @@
+"""
+Nado Position Ledger
+
+Single source of truth for the position of one (subaccount, product), fed by:
+
+- fills: signed deltas from the Fill stream, applied once per
+  (order digest, fill index)
+- bridged order results: provisional deltas applied as soon as an order
+  result reports a fill, absorbed by that order's fills when they arrive
+- REST: PositionReconciler compares the ledger with the REST position in the
+  background, alerts on drift and adopts REST once the drift is confirmed
+
+Reading a position is an attribute lookup; nothing on the read path touches
+the network. Tasks that need a position state await it with wait_for(),
+which wakes on the change that satisfies the predicate.
+"""
+
+import asyncio
+import logging
+from collections.abc import MutableMapping
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .nado_dedupe import ExpiringDedupe
+
+ZERO = Decimal(0)
+DUST = Decimal("0.001")
+
+PositionPredicate = Callable[[Decimal], bool]
+
+
+def flat(tolerance: Decimal = DUST) -> PositionPredicate:
+    """Predicate: position is zero up to dust."""
+    return lambda position: abs(position) <= tolerance
+
+
+def near(target: Decimal, tolerance: Decimal = DUST) -> PositionPredicate:
+    """Predicate: position is within tolerance of target."""
+    return lambda position: abs(position - target) <= tolerance
+
+
+def fill_key(message: Dict) -> Tuple[Optional[str], Hashable]:
+    """
+    (order digest, fill index) identifying one Fill stream message.
+
+    submission_idx identifies the submitting transaction, not the match: a
+    taker order crossing several makers in one transaction gets one fill per
+    maker under the same submission_idx. An order's remaining_qty strictly
+    decreases across its fills, so the index is (submission_idx,
+    remaining_qty, filled_qty, price, timestamp); legacy messages without
+    remaining_qty fall back on the rest (filled_size for filled_qty).
+    """
+    order_digest = message.get("order_digest") or message.get("order_id")
+    filled = message.get("filled_qty", message.get("filled_size"))
+    fill_index = (
+        message.get("submission_idx"),
+        message.get("remaining_qty"),
+        filled,
+        message.get("price"),
+        message.get("timestamp"),
+    )
+    return order_digest, fill_index
+
+
+def _overlap(provisional: Decimal, delta: Decimal) -> Decimal:
+    """Part of delta already covered by a same-direction provisional delta."""
+    if provisional > 0 and delta > 0:
+        return min(provisional, delta)
+    if provisional < 0 and delta < 0:
+        return max(provisional, delta)
+    return ZERO
+
+
+class PositionLedger:
+    """
+    Position of one (subaccount, product).
+
+    Fills and bridged order results update one running position, so reads are
+    O(1). Per order, the bridged quantity not yet seen in fills is kept so its
+    fills are absorbed instead of counted twice.
+    """
+
+    def __init__(
+        self,
+        product_id: Optional[int] = None,
+        subaccount: Optional[str] = None,
+        dedupe_horizon_s: float = 3600.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize position ledger.
+
+        Args:
+            product_id: Product ID (4 for ETH, 8 for SOL)
+            subaccount: Subaccount hex string
+            dedupe_horizon_s: Seconds applied fill keys and unconfirmed
+                              bridged quantities are remembered
+            logger: Optional logger instance
+        """
+        self.product_id = product_id
+        self.subaccount = subaccount
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._position = ZERO
+        self._seen_fills = ExpiringDedupe(horizon_s=dedupe_horizon_s)
+        # order_id -> signed fill total / bridged quantity not yet seen in fills
+        self._order_filled = ExpiringDedupe(horizon_s=dedupe_horizon_s)
+        self._unconfirmed = ExpiringDedupe(horizon_s=dedupe_horizon_s)
+
+        self.version = 0  # Incremented on every change
+        self.last_source: Optional[str] = None
+        self.last_drift: Optional[Decimal] = None
+
+        # wait_for() waiters: (predicate, future), checked on every change
+        self._waiters: List[Tuple[PositionPredicate, asyncio.Future]] = []
+
+    @property
+    def position(self) -> Decimal:
+        """Current position (fills, bridged results and REST adoptions)."""
+        return self._position
+
+    @property
+    def provisional_position(self) -> Decimal:
+        """Bridged quantity still waiting for its fills."""
+        return sum((quantity for _, quantity in self._unconfirmed.items()), ZERO)
+
+    def apply_fill(self, order_id: Optional[str], fill_index: Hashable, delta: Decimal) -> bool:
+        """
+        Apply one fill's signed quantity.
+
+        A fill of a bridged order first confirms the bridged quantity; only
+        the part beyond it changes position.
+
+        Args:
+            order_id: Order digest
+            fill_index: Index of the fill within the order (see fill_key)
+            delta: Signed filled quantity (+ buy, - sell)
+
+        Returns:
+            False if the fill was already applied, True otherwise
+        """
+        key = (order_id, fill_index)
+        if key in self._seen_fills:
+            return False
+        self._seen_fills.add(key)
+
+        absorbed = ZERO
+        if order_id is not None:
+            self._order_filled.add(order_id, self._order_filled.get(order_id, ZERO) + delta)
+            unconfirmed = self._unconfirmed.get(order_id)
+            if unconfirmed is not None:
+                absorbed = _overlap(unconfirmed, delta)
+                if unconfirmed - absorbed:
+                    self._unconfirmed.add(order_id, unconfirmed - absorbed)
+                else:
+                    self._unconfirmed.discard(order_id)
+
+        if delta != absorbed:
+            self._position += delta - absorbed
+            self._changed("fill")
+        return True
+
+    def apply_bridged(self, order_id: Optional[str], delta: Decimal) -> Decimal:
+        """
+        Apply an order result's filled quantity before its fills arrive.
+
+        Idempotent per order: bridging the same order again replaces its
+        earlier bridged quantity, and fills already applied for the order
+        are not counted twice.
+
+        Args:
+            order_id: Order digest (None if the result carries none; its
+                      fills cannot be matched and count again)
+            delta: Signed cumulative filled quantity of the order
+
+        Returns:
+            Change of position
+        """
+        if order_id is None:
+            self._position += delta
+            self._changed("bridge")
+            return delta
+
+        already_filled = self._order_filled.get(order_id, ZERO)
+        unconfirmed = delta - _overlap(delta, already_filled)
+        previous = self._unconfirmed.pop(order_id, ZERO)
+        if unconfirmed:
+            self._unconfirmed.add(order_id, unconfirmed)
+        change = unconfirmed - previous
+        if change:
+            self._position += change
+            self._changed("bridge")
+        return change
+
+    def set_position(self, position: Decimal, source: str = "override") -> None:
+        """
+        Set the position from an authoritative source (REST snapshot).
+
+        Unconfirmed bridged quantities are kept, so their late fills are
+        absorbed rather than counted on top of a snapshot that includes them.
+        """
+        self._position = position
+        self._changed(source)
+
+    def reconcile(self, rest_position: Decimal, tolerance: Decimal = Decimal("0.001")) -> Decimal:
+        """
+        Compare with a REST position and adopt it if they differ.
+
+        Returns:
+            Signed drift (rest - ledger) before adopting
+        """
+        drift = rest_position - self._position
+        self.last_drift = drift
+        if abs(drift) > tolerance:
+            self.set_position(rest_position, "rest")
+        return drift
+
+    def _changed(self, source: str) -> None:
+        self.version += 1
+        self.last_source = source
+        if self._waiters:
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        position = self._position
+        pending = []
+        for predicate, future in self._waiters:
+            if future.done():
+                continue
+            try:
+                satisfied = predicate(position)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            if satisfied:
+                future.set_result(True)
+            else:
+                pending.append((predicate, future))
+        self._waiters = pending
+
+    async def wait_for(self, predicate: PositionPredicate, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until predicate(position) holds.
+
+        The predicate is checked immediately and then on every position
+        change, so the waiter wakes on the delta that satisfies it. Any
+        number of tasks can wait at once.
+
+        Args:
+            predicate: Called with the position, e.g. flat() or near(target)
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            True if the predicate held, False on timeout
+        """
+        if predicate(self._position):
+            return True
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((predicate, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if not future.done():
+                future.cancel()
+            self._waiters = [waiter for waiter in self._waiters if waiter[1] is not future]
+
+    def get_dedupe_stats(self) -> Dict:
+        """Get stats of the applied-fill dedupe cache."""
+        return self._seen_fills.get_stats()
+
+    def get_stats(self) -> Dict:
+        """
+        Get ledger state.
+
+        Returns:
+            Dict with position, provisional, unconfirmed_orders, version,
+            last_source, last_drift and waiters
+        """
+        return {
+            "position": self._position,
+            "provisional": self.provisional_position,
+            "unconfirmed_orders": len(self._unconfirmed),
+            "version": self.version,
+            "last_source": self.last_source,
+            "last_drift": self.last_drift,
+            "waiters": len(self._waiters),
+        }
+
+
+class PositionLedgerView(MutableMapping):
+    """
+    Dict-like {name: position} view over several ledgers.
+
+    Reads return ledger.position; assignments call set_position(), so code
+    that treats positions as a dict keeps working against the ledgers.
+    """
+
+    def __init__(self, ledgers: Dict[str, PositionLedger]):
+        self._ledgers = ledgers
+
+    def __getitem__(self, name: str) -> Decimal:
+        return self._ledgers[name].position
+
+    def __setitem__(self, name: str, position: Decimal) -> None:
+        self._ledgers[name].set_position(Decimal(position))
+
+    def __delitem__(self, name: str) -> None:
+        raise TypeError("Ledger positions cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ledgers)
+
+    def __len__(self) -> int:
+        return len(self._ledgers)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    async def wait_for(self, name: str, predicate: PositionPredicate, timeout: Optional[float] = None) -> bool:
+        """Wait until predicate holds for one ledger's position (see PositionLedger.wait_for)."""
+        return await self._ledgers[name].wait_for(predicate, timeout)
+
+
+class PositionReconciler:
+    """
+    Periodic REST reconciliation of position ledgers.
+
+    Usage:
+        reconciler = PositionReconciler({"ETH": (eth_ledger, eth_client.get_account_positions)})
+        await reconciler.start()
+        ...
+        await reconciler.stop()
+
+    A round is skipped for a ledger that changed while its REST request was
+    in flight. Drift beyond the tolerance is logged on every round; REST is
+    adopted (and on_drift called) once the drift has been seen on
+    `confirmations` consecutive rounds, so fills racing the REST snapshot do
+    not move the ledger.
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, Tuple[PositionLedger, Callable[[], Awaitable[Decimal]]]],
+        interval_s: float = 30.0,
+        tolerance: Decimal = Decimal("0.001"),
+        confirmations: int = 2,
+        on_drift: Optional[Callable[[str, Decimal, Decimal], None]] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize position reconciler.
+
+        Args:
+            sources: name -> (ledger, coroutine function returning the REST position)
+            interval_s: Seconds between reconciliation rounds
+            tolerance: Drift ignored as rounding
+            confirmations: Consecutive drifting rounds before REST is adopted
+            on_drift: Called with (name, ledger position, REST position) when
+                      REST is adopted
+            logger: Optional logger instance
+        """
+        self.sources = sources
+        self.interval_s = interval_s
+        self.tolerance = tolerance
+        self.confirmations = confirmations
+        self.on_drift = on_drift
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.rounds = 0
+        self.drift_count = 0  # REST adoptions
+        self._strikes: Dict[str, int] = {name: 0 for name in sources}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background reconciliation task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background reconciliation task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            await self.reconcile_once()
+
+    async def reconcile_once(self) -> Dict[str, Optional[Decimal]]:
+        """
+        Run one reconciliation round.
+
+        Returns:
+            name -> signed drift (rest - ledger), None if skipped
+        """
+        self.rounds += 1
+        drifts: Dict[str, Optional[Decimal]] = {}
+        for name, (ledger, fetch_position) in self.sources.items():
+            version = ledger.version
+            try:
+                rest_position = await fetch_position()
+            except Exception as e:
+                self.logger.warning(f"[RECONCILE] {name}: REST position failed: {e}")
+                drifts[name] = None
+                continue
+            if ledger.version != version:
+                drifts[name] = None
+                continue
+
+            position = ledger.position
+            drift = rest_position - position
+            drifts[name] = drift
+            if abs(drift) <= self.tolerance:
+                self._strikes[name] = 0
+                continue
+
+            self._strikes[name] += 1
+            self.logger.warning(
+                f"[DRIFT] {name}: ledger={position}, REST={rest_position}, drift={drift} "
+                f"({self._strikes[name]}/{self.confirmations})"
+            )
+            if self._strikes[name] >= self.confirmations:
+                self._strikes[name] = 0
+                ledger.reconcile(rest_position, self.tolerance)
+                self.drift_count += 1
+                if self.on_drift is not None:
+                    try:
+                        self.on_drift(name, position, rest_position)
+                    except Exception as e:
+                        self.logger.error(f"[RECONCILE] on_drift callback failed: {e}")
+        return drifts
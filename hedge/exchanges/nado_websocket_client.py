@@ -12,8 +12,13 @@ import asyncio
 import json
 import logging
 import time
+from collections import deque
 from decimal import Decimal
-from typing import Dict, Any, Optional, Callable, AsyncIterator, List, Tuple
+from typing import Dict, Any, Optional, Callable, AsyncIterator, List, Tuple, Union
+
+from .nado_latency import StreamLatencyStats
+from .nado_message_decoder import get_decoder
+from .nado_websocket_recorder import FrameRecorder
 
 try:
     import websockets
@@ -42,6 +47,11 @@ class ConnectionState:
     FAILED = "failed"
 
 
+# Routing key for stream messages: (stream_type, product_id, subaccount).
+# product_id/subaccount are None for stream-wide routes and public streams.
+RouteKey = Tuple[str, Optional[int], Optional[str]]
+
+
 class NadoWebSocketClient:
     """
     WebSocket client for Nado public streams.
@@ -58,11 +68,38 @@ class NadoWebSocketClient:
     # Ping interval (Nado requires ping every 30 seconds)
     PING_INTERVAL = 25  # Send ping every 25 seconds (5 second buffer)
 
+    # Staleness watchdog. A (stream, product) subscription without a message
+    # for STALENESS_THRESHOLDS seconds is "quiet": normal for a calm market, so
+    # it is only recorded. Liveness is judged on the connection instead: after
+    # CONNECTION_SILENCE_THRESHOLD seconds without any frame the socket is
+    # pinged, and a missing pong marks it "dead". A stream is resubscribed only
+    # once it has been silent for RESUBSCRIBE_THRESHOLDS seconds on a live
+    # connection. Streams without a threshold (private streams are quiet
+    # between orders) are never flagged.
+    STALENESS_THRESHOLDS = {"best_bid_offer": 5.0, "book_depth": 5.0}
+    RESUBSCRIBE_THRESHOLDS = {"best_bid_offer": 60.0, "book_depth": 60.0}
+    CONNECTION_SILENCE_THRESHOLD = 5.0
+    CONNECTION_PING_TIMEOUT = 5.0
+    WATCHDOG_INTERVAL = 1.0  # How often subscriptions are checked
+    STALENESS_EVENTS_MAXLEN = 200
+
     # Reconnection settings
     RECONNECT_DELAY_BASE = 1.0  # Initial delay in seconds
     RECONNECT_DELAY_MAX = 30.0  # Maximum delay
     RECONNECT_ATTEMPTS = 5  # Max reconnection attempts before giving up
 
+    # messages() queue settings (queue only exists while messages() is iterated)
+    QUEUE_POLICY_DROP_OLDEST = "drop_oldest"  # Evict oldest message when full
+    QUEUE_POLICY_BLOCK = "block"  # Apply backpressure to the reader when full
+    MESSAGE_QUEUE_MAXSIZE = 1000
+
+    # Streams dispatched on the priority lane: never coalesced or reordered, and
+    # never queued behind market data callbacks
+    PRIORITY_STREAMS = {"fill", "position_change", "order_update", "liquidation"}
+
+    # Latency histogram summary log interval (seconds, 0 disables the log line)
+    LATENCY_LOG_INTERVAL = 60
+
     # EIP-712 Domain for StreamAuthentication (from Nado SDK)
     EIP712_DOMAIN = {
         "name": "Nado",
@@ -80,6 +117,11 @@ class NadoWebSocketClient:
         ]
     }
 
+    # Stream authentication expiration (Nado allows at most 100s ahead) and how
+    # long before expiry the pre-signed payload is replaced
+    AUTH_EXPIRATION_MS = 60000
+    AUTH_REFRESH_MARGIN_MS = 20000
+
     # Private streams that require authentication
     PRIVATE_STREAMS = {"fill", "position_change", "order_update", "liquidation", "funding_payment", "funding_rate", "latest_candlestick"}
 
@@ -90,7 +132,14 @@ class NadoWebSocketClient:
         logger: Optional[logging.Logger] = None,
         private_key: Optional[str] = None,
         owner: Optional[str] = None,
-        subaccount_name: str = "default"
+        subaccount_name: str = "default",
+        url: Optional[str] = None,
+        message_queue_maxsize: int = MESSAGE_QUEUE_MAXSIZE,
+        message_queue_policy: str = QUEUE_POLICY_DROP_OLDEST,
+        decoder: Optional[Union[str, Any]] = None,
+        staleness_thresholds: Optional[Dict[str, float]] = None,
+        resubscribe_thresholds: Optional[Dict[str, float]] = None,
+        connection_silence_threshold: float = CONNECTION_SILENCE_THRESHOLD
     ):
         """
         Initialize Nado WebSocket client.
@@ -102,35 +151,117 @@ class NadoWebSocketClient:
             private_key: Private key for EIP-712 authentication (required for private streams)
             owner: Wallet address (owner) for subaccount calculation
             subaccount_name: Subaccount name (default: "default")
+            url: WebSocket endpoint override (default: WS_URL)
+            message_queue_maxsize: Max messages buffered for messages() consumers
+            message_queue_policy: "drop_oldest" or "block" when the queue is full
+            decoder: Frame decoder name ("msgspec", "orjson", "json") or instance
+                     (default: fastest installed backend)
+            staleness_thresholds: Per stream type seconds before a stream counts as
+                                  quiet, merged over STALENESS_THRESHOLDS
+            resubscribe_thresholds: Per stream type seconds of silence before a stream
+                                    is resubscribed, merged over RESUBSCRIBE_THRESHOLDS
+            connection_silence_threshold: Seconds without any frame before the
+                                          connection is probed with a ping
         """
         if not WEBSOCKETS_AVAILABLE:
             raise ImportError("websockets library is required. Install with: pip install websockets")
 
+        if message_queue_policy not in (self.QUEUE_POLICY_DROP_OLDEST, self.QUEUE_POLICY_BLOCK):
+            raise ValueError(
+                f"Invalid message_queue_policy: {message_queue_policy}. "
+                f"Must be '{self.QUEUE_POLICY_DROP_OLDEST}' or '{self.QUEUE_POLICY_BLOCK}'"
+            )
+        if message_queue_maxsize <= 0:
+            raise ValueError("message_queue_maxsize must be positive")
+
         self.product_ids = product_ids or [4, 8]  # Default to ETH and SOL
         self.auto_reconnect = auto_reconnect
+        if url:
+            self.WS_URL = url
 
         # Setup logger
         self.logger = logger or logging.getLogger(__name__)
 
+        # Frame decoder (see nado_message_decoder)
+        self._decoder = decoder if decoder is not None and not isinstance(decoder, str) else get_decoder(decoder)
+
         # Authentication credentials
         self._private_key = private_key
         self._owner = owner
         self._subaccount_name = subaccount_name
         self._authenticated = False
+        self._subaccount_hex: Optional[str] = None  # Derived once from owner/subaccount_name
+        self._auth_payload: Optional[Dict[str, Any]] = None  # Pre-signed, see _auth_presign_loop
+        self._auth_presign_task: Optional[asyncio.Task] = None
 
         # Connection state
         self._state = ConnectionState.DISCONNECTED
         self._ws = None
         self._stop_event = asyncio.Event()
         self._reconnect_task: Optional[asyncio.Task] = None
-        self._ping_task: Optional[asyncio.Task] = None
+        self._watchdog_task: Optional[asyncio.Task] = None
 
         # Subscriptions
-        self._subscriptions: Dict[int, List[str]] = {}  # product_id -> list of stream types
-        self._message_callbacks: Dict[str, List[Callable]] = {}  # stream_type -> list of callbacks
-
-        # Message queue
-        self._message_queue: asyncio.Queue = asyncio.Queue()
+        self._subscriptions: Dict[int, List[Dict[str, str]]] = {}  # product_id -> [{"type", "subaccount"?}]
+        self._message_callbacks: Dict[str, List[Callable]] = {}  # stream_type -> list of callbacks (all products)
+        self._product_callbacks: Dict[RouteKey, List[Callable]] = {}  # (stream_type, product_id, subaccount) -> callbacks
+
+        # Compiled routing table used on the hot path:
+        # (stream_type, product_id, subaccount) -> ((callback, is_async), ...)
+        # Rebuilt on (un)registration so _process_message does one dict lookup
+        # per message and never introspects callbacks.
+        self._routes: Dict[RouteKey, Tuple[Tuple[Callable, bool], ...]] = {}
+
+        # Subscription reference counts: (stream_type, product_id, subaccount) -> holders.
+        # The connection may be shared by several NadoClients (see NadoWebSocketHub),
+        # so the exchange subscription is only sent for the first holder and only
+        # removed when the last holder unsubscribes.
+        self._subscription_refs: Dict[Tuple[str, int, Optional[str]], int] = {}
+
+        # Called after a successful reconnect (streams already resubscribed) so
+        # handlers holding incremental state can invalidate and rebuild it
+        self._reconnect_callbacks: List[Callable[[], Any]] = []
+
+        # Message queue (opt-in: created when messages() is iterated, so
+        # callback-only users such as DNPairBot buffer nothing)
+        self._message_queue: Optional[asyncio.Queue] = None
+        self._message_queue_maxsize = message_queue_maxsize
+        self._message_queue_policy = message_queue_policy
+        self._queue_dropped_count = 0
+
+        # Per-stream pipeline latency histograms (see nado_latency)
+        self._latency = StreamLatencyStats()
+        self._latency_last_log_ns = time.perf_counter_ns()
+
+        # Reader/dispatcher split: the reader task only decodes frames and puts
+        # them on a lane; one dispatcher task per lane runs the callbacks. Lane
+        # entries are (message, parsed_ns). BookDepth deltas for a product that
+        # is still waiting on the market lane are merged into the waiting entry.
+        self._priority_lane: deque = deque()
+        self._market_lane: deque = deque()
+        self._priority_ready = asyncio.Event()
+        self._market_ready = asyncio.Event()
+        self._pending_book_depth: Dict[Any, Dict[str, Any]] = {}  # product_id -> waiting book_depth message
+        self._coalesced_count = 0
+        self._dispatch_tasks: List[asyncio.Task] = []
+        self._dispatch_busy = 0  # Lanes currently being drained
+
+        # Optional raw frame tap (see start_recording)
+        self._recorder: Optional[FrameRecorder] = None
+
+        # Staleness tracking: perf_counter_ns of the last message per
+        # (stream_type, product_id), seeded at subscribe time, and of the last
+        # frame or pong on the connection
+        self._staleness_thresholds = {**self.STALENESS_THRESHOLDS, **(staleness_thresholds or {})}
+        self._resubscribe_thresholds = {**self.RESUBSCRIBE_THRESHOLDS, **(resubscribe_thresholds or {})}
+        self._connection_silence_threshold = connection_silence_threshold
+        self._last_message_ns: Dict[Tuple[str, Any], int] = {}
+        self._last_socket_message_ns = 0
+        self._connection_dead_since: Optional[int] = None
+        self._stale_since: Dict[Tuple[str, Any], int] = {}  # key -> perf_counter_ns when found quiet
+        self._last_resubscribe_ns: Dict[Tuple[str, Any], int] = {}
+        self._staleness_events: deque = deque(maxlen=self.STALENESS_EVENTS_MAXLEN)
+        self._staleness_counts = {"quiet": 0, "dead": 0, "recovered": 0, "resubscribes": 0}
 
     @property
     def state(self) -> str:
@@ -153,6 +284,8 @@ class NadoWebSocketClient:
             self.logger.warning("Already connected")
             return
 
+        # A previous disconnect() stopped the background loops; let them run again
+        self._stop_event.clear()
         self._state = ConnectionState.CONNECTING
         self.logger.info(f"Connecting to Nado WebSocket: {self.WS_URL}")
 
@@ -165,14 +298,23 @@ class NadoWebSocketClient:
             )
 
             self._state = ConnectionState.CONNECTED
+            self._last_socket_message_ns = time.perf_counter_ns()
+            self._connection_dead_since = None
             self.logger.info("Connected to Nado WebSocket")
 
-            # Start message handler task
+            # Start reader task and lane dispatchers
             asyncio.create_task(self._handle_messages())
+            self._start_dispatchers()
+
+            # Start staleness watchdog
+            if self._watchdog_task is None or self._watchdog_task.done():
+                self._watchdog_task = asyncio.create_task(self._watchdog_loop())
 
-            # Start ping task
-            if self._ping_task is None or self._ping_task.done():
-                self._ping_task = asyncio.create_task(self._ping_loop())
+            # Re-authenticate with the pre-signed payload before private streams resubscribe
+            if self._authenticated:
+                await self._send_auth()
+                if self._auth_presign_task is None or self._auth_presign_task.done():
+                    self._auth_presign_task = asyncio.create_task(self._auth_presign_loop())
 
             # Resubscribe to all streams after reconnection
             if self._subscriptions:
@@ -187,17 +329,20 @@ class NadoWebSocketClient:
         """Disconnect from Nado WebSocket server."""
         self._stop_event.set()
 
-        if self._ping_task and not self._ping_task.done():
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._watchdog_task, self._auth_presign_task, *self._dispatch_tasks):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         if self._ws:
             await self._ws.close()
             self._ws = None
 
+        self.stop_recording()
+
         self._state = ConnectionState.DISCONNECTED
         self.logger.info("Disconnected from Nado WebSocket")
 
@@ -207,6 +352,10 @@ class NadoWebSocketClient:
 
         This is required for subscribing to private streams (fill, position_change, order_update).
 
+        The signed payload normally comes from the pre-signer (signed in a worker
+        thread ahead of expiry), so no signing happens on the event loop; the
+        connection is re-authenticated with it after every reconnect.
+
         Raises:
             ValueError: If private_key or owner is not set
             ImportError: If eth-account is not available
@@ -219,23 +368,53 @@ class NadoWebSocketClient:
         if not self._owner:
             raise ValueError("owner is required for authentication")
 
-        # Import nado_protocol utilities for subaccount conversion
-        try:
-            from nado_protocol.utils.bytes32 import subaccount_to_hex
-            from nado_protocol.utils.subaccount import SubaccountParams
-        except ImportError:
-            raise ImportError("nado-protocol library is required for subaccount calculation")
-
-        # Calculate subaccount bytes32
-        subaccount_params = SubaccountParams(
-            subaccount_owner=self._owner,
-            subaccount_name=self._subaccount_name,
-        )
-        subaccount_hex = subaccount_to_hex(subaccount_params)
+        await self._send_auth()
+
+        self._authenticated = True
+        if self._auth_presign_task is None or self._auth_presign_task.done():
+            self._auth_presign_task = asyncio.create_task(self._auth_presign_loop())
+
+        subaccount_hex = self._get_subaccount_hex()
+        self.logger.info(f"WebSocket authenticated for subaccount: {subaccount_hex[:10]}...{subaccount_hex[-6:]}")
+
+    async def _send_auth(self) -> None:
+        """Send an authentication message, signing off the loop only if no valid payload is cached."""
+        payload = self._auth_payload
+        if payload is None or payload["tx"]["expiration"] - int(time.time() * 1000) < self.AUTH_REFRESH_MARGIN_MS:
+            payload = await asyncio.to_thread(self._sign_auth_payload)
+            self._auth_payload = payload
+
+        auth_msg = dict(payload, id=int(time.time() * 1000) % 1000000)
+        await self._ws.send(json.dumps(auth_msg))
+
+    def _get_subaccount_hex(self) -> str:
+        """Get the bytes32 subaccount hex for owner/subaccount_name (computed once)."""
+        if self._subaccount_hex is None:
+            # Import nado_protocol utilities for subaccount conversion
+            try:
+                from nado_protocol.utils.bytes32 import subaccount_to_hex
+                from nado_protocol.utils.subaccount import SubaccountParams
+            except ImportError:
+                raise ImportError("nado-protocol library is required for subaccount calculation")
+
+            subaccount_params = SubaccountParams(
+                subaccount_owner=self._owner,
+                subaccount_name=self._subaccount_name,
+            )
+            self._subaccount_hex = subaccount_to_hex(subaccount_params)
+        return self._subaccount_hex
+
+    def _sign_auth_payload(self) -> Dict[str, Any]:
+        """
+        Sign a StreamAuthentication payload (CPU-bound; run in a worker thread).
+
+        Returns:
+            Authentication message without "id"
+        """
+        subaccount_hex = self._get_subaccount_hex()
 
-        # Calculate expiration (current time + 60 seconds, max 100s ahead)
-        import time
-        expiration = int(time.time() * 1000) + 60000  # 60 seconds from now
+        # Expiration in ms (Nado allows at most 100s ahead)
+        expiration = int(time.time() * 1000) + self.AUTH_EXPIRATION_MS
 
         # Create the message to sign (expiration as uint64 per Nado SDK)
         message_to_sign = {
@@ -253,21 +432,32 @@ class NadoWebSocketClient:
         signed_message = Account.from_key(self._private_key).sign_message(encoded_message)
 
         # Build authentication message (expiration as integer per Nado SDK)
-        auth_msg = {
+        return {
             "method": "authenticate",
             "tx": {
                 "sender": subaccount_hex,
                 "expiration": expiration  # uint64 integer
             },
             "signature": signed_message.signature.hex(),
-            "id": int(time.time() * 1000) % 1000000
         }
 
-        # Send authentication message
-        await self._ws.send(json.dumps(auth_msg))
-
-        self._authenticated = True
-        self.logger.info(f"WebSocket authenticated for subaccount: {subaccount_hex[:10]}...{subaccount_hex[-6:]}")
+    async def _auth_presign_loop(self) -> None:
+        """Keep a signed auth payload ready, re-signing in a worker thread before it expires."""
+        while not self._stop_event.is_set():
+            try:
+                payload = self._auth_payload
+                if payload is not None:
+                    remaining_ms = payload["tx"]["expiration"] - int(time.time() * 1000)
+                    wait_ms = remaining_ms - self.AUTH_REFRESH_MARGIN_MS
+                    if wait_ms > 0:
+                        await asyncio.sleep(wait_ms / 1000)
+                        continue
+                self._auth_payload = await asyncio.to_thread(self._sign_auth_payload)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error pre-signing auth payload: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY_BASE)
 
     async def subscribe(
         self,
@@ -303,11 +493,23 @@ class NadoWebSocketClient:
         if not self.is_connected:
             await self.connect()
 
-        # Register callback
+        # Register callback (routed by product_id and subaccount)
         if callback:
-            if stream_type not in self._message_callbacks:
-                self._message_callbacks[stream_type] = []
-            self._message_callbacks[stream_type].append(callback)
+            route_key = (stream_type, product_id, self._normalize_subaccount(subaccount))
+            if route_key not in self._product_callbacks:
+                self._product_callbacks[route_key] = []
+            self._product_callbacks[route_key].append(callback)
+            self._rebuild_routes(stream_type)
+
+        # Only the first holder of a subscription sends it to the exchange
+        ref_key = (stream_type, product_id, subaccount)
+        self._subscription_refs[ref_key] = self._subscription_refs.get(ref_key, 0) + 1
+        if self._subscription_refs[ref_key] > 1:
+            self.logger.debug(
+                f"Already subscribed to {stream_type} for product_id={product_id} "
+                f"(holders={self._subscription_refs[ref_key]})"
+            )
+            return
 
         # Build subscription message
         stream_def = {
@@ -326,6 +528,7 @@ class NadoWebSocketClient:
         }
 
         await self._ws.send(json.dumps(subscribe_msg))
+        self._last_message_ns.setdefault((stream_type, product_id), time.perf_counter_ns())
 
         # Track subscription (with subaccount info if applicable)
         if product_id not in self._subscriptions:
@@ -346,57 +549,113 @@ class NadoWebSocketClient:
 
         self.logger.info(f"Subscribed to {stream_type} for product_id={product_id}")
 
-    async def unsubscribe(self, stream_type: str, product_id: int) -> None:
+    async def unsubscribe(
+        self,
+        stream_type: str,
+        product_id: int,
+        callback: Optional[Callable[[Dict], None]] = None,
+        subaccount: Optional[str] = None
+    ) -> None:
         """
         Unsubscribe from a stream.
 
+        The exchange subscription is only removed when the last holder
+        unsubscribes; earlier calls just drop the holder's callback.
+
         Args:
             stream_type: Stream type
             product_id: Product ID
+            callback: Callback passed to subscribe() (removed from routing)
+            subaccount: Subaccount hex string used for private streams
         """
+        if callback:
+            route_key = (stream_type, product_id, self._normalize_subaccount(subaccount))
+            callbacks = self._product_callbacks.get(route_key, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._product_callbacks.pop(route_key, None)
+            self._rebuild_routes(stream_type)
+
+        ref_key = (stream_type, product_id, subaccount)
+        remaining = self._subscription_refs.get(ref_key, 0) - 1
+        if remaining > 0:
+            self._subscription_refs[ref_key] = remaining
+            return
+        self._subscription_refs.pop(ref_key, None)
+        if not any(k[0] == stream_type and k[1] == product_id for k in self._subscription_refs):
+            for tracking in (self._last_message_ns, self._stale_since, self._last_resubscribe_ns):
+                tracking.pop((stream_type, product_id), None)
+
+        stream_def = {
+            "type": stream_type,
+            "product_id": product_id
+        }
+        if subaccount:
+            stream_def["subaccount"] = subaccount
+
         unsubscribe_msg = {
             "method": "unsubscribe",
-            "stream": {
-                "type": stream_type,
-                "product_id": product_id
-            },
+            "stream": stream_def,
             "id": int(time.time() * 1000) % 1000000  # subscribe/unsubscribe use int id
         }
 
-        await self._ws.send(json.dumps(unsubscribe_msg))
+        if self._ws:
+            await self._ws.send(json.dumps(unsubscribe_msg))
 
         # Remove from tracking
-        if product_id in self._subscriptions and stream_type in self._subscriptions[product_id]:
-            self._subscriptions[product_id].remove(stream_type)
+        if product_id in self._subscriptions:
+            self._subscriptions[product_id] = [
+                s for s in self._subscriptions[product_id]
+                if not (s.get("type") == stream_type and s.get("subaccount") == subaccount)
+            ]
 
         self.logger.info(f"Unsubscribed from {stream_type} for product_id={product_id}")
 
     async def _resubscribe_all(self) -> None:
-        """Resubscribe to all previously subscribed streams."""
-        for product_id, stream_types in self._subscriptions.items():
-            for stream_type in stream_types:
+        """Resubscribe to all previously subscribed streams (private streams keep their subaccount)."""
+        for product_id, subscriptions in self._subscriptions.items():
+            for sub_info in subscriptions:
+                stream_def = {
+                    "type": sub_info["type"],
+                    "product_id": product_id
+                }
+                if sub_info.get("subaccount"):
+                    stream_def["subaccount"] = sub_info["subaccount"]
+
                 subscribe_msg = {
                     "method": "subscribe",
-                    "stream": {
-                        "type": stream_type,
-                        "product_id": product_id
-                    },
+                    "stream": stream_def,
                     "id": int(time.time() * 1000) % 1000000  # subscribe/unsubscribe use int id
                 }
                 await self._ws.send(json.dumps(subscribe_msg))
-                self.logger.info(f"Resubscribed to {stream_type} for product_id={product_id}")
+                self.logger.info(f"Resubscribed to {sub_info['type']} for product_id={product_id}")
 
     async def _handle_messages(self) -> None:
-        """Handle incoming WebSocket messages."""
+        """
+        Read and decode WebSocket frames.
+
+        Only decodes and hands messages to the dispatch lanes, so a slow
+        callback never delays reading the next frame.
+        """
+        decode = self._decoder.decode
+        decode_errors = self._decoder.decode_errors
         try:
             async for message in self._ws:
+                received_wall_ns = time.time_ns()
+                received_ns = time.perf_counter_ns()
+                self._last_socket_message_ns = received_ns
+                if self._recorder is not None:
+                    self._recorder.write(message, received_ns)
                 try:
-                    data = json.loads(message)
-                    await self._process_message(data)
-                except json.JSONDecodeError as e:
+                    data = decode(message)
+                except decode_errors as e:
                     self.logger.error(f"Failed to parse message: {e}")
-                except Exception as e:
-                    self.logger.error(f"Error processing message: {e}")
+                    continue
+                parsed_ns = time.perf_counter_ns()
+
+                self._record_receive_latency(data, received_wall_ns, received_ns, parsed_ns)
+                self._enqueue_dispatch(data, parsed_ns)
 
         except websockets.exceptions.ConnectionClosed:
             self.logger.warning("WebSocket connection closed")
@@ -407,6 +666,153 @@ class NadoWebSocketClient:
             if self.auto_reconnect and not self._stop_event.is_set():
                 await self._reconnect()
 
+    def _enqueue_dispatch(self, data: Dict[str, Any], parsed_ns: int) -> None:
+        """
+        Put a decoded message on its dispatch lane.
+
+        Private streams go on the priority lane in arrival order. BookDepth
+        deltas are coalesced per product while one is still waiting on the
+        market lane; everything else is queued as is.
+        """
+        message_type = data.get("type")
+        self._last_socket_message_ns = parsed_ns
+        if message_type:
+            self._last_message_ns[(message_type, data.get("product_id"))] = parsed_ns
+
+        if message_type in self.PRIORITY_STREAMS:
+            self._priority_lane.append((data, parsed_ns))
+            self._priority_ready.set()
+            return
+
+        if message_type == "book_depth":
+            product_id = data.get("product_id")
+            pending = self._pending_book_depth.get(product_id)
+            if pending is not None:
+                self._merge_book_depth(pending, data)
+                self._coalesced_count += 1
+                return
+            self._pending_book_depth[product_id] = data
+
+        self._market_lane.append((data, parsed_ns))
+        self._market_ready.set()
+
+    @staticmethod
+    def _merge_book_depth(pending: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """
+        Merge a newer BookDepth delta into one still waiting for dispatch.
+
+        Levels are keyed by price (the newer quantity wins) and the merged
+        message spans last_max_timestamp of the first delta to max_timestamp of
+        the last, so gap detection in BookDepthHandler still holds.
+        """
+        for side in ("bids", "asks"):
+            levels = pending.get(side)
+            if not isinstance(levels, dict):
+                levels = dict(levels or ())
+                pending[side] = levels
+            levels.update(data.get(side) or ())
+        if "max_timestamp" in data:
+            pending["max_timestamp"] = data["max_timestamp"]
+
+    def _start_dispatchers(self) -> None:
+        """Start the priority and market lane dispatcher tasks (once)."""
+        if self._dispatch_tasks and not any(task.done() for task in self._dispatch_tasks):
+            return
+        self._dispatch_tasks = [
+            asyncio.create_task(self._dispatch_loop(self._priority_lane, self._priority_ready)),
+            asyncio.create_task(self._dispatch_loop(self._market_lane, self._market_ready)),
+        ]
+
+    async def _dispatch_loop(self, lane: deque, ready: asyncio.Event) -> None:
+        """Dispatch one lane until the client is stopped."""
+        while not self._stop_event.is_set():
+            try:
+                await ready.wait()
+                ready.clear()
+                self._dispatch_busy += 1
+                try:
+                    await self._drain_lane(lane)
+                finally:
+                    self._dispatch_busy -= 1
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in dispatcher: {e}")
+
+    async def _drain_lane(self, lane: deque) -> None:
+        """Process every message currently waiting on a lane (one dispatch tick)."""
+        pending_book_depth = self._pending_book_depth
+        while lane:
+            data, parsed_ns = lane.popleft()
+            message_type = data.get("type")
+
+            if message_type == "book_depth":
+                # Later deltas for this product start a new entry from here on
+                if pending_book_depth.get(data.get("product_id")) is data:
+                    del pending_book_depth[data.get("product_id")]
+                for side in ("bids", "asks"):
+                    if isinstance(data.get(side), dict):
+                        data[side] = list(data[side].items())
+
+            try:
+                await self._process_message(data)
+            except Exception as e:
+                self.logger.error(f"Error processing message: {e}")
+
+            if message_type:
+                self._record_handled_latency(message_type, parsed_ns, time.perf_counter_ns())
+
+    async def _wait_dispatch_idle(self) -> None:
+        """Wait until both lanes are empty and no callback is running."""
+        while (
+            self._priority_lane or self._market_lane or self._dispatch_busy
+            or self._priority_ready.is_set() or self._market_ready.is_set()
+        ):
+            await asyncio.sleep(0)
+
+    def start_recording(self, path: str, compress: bool = False) -> None:
+        """
+        Record every received frame to a file for offline replay.
+
+        Frames are written raw, before decoding, with their monotonic receive
+        time (see nado_websocket_recorder for the format).
+
+        Args:
+            path: Output file path
+            compress: zstd-compress the recording (requires zstandard)
+        """
+        self.stop_recording()
+        self._recorder = FrameRecorder(path, compress=compress)
+        self.logger.info(f"Recording WebSocket frames to {path}")
+
+    def stop_recording(self) -> Optional[int]:
+        """
+        Stop recording and close the file.
+
+        Returns:
+            Number of frames recorded, or None if not recording
+        """
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return None
+        recorder.close()
+        self.logger.info(f"Recorded {recorder.count} WebSocket frames to {recorder.path}")
+        return recorder.count
+
+    def get_dispatch_stats(self) -> Dict[str, int]:
+        """
+        Get dispatch lane statistics.
+
+        Returns:
+            Dict with priority_pending, market_pending and coalesced (BookDepth
+            deltas merged into a waiting message)
+        """
+        return {
+            "priority_pending": len(self._priority_lane),
+            "market_pending": len(self._market_lane),
+            "coalesced": self._coalesced_count,
+        }
+
     async def _process_message(self, data: Dict[str, Any]) -> None:
         """
         Process incoming WebSocket message.
@@ -424,33 +830,338 @@ class NadoWebSocketClient:
         # Check if this is a stream message (has "type" field)
         message_type = data.get("type")
         if message_type:
-            # Add to message queue
-            await self._message_queue.put(data)
-
-            # Call registered callbacks
-            if message_type in self._message_callbacks:
-                for callback in self._message_callbacks[message_type]:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(data)
-                        else:
-                            callback(data)
-                    except Exception as e:
-                        self.logger.error(f"Error in callback for {message_type}: {e}")
-
-    async def _ping_loop(self) -> None:
-        """Send periodic ping frames to keep connection alive."""
-        while not self._stop_event.is_set() and self.is_connected:
+            # Add to message queue (only while a messages() consumer exists)
+            if self._message_queue is not None:
+                await self._enqueue_message(data)
+
+            # Call registered callbacks via the compiled routing table
+            for callback, is_async in self._lookup_route(message_type, data):
+                try:
+                    if is_async:
+                        await callback(data)
+                    else:
+                        callback(data)
+                except Exception as e:
+                    self.logger.error(f"Error in callback for {message_type}: {e}")
+
+    def _record_receive_latency(
+        self,
+        data: Dict[str, Any],
+        received_wall_ns: int,
+        received_ns: int,
+        parsed_ns: int
+    ) -> None:
+        """Record exchange->receive and receive->parsed latency for one frame."""
+        message_type = data.get("type")
+        if not message_type:
+            return
+
+        histograms = self._latency.histograms_for(message_type)
+        exchange_ts = data.get("max_timestamp") or data.get("timestamp")
+        if exchange_ts:
+            histograms["exchange_to_receive"].record_ns(received_wall_ns - int(exchange_ts))
+        histograms["receive_to_parsed"].record_ns(parsed_ns - received_ns)
+
+    def _record_handled_latency(self, message_type: str, parsed_ns: int, handled_ns: int) -> None:
+        """Record parsed->handled latency (includes lane wait) and log periodically."""
+        self._latency.histograms_for(message_type)["parsed_to_handled"].record_ns(handled_ns - parsed_ns)
+
+        if self.LATENCY_LOG_INTERVAL and handled_ns - self._latency_last_log_ns >= self.LATENCY_LOG_INTERVAL * 1_000_000_000:
+            self._latency_last_log_ns = handled_ns
+            self.logger.info(f"WS latency p50/p99 ms: {self._latency.format_summary()}")
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Get pipeline latency histogram summaries.
+
+        Returns:
+            {stream_type: {stage: {count, mean_us, min_us, max_us, p50_us, p90_us, p99_us}}}
+            for stages exchange_to_receive, receive_to_parsed, parsed_to_handled
+        """
+        return self._latency.snapshot()
+
+    def reset_latency_stats(self) -> None:
+        """Clear the latency histograms."""
+        self._latency.reset()
+
+    def _lookup_route(self, message_type: str, data: Dict[str, Any]) -> Tuple[Tuple[Callable, bool], ...]:
+        """
+        Find the callbacks for a stream message.
+
+        Public streams (no subaccount) resolve with a single dict lookup. Messages
+        whose (product_id, subaccount) has no exact route fall back to the
+        product-wide route, then to the stream-wide route.
+        """
+        product_id = data.get("product_id")
+        subaccount = data.get("subaccount")
+        if subaccount is not None:
+            subaccount = self._normalize_subaccount(subaccount)
+
+        route = self._routes.get((message_type, product_id, subaccount))
+        if route is not None:
+            return route
+        if subaccount is not None:
+            route = self._routes.get((message_type, product_id, None))
+            if route is not None:
+                return route
+        return self._routes.get((message_type, None, None), ())
+
+    def _rebuild_routes(self, stream_type: str) -> None:
+        """
+        Recompile the routing table entries for one stream type.
+
+        Called on (un)registration only. Each route lists stream-wide callbacks
+        first, then those registered for the product (and subaccount), with the
+        sync/async nature of every callback resolved here instead of per message.
+        """
+        def compile_route(callbacks: List[Callable]) -> Tuple[Tuple[Callable, bool], ...]:
+            return tuple((cb, asyncio.iscoroutinefunction(cb)) for cb in callbacks)
+
+        for key in [k for k in self._routes if k[0] == stream_type]:
+            del self._routes[key]
+
+        stream_wide = self._message_callbacks.get(stream_type, [])
+        if stream_wide:
+            self._routes[(stream_type, None, None)] = compile_route(stream_wide)
+
+        product_wide: Dict[int, List[Callable]] = {}
+        for (route_type, product_id, subaccount), callbacks in self._product_callbacks.items():
+            if route_type != stream_type:
+                continue
+            product_wide.setdefault(product_id, []).extend(callbacks)
+            if subaccount is not None:
+                self._routes[(stream_type, product_id, subaccount)] = compile_route(stream_wide + callbacks)
+
+        # (stream_type, product_id, None) serves public streams and private
+        # messages that carry no (or an unregistered) subaccount
+        for product_id, callbacks in product_wide.items():
+            self._routes[(stream_type, product_id, None)] = compile_route(stream_wide + callbacks)
+
+    @staticmethod
+    def _normalize_subaccount(subaccount: Optional[str]) -> Optional[str]:
+        """Normalize a subaccount hex string for use in routing keys."""
+        return subaccount.lower() if subaccount else None
+
+    async def _watchdog_loop(self) -> None:
+        """Check subscriptions for staleness every WATCHDOG_INTERVAL seconds."""
+        while not self._stop_event.is_set():
             try:
-                await asyncio.sleep(self.PING_INTERVAL)
-                if self._ws and not self._ws.closed:
-                    # websockets library handles ping automatically
-                    # But we can send a custom ping if needed
-                    pass
+                await asyncio.sleep(self.WATCHDOG_INTERVAL)
+                if self.is_connected:
+                    await self._check_staleness()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Error in ping loop: {e}")
+                self.logger.error(f"Error in staleness watchdog: {e}")
+
+    async def _check_staleness(self) -> None:
+        """
+        Check connection liveness, then record quiet/recovered streams and
+        resubscribe streams silent past their resubscribe threshold.
+
+        Quiet streams are only resubscribed while the connection is alive;
+        on a dead connection a resubscribe cannot help.
+        """
+        watched = [
+            ref for ref in self._subscription_refs
+            if self._staleness_thresholds.get(ref[0])
+        ]
+        if not watched:
+            return
+
+        connection_alive = await self._check_connection()
+        now_ns = time.perf_counter_ns()
+
+        for stream_type, product_id, subaccount in watched:
+            key = (stream_type, product_id)
+            last_ns = self._last_message_ns.get(key)
+            if last_ns is None:
+                continue
+            age = (now_ns - last_ns) / 1e9
+
+            if age <= self._staleness_thresholds[stream_type]:
+                if key in self._stale_since:
+                    quiet_for = (now_ns - self._stale_since.pop(key)) / 1e9
+                    self._record_staleness_event(
+                        "recovered", key, age, quiet_for=round(quiet_for, 3),
+                        resubscribed=key in self._last_resubscribe_ns
+                    )
+                    self._last_resubscribe_ns.pop(key, None)
+                continue
+
+            if key not in self._stale_since:
+                self._stale_since[key] = now_ns
+                self._record_staleness_event("quiet", key, age, socket_active=connection_alive)
+
+            resubscribe_after = self._resubscribe_thresholds.get(stream_type)
+            if not connection_alive or not resubscribe_after or age <= resubscribe_after:
+                continue
+            last_resubscribe = self._last_resubscribe_ns.get(key, 0)
+            if (now_ns - last_resubscribe) / 1e9 >= resubscribe_after:
+                self._last_resubscribe_ns[key] = now_ns
+                self._staleness_counts["resubscribes"] += 1
+                await self._resubscribe_stream(stream_type, product_id, subaccount)
+
+    async def _check_connection(self) -> bool:
+        """
+        Decide whether the connection is alive, recording dead/recovered events.
+
+        Any frame within connection_silence_threshold counts as alive; past it
+        the socket is pinged and a pong within CONNECTION_PING_TIMEOUT counts
+        as a frame.
+        """
+        silence = (time.perf_counter_ns() - self._last_socket_message_ns) / 1e9
+        alive = silence <= self._connection_silence_threshold
+        if not alive:
+            alive = await self._probe_connection()
+            if alive:
+                self._last_socket_message_ns = time.perf_counter_ns()
+
+        key = ("connection", None)
+        now_ns = time.perf_counter_ns()
+        if not alive and self._connection_dead_since is None:
+            self._connection_dead_since = now_ns
+            self._record_staleness_event("dead", key, silence)
+        elif alive and self._connection_dead_since is not None:
+            dead_for = (now_ns - self._connection_dead_since) / 1e9
+            self._connection_dead_since = None
+            self._record_staleness_event("recovered", key, 0.0, dead_for=round(dead_for, 3))
+        return alive
+
+    async def _probe_connection(self) -> bool:
+        """Ping the socket and wait for the pong."""
+        try:
+            pong_waiter = await self._ws.ping()
+            await asyncio.wait_for(pong_waiter, self.CONNECTION_PING_TIMEOUT)
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
+
+    def _record_staleness_event(self, event: str, key: Tuple[str, Any], age: float, **details) -> None:
+        """Append a staleness event, bump its counter and log it."""
+        stream_type, product_id = key
+        record = {
+            "event": event,
+            "stream": stream_type,
+            "product_id": product_id,
+            "age": round(age, 3),
+            "time": time.time(),
+            **details,
+        }
+        self._staleness_events.append(record)
+        self._staleness_counts[event] += 1
+
+        message = f"WS {stream_type} product_id={product_id} {event} (age={age:.1f}s"
+        message += "".join(f", {k}={v}" for k, v in details.items()) + ")"
+        if event in ("quiet", "dead"):
+            self.logger.warning(message)
+        else:
+            self.logger.info(message)
+
+    async def _resubscribe_stream(self, stream_type: str, product_id: int, subaccount: Optional[str]) -> None:
+        """Send unsubscribe + subscribe for one stream (holders and callbacks unchanged)."""
+        stream_def = {
+            "type": stream_type,
+            "product_id": product_id
+        }
+        if subaccount:
+            stream_def["subaccount"] = subaccount
+
+        for method in ("unsubscribe", "subscribe"):
+            await self._ws.send(json.dumps({
+                "method": method,
+                "stream": stream_def,
+                "id": int(time.time() * 1000) % 1000000  # subscribe/unsubscribe use int id
+            }))
+        self.logger.info(f"Resubscribed silent {stream_type} for product_id={product_id}")
+
+    def get_message_age(self, stream_type: str, product_id: int) -> Optional[float]:
+        """
+        Get seconds since the last message of a stream for a product.
+
+        Returns:
+            Age in seconds (since subscribing if nothing arrived yet), or None if
+            never subscribed
+        """
+        last_ns = self._last_message_ns.get((stream_type, product_id))
+        if last_ns is None:
+            return None
+        return (time.perf_counter_ns() - last_ns) / 1e9
+
+    def is_stale(self, stream_type: str, product_id: int) -> bool:
+        """
+        Check whether a stream's data for a product is too old to trust.
+
+        A quiet stream on a live connection still holds current data (the
+        market has not changed); it turns stale only once the connection is
+        dead or the stream outlives its resubscribe threshold.
+
+        Returns:
+            True if the stream has a staleness threshold and either it was never
+            subscribed, or it is quiet and the connection is dead or the silence
+            exceeds the resubscribe threshold
+        """
+        threshold = self._staleness_thresholds.get(stream_type)
+        if not threshold:
+            return False
+        age = self.get_message_age(stream_type, product_id)
+        if age is None:
+            return True
+        if age <= threshold:
+            return False
+        if self._connection_dead_since is not None:
+            return True
+        resubscribe_after = self._resubscribe_thresholds.get(stream_type)
+        return resubscribe_after is not None and age > resubscribe_after
+
+    def is_stream_live(self, stream_type: str, product_id: int) -> bool:
+        """
+        Check whether a subscribed stream can be relied on to deliver its next message.
+
+        Unlike is_stale(), this also covers streams without a staleness
+        threshold (private streams are quiet between orders), so it judges the
+        connection rather than the stream's own silence.
+
+        Returns:
+            True if the stream is subscribed, the socket is connected and not
+            marked dead, and any frame arrived within connection_silence_threshold
+        """
+        if not self.is_connected or self._connection_dead_since is not None:
+            return False
+        if self.get_message_age(stream_type, product_id) is None:
+            return False
+        silence = (time.perf_counter_ns() - self._last_socket_message_ns) / 1e9
+        return silence <= self._connection_silence_threshold
+
+    def get_staleness_stats(self) -> Dict[str, Any]:
+        """
+        Get staleness watchdog metrics.
+
+        Returns:
+            Dict with counts (quiet, dead, recovered, resubscribes), connection
+            liveness, currently quiet streams with their age, thresholds and
+            recent events
+        """
+        quiet = []
+        for stream_type, product_id in self._stale_since:
+            quiet.append({
+                "stream": stream_type,
+                "product_id": product_id,
+                "age": self.get_message_age(stream_type, product_id),
+            })
+        return {
+            "counts": dict(self._staleness_counts),
+            "connection": {
+                "alive": self._connection_dead_since is None,
+                "silence": (time.perf_counter_ns() - self._last_socket_message_ns) / 1e9,
+            },
+            "quiet": quiet,
+            "thresholds": dict(self._staleness_thresholds),
+            "resubscribe_thresholds": dict(self._resubscribe_thresholds),
+            "events": list(self._staleness_events),
+        }
 
     async def _reconnect(self) -> None:
         """Attempt to reconnect with exponential backoff."""
@@ -463,7 +1174,10 @@ class NadoWebSocketClient:
 
             try:
                 await asyncio.sleep(delay)
+                if self._stop_event.is_set():
+                    return  # disconnect() was called while backing off
                 await self.connect()
+                await self._notify_reconnected()
                 return  # Success
 
             except Exception as e:
@@ -473,22 +1187,84 @@ class NadoWebSocketClient:
         self._state = ConnectionState.FAILED
         self.logger.error("Failed to reconnect after maximum attempts")
 
+    async def _notify_reconnected(self) -> None:
+        """Tell reconnect listeners that stream state before the drop is invalid."""
+        for callback in list(self._reconnect_callbacks):
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback()
+                else:
+                    callback()
+            except Exception as e:
+                self.logger.error(f"Error in reconnect callback: {e}")
+
+    async def _enqueue_message(self, data: Dict[str, Any]) -> None:
+        """
+        Put a stream message on the bounded messages() queue.
+
+        With "block" the market or priority dispatcher waits for the consumer
+        (backpressure on that lane); with "drop_oldest" the oldest buffered message
+        is evicted and counted in get_queue_stats()["dropped"].
+        """
+        queue = self._message_queue
+
+        if self._message_queue_policy == self.QUEUE_POLICY_BLOCK:
+            await queue.put(data)
+            return
+
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._queue_dropped_count += 1
+            if self._queue_dropped_count == 1 or self._queue_dropped_count % 1000 == 0:
+                self.logger.warning(
+                    f"messages() consumer falling behind: dropped {self._queue_dropped_count} "
+                    f"messages (maxsize={self._message_queue_maxsize})"
+                )
+        queue.put_nowait(data)
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """
+        Get messages() queue statistics.
+
+        Returns:
+            Dict with enabled, size, maxsize, policy and dropped count
+        """
+        return {
+            "enabled": self._message_queue is not None,
+            "size": self._message_queue.qsize() if self._message_queue is not None else 0,
+            "maxsize": self._message_queue_maxsize,
+            "policy": self._message_queue_policy,
+            "dropped": self._queue_dropped_count,
+        }
+
     async def messages(self) -> AsyncIterator[Dict[str, Any]]:
         """
         Iterate over incoming messages.
 
+        The bounded queue is created on first iteration and removed when the
+        iterator is closed, so messages are only buffered while consumed.
+
         Yields:
             Parsed message dictionaries
         """
-        while not self._stop_event.is_set():
-            try:
-                message = await asyncio.wait_for(
-                    self._message_queue.get(),
-                    timeout=1.0
-                )
-                yield message
-            except asyncio.TimeoutError:
-                continue
+        if self._message_queue is None:
+            self._message_queue = asyncio.Queue(maxsize=self._message_queue_maxsize)
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    message = await asyncio.wait_for(
+                        self._message_queue.get(),
+                        timeout=1.0
+                    )
+                    yield message
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            self._message_queue = None
 
     def register_callback(self, stream_type: str, callback: Callable[[Dict], None]) -> None:
         """
@@ -501,3 +1277,23 @@ class NadoWebSocketClient:
         if stream_type not in self._message_callbacks:
             self._message_callbacks[stream_type] = []
         self._message_callbacks[stream_type].append(callback)
+        self._rebuild_routes(stream_type)
+
+    def register_reconnect_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        Register a callback invoked after every successful reconnect.
+
+        Messages sent while the socket was down are lost, so handlers that
+        apply incremental updates (e.g. BookDepthHandler) use this to discard
+        and rebuild their state.
+
+        Args:
+            callback: Function taking no arguments (can be sync or async)
+        """
+        if callback not in self._reconnect_callbacks:
+            self._reconnect_callbacks.append(callback)
+
+    def unregister_reconnect_callback(self, callback: Callable[[], Any]) -> None:
+        """Remove a callback added with register_reconnect_callback()."""
+        if callback in self._reconnect_callbacks:
+            self._reconnect_callbacks.remove(callback)
@@ -0,0 +1,162 @@
+"""
+Nado WebSocket Connection Hub
+
+Process-wide registry of shared NadoWebSocketClient connections.
+
+Every NadoClient in a process acquires its WebSocket from this hub instead of
+opening its own. One socket is kept per endpoint and account (owner,
+subaccount name), since a connection authenticates as a single subaccount;
+stream subscriptions are
+reference-counted per (stream, product_id, subaccount) by the client and stream
+messages are routed to handlers by product_id, so N products cost one socket,
+one authentication and one message loop.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from .nado_websocket_client import NadoWebSocketClient
+
+# (endpoint URL, owner, subaccount name)
+HubKey = Tuple[str, Optional[str], str]
+
+
+class NadoWebSocketHub:
+    """
+    Share one NadoWebSocketClient per endpoint and account across all NadoClient instances.
+
+    Usage:
+        ws_client = await NadoWebSocketHub.acquire(product_ids=[4], ...)
+        ...
+        await NadoWebSocketHub.release(ws_client)
+
+    The connection is opened by the first acquire() and closed when the last
+    holder releases it.
+    """
+
+    # (url, owner, subaccount name) -> shared client
+    _clients: Dict[HubKey, NadoWebSocketClient] = {}
+
+    # (url, owner, subaccount name) -> number of holders
+    _ref_counts: Dict[HubKey, int] = {}
+
+    # Created lazily so the hub can be imported outside a running event loop
+    _lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @staticmethod
+    def _key(url: Optional[str], owner: Optional[str], subaccount_name: str) -> HubKey:
+        return (url or NadoWebSocketClient.WS_URL, owner.lower() if owner else None, subaccount_name)
+
+    @classmethod
+    async def acquire(
+        cls,
+        product_ids: Optional[List[int]] = None,
+        url: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        private_key: Optional[str] = None,
+        owner: Optional[str] = None,
+        subaccount_name: str = "default"
+    ) -> NadoWebSocketClient:
+        """
+        Get the shared connected client for an endpoint and account, creating it if needed.
+
+        Holders with a different owner or subaccount get their own connection.
+
+        Args:
+            product_ids: Product IDs this holder will subscribe to
+            url: WebSocket endpoint (default: NadoWebSocketClient.WS_URL)
+            logger: Optional logger instance (used only when creating the client)
+            private_key: Private key for EIP-712 authentication
+            owner: Wallet address (owner) for subaccount calculation
+            subaccount_name: Subaccount name (default: "default")
+
+        Returns:
+            Connected NadoWebSocketClient shared by all holders of this endpoint and account
+
+        Raises:
+            ValueError: If the account's connection was opened with a different private key
+        """
+        key = cls._key(url, owner, subaccount_name)
+        url = key[0]
+
+        async with cls._get_lock():
+            client = cls._clients.get(key)
+            if client is not None and client._private_key != private_key:
+                raise ValueError(
+                    f"WebSocket hub: {url} is already shared for subaccount "
+                    f"'{subaccount_name}' with a different private key"
+                )
+            if client is None:
+                client = NadoWebSocketClient(
+                    product_ids=list(product_ids or []),
+                    auto_reconnect=True,
+                    logger=logger,
+                    private_key=private_key,
+                    owner=owner,
+                    subaccount_name=subaccount_name,
+                    url=url
+                )
+                cls._clients[key] = client
+                cls._ref_counts[key] = 0
+            else:
+                for product_id in product_ids or []:
+                    if product_id not in client.product_ids:
+                        client.product_ids.append(product_id)
+
+            if not client.is_connected:
+                try:
+                    await client.connect()
+                except Exception:
+                    if cls._ref_counts[key] == 0:
+                        del cls._clients[key]
+                        del cls._ref_counts[key]
+                    raise
+
+            cls._ref_counts[key] += 1
+            client.logger.info(
+                f"WebSocket hub: {url} acquired (holders={cls._ref_counts[key]}, "
+                f"products={client.product_ids})"
+            )
+            return client
+
+    @classmethod
+    async def release(cls, client: NadoWebSocketClient) -> None:
+        """
+        Release a client obtained from acquire().
+
+        The underlying socket is closed once the last holder releases it.
+
+        Args:
+            client: Client returned by acquire()
+        """
+        async with cls._get_lock():
+            key = next((k for k, c in cls._clients.items() if c is client), None)
+            if key is None:
+                # Not hub-managed (or already closed) - close it directly
+                await client.disconnect()
+                return
+
+            cls._ref_counts[key] -= 1
+            client.logger.info(f"WebSocket hub: {key[0]} released (holders={cls._ref_counts[key]})")
+
+            if cls._ref_counts[key] <= 0:
+                del cls._clients[key]
+                del cls._ref_counts[key]
+                await client.disconnect()
+
+    @classmethod
+    def get_ref_count(
+        cls,
+        url: Optional[str] = None,
+        owner: Optional[str] = None,
+        subaccount_name: str = "default"
+    ) -> int:
+        """Get the number of holders of an endpoint and account's shared connection."""
+        return cls._ref_counts.get(cls._key(url, owner, subaccount_name), 0)
@@ -0,0 +1,133 @@
+"""
+Nado WebSocket Frame Recorder
+
+Append-only capture of raw Nado WebSocket frames for offline replay
+(see nado_websocket_replay.ReplayWebSocketClient).
+
+File format:
+- 8-byte header: b"NWSREC" + version byte + flags byte (bit 0: zstd)
+- Then one record per frame: little-endian uint64 receive time (monotonic
+  ns, time.perf_counter_ns) + uint32 frame length + raw frame bytes
+- With zstd, everything after the header is one zstd stream (requires the
+  optional zstandard package)
+"""
+
+import struct
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+
+MAGIC = b"NWSREC"
+FORMAT_VERSION = 1
+FLAG_ZSTD = 0x01
+
+_RECORD_HEADER = struct.Struct("<QI")
+
+
+class FrameRecorder:
+    """Append raw frames with their receive timestamps to a recording file."""
+
+    def __init__(self, path: str, compress: bool = False):
+        """
+        Open a recording file for writing.
+
+        Args:
+            path: Output file path (truncated if it exists)
+            compress: zstd-compress the record stream
+
+        Raises:
+            ImportError: If compress is set and zstandard is not installed
+        """
+        if compress and not ZSTD_AVAILABLE:
+            raise ImportError("zstandard library is required for compressed recordings. Install with: pip install zstandard")
+
+        self.path = path
+        self.compress = compress
+        self.count = 0
+
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + bytes([FORMAT_VERSION, FLAG_ZSTD if compress else 0]))
+        self._out: BinaryIO = (
+            zstandard.ZstdCompressor().stream_writer(self._file) if compress else self._file
+        )
+
+    def write(self, frame: Union[str, bytes], received_ns: int) -> None:
+        """
+        Append one frame.
+
+        Args:
+            frame: Raw frame as received (text frames are stored UTF-8 encoded)
+            received_ns: Monotonic receive timestamp (time.perf_counter_ns)
+        """
+        if isinstance(frame, str):
+            frame = frame.encode()
+        self._out.write(_RECORD_HEADER.pack(received_ns, len(frame)))
+        self._out.write(frame)
+        self.count += 1
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self._out is not self._file:
+            self._out.close()  # closes the underlying file too
+        else:
+            self._file.close()
+
+
+def read_frames(path: str) -> Iterator[Tuple[int, bytes]]:
+    """
+    Iterate over the frames of a recording.
+
+    Args:
+        path: Recording file written by FrameRecorder
+
+    Yields:
+        (received_ns, frame bytes) in recording order
+
+    Raises:
+        ValueError: If the file is not a recording
+        ImportError: If the recording is compressed and zstandard is not installed
+    """
+    with open(path, "rb") as f:
+        header = f.read(len(MAGIC) + 2)
+        if len(header) != len(MAGIC) + 2 or not header.startswith(MAGIC):
+            raise ValueError(f"Not a Nado WebSocket recording: {path}")
+
+        flags = header[-1]
+        stream: BinaryIO = f
+        if flags & FLAG_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstandard library is required for compressed recordings. Install with: pip install zstandard")
+            stream = zstandard.ZstdDecompressor().stream_reader(f)
+
+        while True:
+            record_header = _read_exact(stream, _RECORD_HEADER.size)
+            if record_header is None:
+                return
+            received_ns, length = _RECORD_HEADER.unpack(record_header)
+            frame = _read_exact(stream, length)
+            if frame is None:
+                return  # Truncated final record (recording interrupted)
+            yield received_ns, frame
+
+
+def is_recording(path: str) -> bool:
+    """Check whether a file starts with the recording header."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _read_exact(stream: BinaryIO, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or None at end of stream."""
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
@@ -0,0 +1,138 @@
+"""
+Nado WebSocket Replay Client
+
+Feeds a recording made with NadoWebSocketClient.start_recording() back
+through the normal decode/route/dispatch pipeline, so BBO/BookDepth/Fill
+handlers can be benchmarked and regression-tested offline at production
+message rates.
+
+Usage:
+    client = ReplayWebSocketClient("logs/ws_frames.nwsrec", speed=None)
+    await BBOHandler(4, client).start()
+    stats = await client.replay()
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from .nado_websocket_client import ConnectionState, NadoWebSocketClient
+from .nado_websocket_recorder import read_frames
+
+
+class _ReplaySocket:
+    """Stands in for the websockets connection: yields recorded frames once started."""
+
+    def __init__(self, path: str, speed: Optional[float]):
+        self._path = path
+        self._speed = speed
+        self.started = asyncio.Event()
+        self.sent = []
+        self.closed = False
+        self.frame_count = 0
+
+    async def send(self, message: str) -> None:
+        # Subscribe/unsubscribe/auth requests have nowhere to go
+        self.sent.append(json.loads(message))
+
+    async def close(self) -> None:
+        self.closed = True
+        self.started.set()
+
+    def __aiter__(self):
+        return self._replay()
+
+    async def _replay(self):
+        await self.started.wait()
+        first_recorded_ns = None
+        start_ns = time.perf_counter_ns()
+
+        for received_ns, frame in read_frames(self._path):
+            if self.closed:
+                return
+
+            if self._speed:
+                if first_recorded_ns is None:
+                    first_recorded_ns = received_ns
+                due_ns = start_ns + (received_ns - first_recorded_ns) / self._speed
+                delay = (due_ns - time.perf_counter_ns()) / 1e9
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif self.frame_count % 256 == 0:
+                await asyncio.sleep(0)  # Let dispatchers run at max speed
+
+            self.frame_count += 1
+            yield frame
+
+
+class ReplayWebSocketClient(NadoWebSocketClient):
+    """
+    NadoWebSocketClient that reads frames from a recording instead of a socket.
+
+    Handlers subscribe as usual (connect() is implicit); frames start flowing
+    when replay() is awaited. Reconnects are disabled and the staleness
+    watchdog is not started, since recorded time does not follow wall time.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        speed: Optional[float] = 1.0,
+        product_ids: Optional[list] = None,
+        logger: Optional[logging.Logger] = None,
+        **kwargs
+    ):
+        """
+        Initialize replay client.
+
+        Args:
+            path: Recording file written by NadoWebSocketClient.start_recording()
+            speed: Playback rate relative to the recording (1.0 = real time,
+                   2.0 = twice as fast); None or 0 replays at max speed
+            product_ids: Product IDs (informational, as for NadoWebSocketClient)
+            logger: Optional logger instance
+            **kwargs: Other NadoWebSocketClient options (decoder, queue settings, ...)
+        """
+        super().__init__(product_ids=product_ids, auto_reconnect=False, logger=logger, **kwargs)
+        self.path = path
+        self.speed = speed
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        """Open the recording (no network connection)."""
+        if self._state == ConnectionState.CONNECTED:
+            return
+
+        self._ws = _ReplaySocket(self.path, self.speed)
+        self._state = ConnectionState.CONNECTED
+        self._reader_task = asyncio.create_task(self._handle_messages())
+        self._start_dispatchers()
+        self.logger.info(f"Replaying Nado WebSocket recording: {self.path}")
+
+    async def replay(self) -> Dict[str, Any]:
+        """
+        Play the recording through the subscribed handlers and wait for it to finish.
+
+        Returns when every frame has been read and all callbacks have returned.
+
+        Returns:
+            Dict with frames, elapsed seconds and frames_per_sec
+        """
+        if not self.is_connected:
+            await self.connect()
+
+        socket = self._ws
+        start = time.perf_counter()
+        socket.started.set()
+        await self._reader_task
+        await self._wait_dispatch_idle()
+        elapsed = time.perf_counter() - start
+
+        self._state = ConnectionState.DISCONNECTED
+        return {
+            "frames": socket.frame_count,
+            "elapsed": elapsed,
+            "frames_per_sec": socket.frame_count / elapsed if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,205 @@
+"""
+BBO analytics tests.
+
+SpreadMonitor/MomentumDetector decide on O(1) float64 state; their outputs
+must match the previous Decimal full-window implementations, and the float64
+rolling stats and time-window states must match a direct computation over
+the window.
+"""
+
+import random
+import statistics
+from collections import deque
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bbo_handler import (
+    BBOData,
+    MomentumDetector,
+    RollingStats,
+    SpreadMonitor,
+    TimeWindowAnalyzer,
+)
+
+
+def legacy_spread_state(history, spread_pct):
+    """Previous SpreadMonitor.on_bbo decision (history already includes spread_pct)."""
+    if len(history) < 10:
+        return "STABLE"
+    avg_spread = statistics.mean(history)
+    if spread_pct > avg_spread * Decimal('1.5'):
+        return "WIDENING"
+    elif spread_pct < avg_spread * Decimal('0.5'):
+        return "NARROWING"
+    return "STABLE"
+
+
+def legacy_momentum(bid_history, ask_history):
+    """Previous MomentumDetector.on_bbo decision."""
+    if len(bid_history) < 5:
+        return "NEUTRAL"
+    recent_bids = [price for _, price in list(bid_history)[-5:]]
+    recent_asks = [price for _, price in list(ask_history)[-5:]]
+    bid_slope = (recent_bids[-1] - recent_bids[0]) / recent_bids[0] if recent_bids[0] > 0 else Decimal(0)
+    ask_slope = (recent_asks[-1] - recent_asks[0]) / recent_asks[0] if recent_asks[0] > 0 else Decimal(0)
+    threshold = Decimal('0.001')
+    if bid_slope > threshold and ask_slope > threshold:
+        return "BULLISH"
+    elif bid_slope < -threshold and ask_slope < -threshold:
+        return "BEARISH"
+    return "NEUTRAL"
+
+
+def random_bbos(count, seed):
+    rng = random.Random(seed)
+    mid = Decimal("3000")
+    for i in range(count):
+        mid += Decimal(rng.randint(-30, 30)) / 10
+        half_spread = Decimal(rng.choice((1, 1, 1, 2, 5, 20))) / 20
+        if rng.random() < 0.01:
+            half_spread = Decimal(0)  # locked book
+        yield BBOData(4, mid - half_spread, Decimal("1"), mid + half_spread, Decimal("2"), i)
+
+
+@pytest.mark.parametrize("window_size", [10, 100])
+def test_spread_state_matches_statistics_mean(window_size):
+    monitor = SpreadMonitor(window_size=window_size)
+    history = deque(maxlen=window_size)
+    states = set()
+
+    for bbo in random_bbos(3000, seed=window_size):
+        spread_pct = bbo.spread / bbo.bid_price
+        history.append(spread_pct)
+        state = monitor.on_bbo(bbo)
+        assert state == legacy_spread_state(history, spread_pct)
+        states.add(state)
+
+    assert states == {"WIDENING", "NARROWING", "STABLE"}
+    assert float(monitor.get_avg_spread_bps()) == pytest.approx(float(statistics.mean(history)) * 10000, rel=1e-9)
+
+
+def test_momentum_matches_list_copy():
+    detector = MomentumDetector()
+    bids, asks = deque(maxlen=20), deque(maxlen=20)
+    states = set()
+
+    for bbo in random_bbos(3000, seed=5):
+        bids.append((bbo.timestamp, bbo.bid_price))
+        asks.append((bbo.timestamp, bbo.ask_price))
+        state = detector.on_bbo(bbo)
+        assert state == legacy_momentum(bids, asks)
+        states.add(state)
+
+    assert states == {"BULLISH", "BEARISH", "NEUTRAL"}
+
+
+def test_rolling_stats_match_window():
+    rng = random.Random(1)
+    stats = RollingStats(window_size=50, ewma_alpha=0.1)
+    window = deque(maxlen=50)
+    ewma = None
+
+    for _ in range(1000):
+        value = 3000 + rng.gauss(0, 2)
+        stats.update(value)
+        window.append(value)
+        ewma = value if ewma is None else ewma + 0.1 * (value - ewma)
+
+        assert stats.mean == pytest.approx(statistics.fmean(window), rel=1e-12)
+        if len(window) > 1:
+            assert stats.stdev == pytest.approx(statistics.stdev(window), rel=1e-6)
+        assert stats.ewma == pytest.approx(ewma, rel=1e-12)
+
+    assert stats.count == 50
+
+
+def test_rolling_stats_empty_and_constant():
+    stats = RollingStats(window_size=5)
+    assert stats.summary() == {"count": 0, "mean": None, "stdev": None, "ewma": None}
+
+    for _ in range(12):
+        stats.update(2.5)
+    assert stats.mean == 2.5
+    assert stats.stdev == 0.0
+    assert stats.ewma == 2.5
+
+
+def test_monitors_feed_float_stats():
+    monitor = SpreadMonitor(window_size=10)
+    detector = MomentumDetector(window_size=10)
+    for bbo in [BBOData(4, Decimal("3000"), Decimal("1"), Decimal("3001"), Decimal("1"), 0),
+                BBOData(4, Decimal("3002"), Decimal("1"), Decimal("3004"), Decimal("1"), 1)]:
+        monitor.on_bbo(bbo)
+        detector.on_bbo(bbo)
+
+    assert monitor.spread_bps_stats.count == 2
+    assert monitor.spread_bps_stats.mean == pytest.approx((1 / 3000 + 2 / 3002) / 2 * 10000)
+    assert detector.mid_stats.mean == pytest.approx((3000.5 + 3003) / 2)
+
+
+SECOND_NS = 1_000_000_000
+
+
+def bbo_at(seconds, bid, ask):
+    return BBOData(4, Decimal(str(bid)), Decimal("1"), Decimal(str(ask)), Decimal("1"), int(seconds * SECOND_NS))
+
+
+def test_time_windows_evict_by_timestamp():
+    analyzer = TimeWindowAnalyzer(windows_s=(2, 10), min_momentum_samples=2)
+    # Rising 1 per second for 10s, then flat
+    for second in range(11):
+        analyzer.on_bbo(bbo_at(second, 3000 + second, 3001 + second))
+    for tick in range(10):
+        analyzer.on_bbo(bbo_at(10 + tick * 0.1, 3010, 3011))
+
+    assert analyzer.get_window_stats(2)["samples"] == 12   # 8.9 < ts <= 10.9
+    assert analyzer.get_window_stats(10)["samples"] == 20  # 0.9 < ts <= 10.9
+    # 2s: 3009 -> 3010 (0.03%) is neutral; 10s: 3001 -> 3010 is bullish
+    assert analyzer.get_momentum(2) == "NEUTRAL"
+    assert analyzer.get_momentum(10) == "BULLISH"
+
+
+def test_time_windows_match_direct_scan():
+    rng = random.Random(9)
+    analyzer = TimeWindowAnalyzer(windows_s=(2, 10, 60))
+    history = []
+    timestamp = 0
+    mid = 3000.0
+
+    for _ in range(5000):
+        # Bursty arrivals: sub-ms bursts and multi-second gaps
+        timestamp += int(rng.choice((0.0005, 0.01, 0.2, 3)) * SECOND_NS)
+        mid += rng.gauss(0, 1)
+        half_spread = rng.choice((0.05, 0.05, 0.1, 0.5))
+        bbo = BBOData(4, Decimal(str(round(mid - half_spread, 2))), Decimal("1"),
+                      Decimal(str(round(mid + half_spread, 2))), Decimal("1"), timestamp)
+        analyzer.on_bbo(bbo)
+        history.append((timestamp, float(bbo.bid_price), float(bbo.ask_price)))
+
+        for window in analyzer.windows_s:
+            samples = [s for s in history if s[0] > timestamp - window * SECOND_NS]
+            spreads = [(ask - bid) / bid for _, bid, ask in samples]
+            stats = analyzer.get_window_stats(window)
+            assert stats["samples"] == len(samples)
+            assert stats["avg_spread_bps"] == pytest.approx(sum(spreads) / len(spreads) * 10000, rel=1e-9)
+
+        history = [s for s in history if s[0] > timestamp - 60 * SECOND_NS]
+
+    # Only samples inside the longest window stay buffered
+    assert len(analyzer._samples) == len(history)
+
+
+def test_time_window_spread_state():
+    analyzer = TimeWindowAnalyzer(windows_s=(5,))
+    for i in range(10):
+        analyzer.on_bbo(bbo_at(i * 0.1, 3000, 3001))
+    assert analyzer.get_spread_state(5) == "STABLE"
+
+    analyzer.on_bbo(bbo_at(1.0, 3000, 3010))
+    assert analyzer.get_spread_state(5) == "WIDENING"
+
+    # 10s later only the narrow samples remain in the window
+    for i in range(10):
+        analyzer.on_bbo(bbo_at(11 + i * 0.1, 3000, 3001))
+    assert analyzer.get_spread_state(5) == "STABLE"
@@ -0,0 +1,107 @@
+"""
+BBO snapshot tests.
+
+BBOData is immutable with derived fields computed at construction; the
+handler publishes one snapshot per tick carrying that tick's analyzer states.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bbo_handler import BBOData, BBOHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def bbo_message(bid, ask, timestamp):
+    return {
+        "product_id": 4,
+        "bid_price": str(int(Decimal(bid) * 10 ** 18)),
+        "bid_qty": str(10 ** 18),
+        "ask_price": str(int(Decimal(ask) * 10 ** 18)),
+        "ask_qty": str(2 * 10 ** 18),
+        "timestamp": str(timestamp),
+    }
+
+
+def test_derived_fields_computed_once():
+    bbo = BBOData(4, Decimal("3000"), Decimal("1"), Decimal("3001"), Decimal("2"), 1)
+
+    assert bbo.spread == Decimal("1")
+    assert bbo.mid_price == Decimal("3000.5")
+    assert bbo.spread_bps == Decimal("1") / Decimal("3000.5") * 10000
+    assert (bbo.spread_state, bbo.momentum) == ("STABLE", "NEUTRAL")
+    assert not hasattr(bbo, "__dict__")
+
+
+def test_snapshot_is_immutable():
+    bbo = BBOData(4, Decimal("3000"), Decimal("1"), Decimal("3001"), Decimal("2"), 1)
+
+    with pytest.raises(AttributeError):
+        bbo.bid_price = Decimal("1")
+    with pytest.raises(AttributeError):
+        del bbo.ask_price
+    with pytest.raises(AttributeError):
+        bbo.extra = 1
+
+
+def test_zero_mid_spread_bps():
+    bbo = BBOData(4, Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0"), 0)
+    assert bbo.spread_bps == Decimal(0)
+
+
+def test_with_states_copies_fields():
+    bbo = BBOData(4, Decimal("3000"), Decimal("1"), Decimal("3001"), Decimal("2"), 7)
+    tagged = bbo.with_states("WIDENING", "BULLISH")
+
+    assert tagged is not bbo
+    assert (tagged.spread_state, tagged.momentum) == ("WIDENING", "BULLISH")
+    assert (tagged.bid_price, tagged.ask_qty, tagged.timestamp, tagged.spread) == (
+        bbo.bid_price, bbo.ask_qty, bbo.timestamp, bbo.spread
+    )
+    assert bbo.spread_state == "STABLE"
+
+
+@pytest.mark.asyncio
+async def test_handler_publishes_new_snapshot_per_tick():
+    handler = BBOHandler(4, NadoWebSocketClient(product_ids=[4]))
+
+    for i in range(10):
+        await handler._on_bbo_message(bbo_message(3000 + i * 10, 3001 + i * 10, 1_000 + i))
+    held = handler.get_latest_bbo()
+
+    await handler._on_bbo_message(bbo_message(3200, 3210, 2_000))
+    latest = handler.get_latest_bbo()
+
+    # A held snapshot keeps its own tick
+    assert held.bid_price == Decimal("3090")
+    assert held.momentum == "BULLISH"
+    assert latest is not held
+    assert latest.bid_price == Decimal("3200")
+    assert latest.spread_state == handler.get_spread_state() == "WIDENING"
+    assert latest.momentum == handler.get_momentum()
+
+
+@pytest.mark.asyncio
+async def test_handler_builds_one_snapshot_per_tick(monkeypatch):
+    built = []
+
+    class CountingBBOData(BBOData):
+        __slots__ = ()
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            built.append(self)
+
+    monkeypatch.setattr("exchanges.nado_bbo_handler.BBOData", CountingBBOData)
+    handler = BBOHandler(4, NadoWebSocketClient(product_ids=[4]))
+
+    await handler._on_bbo_message(bbo_message(3000, 3001, 1_000))
+    assert built == [handler.get_latest_bbo()]
+
+    # A malformed tick neither publishes nor reaches the analyzers
+    bad = bbo_message(3100, 3101, 2_000)
+    del bad["ask_qty"]
+    await handler._on_bbo_message(bad)
+    assert len(built) == 1
+    assert handler.momentum_detector.mid_stats.count == 1
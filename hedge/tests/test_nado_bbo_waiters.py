@@ -0,0 +1,110 @@
+"""
+BBO waiter tests.
+
+wait_until()/wait_until_pair() resolve on the tick that satisfies the
+predicate instead of on a polling interval.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bbo_handler import BBOHandler, wait_until_pair
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def bbo_message(product_id, bid, ask, timestamp):
+    return {
+        "product_id": product_id,
+        "bid_price": str(int(Decimal(bid) * 10 ** 18)),
+        "bid_qty": str(10 ** 18),
+        "ask_price": str(int(Decimal(ask) * 10 ** 18)),
+        "ask_qty": str(10 ** 18),
+        "timestamp": str(timestamp),
+    }
+
+
+@pytest.fixture
+def handlers():
+    client = NadoWebSocketClient(product_ids=[4, 8])
+    return BBOHandler(4, client), BBOHandler(8, client)
+
+
+async def feed(handler, prices, delay=0.001):
+    for i, (bid, ask) in enumerate(prices):
+        await asyncio.sleep(delay)
+        await handler._on_bbo_message(bbo_message(handler.product_id, bid, ask, i))
+
+
+@pytest.mark.asyncio
+async def test_wait_until_wakes_on_satisfying_tick(handlers):
+    eth, _ = handlers
+    feeder = asyncio.create_task(feed(eth, [(3000 + i, 3001 + i) for i in range(20)]))
+
+    bbo = await eth.wait_until(lambda b: b.bid_price >= 3010, timeout=5)
+    await feeder
+
+    assert bbo.bid_price == Decimal("3010")
+    assert eth._tick_listeners == []
+
+
+@pytest.mark.asyncio
+async def test_wait_until_checks_latest_first(handlers):
+    eth, _ = handlers
+    await eth._on_bbo_message(bbo_message(4, 3000, 3001, 1))
+
+    bbo = await eth.wait_until(lambda b: b.ask_price == 3001, timeout=0)
+
+    assert bbo is eth.get_latest_bbo()
+
+
+@pytest.mark.asyncio
+async def test_wait_until_timeout(handlers):
+    eth, _ = handlers
+    start = time.perf_counter()
+
+    assert await eth.wait_until(lambda b: True, timeout=0.05) is None
+    assert time.perf_counter() - start >= 0.04
+    assert eth._tick_listeners == []
+
+
+@pytest.mark.asyncio
+async def test_wait_until_propagates_predicate_error(handlers):
+    eth, _ = handlers
+    waiter = asyncio.create_task(eth.wait_until(lambda b: 1 / 0, timeout=1))
+    await asyncio.sleep(0)
+    await eth._on_bbo_message(bbo_message(4, 3000, 3001, 1))
+
+    with pytest.raises(ZeroDivisionError):
+        await waiter
+    assert eth._tick_listeners == []
+
+
+@pytest.mark.asyncio
+async def test_pair_waiter_sees_both_legs(handlers):
+    eth, sol = handlers
+    await eth._on_bbo_message(bbo_message(4, 3000, 3001, 1))
+
+    # Needs SOL data and an ETH move; either leg's tick re-evaluates
+    waiter = asyncio.create_task(wait_until_pair(
+        eth, sol, lambda e, s: e.bid_price >= 3005 and s.ask_price <= 100, timeout=2
+    ))
+    await asyncio.sleep(0)
+    await sol._on_bbo_message(bbo_message(8, 99, 100, 1))
+    assert not waiter.done()
+
+    start = time.perf_counter()
+    await eth._on_bbo_message(bbo_message(4, 3005, 3006, 2))
+    eth_bbo, sol_bbo = await waiter
+
+    assert time.perf_counter() - start < 0.05
+    assert (eth_bbo.bid_price, sol_bbo.ask_price) == (Decimal("3005"), Decimal("100"))
+    assert eth._tick_listeners == [] and sol._tick_listeners == []
+
+
+@pytest.mark.asyncio
+async def test_pair_waiter_timeout(handlers):
+    eth, sol = handlers
+    assert await wait_until_pair(eth, sol, lambda e, s: True, timeout=0.02) is None
@@ -0,0 +1,119 @@
+"""
+Book snapshot sink tests.
+
+Top-N snapshots are sampled on the event loop and written by a background
+thread to per-(product, hour) Parquet/Arrow partitions.
+"""
+
+import asyncio
+import os
+from decimal import Decimal
+
+import pytest
+
+from exchanges import nado_book_snapshot_sink
+from exchanges.nado_book_snapshot_sink import BookSnapshotSink, partition_dir
+from exchanges.nado_bookdepth_handler import BookDepthHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+HOUR_NS = 3600 * 10 ** 9
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def make_book(product_id, best_bid, best_ask, levels=3):
+    handler = BookDepthHandler(product_id, NadoWebSocketClient(product_ids=[product_id]))
+    handler._apply_delta({
+        "max_timestamp": "1700000000000000000",
+        "bids": [[x18(str(best_bid - k)), x18(str(k + 1))] for k in range(levels)],
+        "asks": [[x18(str(best_ask + k)), x18(str(k + 1))] for k in range(levels)],
+    })
+    return handler
+
+
+def test_partition_dir():
+    # 2023-11-14T22:13:20Z
+    assert partition_dir("root", 4, 1_700_000_000 * 10 ** 9) == os.path.join(
+        "root", "product_id=4", "hour=2023-11-14T22"
+    )
+
+
+def test_requires_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setattr(nado_book_snapshot_sink, "PYARROW_AVAILABLE", False)
+    with pytest.raises(ImportError):
+        BookSnapshotSink([], str(tmp_path))
+
+
+@pytest.fixture
+def pq():
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+    return pyarrow.parquet
+
+
+def read_partitions(pq, root):
+    rows = []
+    for directory, _, files in sorted(os.walk(root)):
+        for name in files:
+            rows.extend(pq.read_table(os.path.join(directory, name)).to_pylist())
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_samples_written_per_product(pq, tmp_path):
+    eth, sol = make_book(4, 3000, 3001), make_book(8, 150, 151, levels=1)
+    cold = BookDepthHandler(2, NadoWebSocketClient(product_ids=[2]))
+    sink = BookSnapshotSink([eth, sol, cold], str(tmp_path), interval_s=0.01, levels=2, flush_interval_s=0.02)
+
+    await sink.start()
+    await asyncio.sleep(0.1)
+    await sink.stop()
+
+    rows = read_partitions(pq, tmp_path)
+    assert sink.rows_written == len(rows) > 0
+    assert {row["product_id"] for row in rows} == {4, 8}
+    assert sorted(os.listdir(tmp_path)) == ["product_id=4", "product_id=8"]
+
+    eth_row = next(row for row in rows if row["product_id"] == 4)
+    assert eth_row["bid_price"] == [3000.0, 2999.0]
+    assert eth_row["ask_qty"] == [1.0, 2.0]
+    assert eth_row["book_timestamp"] == 1700000000000000000
+    sol_row = next(row for row in rows if row["product_id"] == 8)
+    assert (sol_row["bid_price"], sol_row["ask_price"]) == ([150.0], [151.0])
+
+
+def test_hour_rollover_and_arrow_format(pq, tmp_path):
+    import pyarrow
+
+    sink = BookSnapshotSink([], str(tmp_path), file_format="arrow")
+    base = 1_700_000_000 * 10 ** 9
+    row = lambda ts: (ts, 1, 4, [(3000 * 10 ** 18, 10 ** 18)], [(3001 * 10 ** 18, 10 ** 18)])
+
+    sink._write_batch([row(base), row(base + 1)])
+    sink._write_batch([row(base + 2), row(base + HOUR_NS)])
+    for _, writer in sink._writers.values():
+        writer.close()
+
+    first = partition_dir(str(tmp_path), 4, base)
+    second = partition_dir(str(tmp_path), 4, base + HOUR_NS)
+    counts = {}
+    for directory in (first, second):
+        (name,) = os.listdir(directory)
+        assert name.endswith(".arrow")
+        with pyarrow.ipc.open_file(os.path.join(directory, name)) as reader:
+            counts[directory] = reader.read_all().num_rows
+    assert counts == {first: 3, second: 1}
+
+
+def test_full_queue_drops(pq, tmp_path):
+    sink = BookSnapshotSink([make_book(4, 3000, 3001)], str(tmp_path), max_queue=2)
+
+    assert [sink.sample() for _ in range(3)] == [1, 1, 0]
+    assert sink.dropped == 1
+
+
+def test_invalid_format(pq, tmp_path):
+    with pytest.raises(ValueError):
+        BookSnapshotSink([], str(tmp_path), file_format="csv")
@@ -0,0 +1,120 @@
+"""
+BookDepthHandler top-of-book feature tests.
+
+Depth, imbalance, microprice and band notionals are kept per book update;
+results must match a direct computation over the levels.
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bookdepth_handler import BookDepthHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def scan_band_notional(handler, side, bps):
+    """Reference: scan every level of the side."""
+    best_bid, _ = handler.get_best_bid()
+    best_ask, _ = handler.get_best_ask()
+    levels = handler.bids.items() if side == "bid" else handler.asks.items()
+    total = Decimal(0)
+    for price, qty in levels:
+        if side == "bid" and price * 20000 >= (best_bid + best_ask) * (10000 - bps):
+            total += price * qty
+        if side == "ask" and price * 20000 <= (best_bid + best_ask) * (10000 + bps):
+            total += price * qty
+    return total
+
+
+@pytest.fixture
+def handler():
+    handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    handler._apply_delta({
+        "bids": [[x18("3000"), x18("1")], [x18("2999"), x18("2")], [x18("2997"), x18("3")],
+                 [x18("2990"), x18("4")], [x18("2980"), x18("5")], [x18("2970"), x18("6")]],
+        "asks": [[x18("3001"), x18("3")], [x18("3002"), x18("1")], [x18("3005"), x18("2")]],
+    })
+    return handler
+
+
+def test_top_depth_and_imbalance(handler):
+    assert handler.get_top_depth("bid") == Decimal("15")
+    assert handler.get_top_depth("ask") == Decimal("6")
+    assert handler.get_imbalance() == Decimal("9") / Decimal("21")
+
+
+def test_microprice_leans_to_thinner_side(handler):
+    # (3000 * 3 + 3001 * 1) / 4
+    assert handler.get_microprice() == Decimal("3000.25")
+
+
+def test_band_notional(handler):
+    # mid 3000.5: 5 bps = 1.50025 -> bids >= 2999.0, asks <= 3002.0
+    assert handler.get_notional_within_bps("bid", 5) == Decimal("8998")
+    assert handler.get_notional_within_bps("ask", 5) == Decimal("12005")
+    # 20 bps = 6.001 -> bids >= 2994.499, asks <= 3006.501
+    assert handler.get_notional_within_bps("bid", 20) == Decimal("17989")
+    assert handler.get_notional_within_bps("ask", 20) == Decimal("18015")
+    # Width outside FEATURE_BANDS_BPS walks on demand
+    assert handler.get_notional_within_bps("bid", 40) == Decimal("29949")
+
+
+def test_features_follow_deltas(handler):
+    handler.get_notional_within_bps("ask", 5)
+    handler._apply_delta({"asks": [[x18("3001"), "0"]], "bids": [[x18("3000"), x18("4")]]})
+
+    assert handler.get_top_depth("ask") == Decimal("3")
+    assert handler.get_microprice() == Decimal("3001.6")
+    # mid 3001: 5 bps band is [2999.4995, 3002.5005]
+    assert handler.get_notional_within_bps("ask", 5) == Decimal("3002")
+    assert handler.get_notional_within_bps("bid", 5) == Decimal("12000")
+
+
+def test_empty_and_one_sided_book():
+    handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    assert handler.get_imbalance() is None
+    assert handler.get_microprice() is None
+    assert handler.get_notional_within_bps("bid", 10) == Decimal(0)
+
+    handler._apply_delta({"bids": [[x18("3000"), x18("1")]]})
+    assert handler.get_imbalance() == Decimal(1)
+    assert handler.get_microprice() is None
+    assert handler.get_notional_within_bps("bid", 10) == Decimal(0)
+
+    handler.invalidate("test")
+    assert handler.get_top_depth("bid") == Decimal(0)
+
+
+def test_get_features(handler):
+    features = handler.get_features()
+
+    assert features["bid_depth"] == Decimal("15")
+    assert features["microprice"] == Decimal("3000.25")
+    assert features["ask_notional_10bps"] == handler.get_notional_within_bps("ask", 10)
+    assert set(features) >= {f"bid_notional_{bps}bps" for bps in BookDepthHandler.FEATURE_BANDS_BPS}
+
+
+def test_random_books_match_scan():
+    rng = random.Random(11)
+    handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    for _ in range(200):
+        mid = rng.randint(29900, 30100)
+        handler._apply_delta({
+            "bids": [[x18(str((mid - k) / 10)), "0" if rng.random() < 0.2 else x18(str(rng.randint(1, 50) / 10))]
+                     for k in rng.sample(range(1, 120), 6)],
+            "asks": [[x18(str((mid + k) / 10)), "0" if rng.random() < 0.2 else x18(str(rng.randint(1, 50) / 10))]
+                     for k in rng.sample(range(1, 120), 6)],
+        })
+        if not handler._bids or not handler._asks or handler.get_best_bid()[0] >= handler.get_best_ask()[0]:
+            continue
+        top_bids = [qty for _, qty in handler.get_top_levels("bid", BookDepthHandler.FEATURE_LEVELS)]
+        assert handler.get_top_depth("bid") == sum(top_bids)
+        for bps in (5, 10, 20, 7):
+            assert handler.get_notional_within_bps("bid", bps) == scan_band_notional(handler, "bid", bps)
+            assert handler.get_notional_within_bps("ask", bps) == scan_band_notional(handler, "ask", bps)
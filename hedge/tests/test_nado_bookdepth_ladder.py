@@ -0,0 +1,119 @@
+"""
+BookDepthHandler cumulative-depth query tests.
+
+VWAP, slippage and max-quantity-within-bps come from per-side prefix sums;
+results must match a level-by-level walk of the book.
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bookdepth_handler import BookDepthHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def walk_slippage(handler, side, quantity):
+    """Reference slippage: walk the levels best first."""
+    levels = list(handler.asks.items()) if side == "buy" else list(handler.bids.items())
+    best = levels[0][0]
+    remaining, notional = quantity, Decimal(0)
+    for price, qty in levels:
+        take = min(remaining, qty)
+        notional += price * take
+        remaining -= take
+    if remaining > 0:
+        return None
+    vwap = notional / quantity
+    return (vwap - best) / best * 10000 if side == "buy" else (best - vwap) / best * 10000
+
+
+@pytest.fixture
+def handler():
+    handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    handler._apply_delta({
+        "bids": [[x18("3000"), x18("0.5")], [x18("2999"), x18("1")], [x18("2997"), x18("2")]],
+        "asks": [[x18("3001"), x18("1")], [x18("3002"), x18("1")], [x18("3004"), x18("2")]],
+    })
+    return handler
+
+
+def test_vwap_partial_level(handler):
+    assert handler.get_vwap("buy", Decimal("1.5")) == Decimal("3001.333333333333333333333333")
+    assert handler.get_vwap("sell", Decimal("0.5")) == Decimal("3000")
+    assert handler.get_vwap("buy", Decimal("5")) is None
+    assert handler.get_vwap("buy", Decimal("0")) is None
+
+
+def test_ladder_rebuilt_after_delta(handler):
+    first = handler.get_depth_ladder("buy")
+    assert handler.get_depth_ladder("buy") is first
+
+    handler._apply_delta({"asks": [[x18("3001"), "0"]]})
+
+    assert handler.get_depth_ladder("buy") is not first
+    assert handler.get_vwap("buy", Decimal("1")) == Decimal("3002")
+
+
+def test_max_quantity_solves_partial_level(handler):
+    # Asks: 1 @ 3001, 1 @ 3002 -> VWAP(2) = 3001.5 = 1.666 bps; limit 5 bps = 3002.5005
+    # Third level 3004: (6003 + 3004x) / (2 + x) = 3002.5005 -> x = 1.3344...
+    quantity = handler.get_max_quantity_within_slippage("buy", 5)
+
+    assert Decimal("3.33") < quantity < Decimal("3.34")
+    assert handler.estimate_slippage("buy", quantity) <= 5
+    assert handler.estimate_slippage("buy", quantity + Decimal("0.000001")) > 5
+
+
+def test_max_quantity_bounds(handler):
+    assert handler.get_max_quantity_within_slippage("sell", 0) == Decimal("0.5")
+    assert handler.get_max_quantity_within_slippage("sell", 10000) == Decimal("3.5")
+    assert handler.get_max_quantity_within_slippage("buy", -1) == Decimal(0)
+
+    empty = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    assert empty.get_max_quantity_within_slippage("buy", 20) == Decimal(0)
+
+
+def test_exit_capacity_uses_exact_boundary(handler):
+    # Long 3.5: selling the whole bid side is 6.67 bps
+    assert handler.estimate_exit_capacity(Decimal("3.5"), max_slippage_bps=7) == (True, Decimal("3.5"))
+
+    can_exit, qty = handler.estimate_exit_capacity(Decimal("3.5"), max_slippage_bps=2)
+    assert not can_exit
+    assert qty == handler.get_max_quantity_within_slippage("sell", 2)
+    assert handler.estimate_slippage("sell", qty) <= 2
+
+    # Short larger than the book: capped by available depth
+    can_exit, qty = handler.estimate_exit_capacity(Decimal("-10"), max_slippage_bps=100)
+    assert not can_exit
+    assert qty == Decimal("4")
+
+
+def test_random_books_match_walk():
+    rng = random.Random(3)
+    for _ in range(20):
+        handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+        handler._apply_delta({
+            "bids": [[x18(str(3000 - k)), x18(str(rng.randint(1, 300) / 100))] for k in range(rng.randint(1, 40))],
+            "asks": [[x18(str(3001 + k)), x18(str(rng.randint(1, 300) / 100))] for k in range(rng.randint(1, 40))],
+        })
+        for side in ("buy", "sell"):
+            quantity = Decimal(rng.randint(1, 2000)) / 100
+            expected = walk_slippage(handler, side, quantity)
+            slippage = handler.estimate_slippage(side, quantity)
+            if expected is None:
+                assert slippage == Decimal(999999)
+            else:
+                assert abs(slippage - expected) < Decimal("1e-18")
+
+            bps = rng.choice((1, 5, 20, 50))
+            max_qty = handler.get_max_quantity_within_slippage(side, bps)
+            assert walk_slippage(handler, side, max_qty) <= bps
+            over = max_qty + Decimal("0.0001")
+            over_slippage = walk_slippage(handler, side, over)
+            assert over_slippage is None or over_slippage > bps
@@ -0,0 +1,164 @@
+"""
+BookDepth resync tests.
+
+After a reconnect or a gap in the BookDepth delta chain, the local book is
+rebuilt from a REST snapshot and deltas received during the fetch are replayed
+when newer than the snapshot. Private streams keep their subaccount when the
+client resubscribes.
+"""
+
+import asyncio
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from exchanges.nado_bookdepth_handler import BookDepthHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+SUBACCOUNT = "0x" + "aa" * 32
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def delta(last_max: int, max_ts: int, bids=(), asks=()) -> dict:
+    return {
+        "type": "book_depth",
+        "product_id": 4,
+        "last_max_timestamp": str(last_max),
+        "max_timestamp": str(max_ts),
+        "bids": [[x18(p), x18(q)] for p, q in bids],
+        "asks": [[x18(p), x18(q)] for p, q in asks],
+    }
+
+
+@pytest.fixture
+def ws_client():
+    client = NadoWebSocketClient(product_ids=[4])
+    client._ws = Mock()
+    client._ws.send = AsyncMock()
+    client._state = "connected"
+    return client
+
+
+class SlowSnapshot:
+    """Snapshot fetcher that returns only when released."""
+
+    def __init__(self, timestamp, bids, asks):
+        self.result = (timestamp, bids, asks)
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_reconnect_rebuilds_book_and_replays_newer_deltas(ws_client):
+    snapshot = SlowSnapshot(200, [(Decimal("3000"), Decimal("1"))], [(Decimal("3001"), Decimal("2"))])
+    snapshot.release.set()
+    handler = BookDepthHandler(4, ws_client, snapshot_fetcher=snapshot)
+    await handler.start()
+    await handler._resync_task
+    await handler._on_bookdepth_message(delta(150, 300, bids=[("2999", "5")]))
+
+    snapshot.release.clear()
+    snapshot.result = (500, [(Decimal("3100"), Decimal("1"))], [(Decimal("3101"), Decimal("1"))])
+    await ws_client._notify_reconnected()
+
+    # Book is discarded immediately, deltas are buffered while the fetch runs
+    assert handler.is_resyncing
+    assert not handler.bids and handler.last_timestamp == 0
+    await handler._on_bookdepth_message(delta(300, 450, bids=[("3100", "9")]))  # in snapshot
+    await handler._on_bookdepth_message(delta(450, 600, asks=[("3102", "4")]))  # newer
+
+    snapshot.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert not handler.is_resyncing
+    assert dict(handler.bids) == {Decimal("3100"): Decimal("1")}
+    assert dict(handler.asks) == {Decimal("3101"): Decimal("1"), Decimal("3102"): Decimal("4")}
+    assert handler.last_timestamp == 600
+    assert handler.resync_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gap_in_delta_chain_triggers_resync(ws_client):
+    snapshot = SlowSnapshot(350, [(Decimal("3005"), Decimal("1"))], [])
+    handler = BookDepthHandler(4, ws_client, snapshot_fetcher=snapshot)
+    await handler._on_bookdepth_message(delta(0, 100, bids=[("3000", "1")]))
+    await handler._on_bookdepth_message(delta(100, 200, bids=[("2999", "1")]))
+    assert snapshot.calls == 0
+
+    await handler._on_bookdepth_message(delta(300, 400, bids=[("3004", "2")]))  # 200 -> 300 missing
+
+    assert handler.is_resyncing
+    snapshot.release.set()
+    await handler._resync_task
+
+    assert dict(handler.bids) == {Decimal("3005"): Decimal("1"), Decimal("3004"): Decimal("2")}
+    assert handler.last_timestamp == 400
+
+
+@pytest.mark.asyncio
+async def test_gap_without_snapshot_fetcher_clears_stale_levels(ws_client):
+    handler = BookDepthHandler(4, ws_client)
+    await handler._on_bookdepth_message(delta(0, 100, bids=[("3000", "1")]))
+    await handler._on_bookdepth_message(delta(300, 400, bids=[("2990", "1")]))
+
+    assert dict(handler.bids) == {Decimal("2990"): Decimal("1")}
+
+
+@pytest.mark.asyncio
+async def test_failed_snapshot_falls_back_to_buffered_deltas(ws_client):
+    handler = BookDepthHandler(4, ws_client, snapshot_fetcher=AsyncMock(side_effect=RuntimeError("503")))
+    await handler.start()
+    await handler._on_bookdepth_message(delta(0, 100, bids=[("3000", "1")]))
+    await handler._resync_task
+
+    assert not handler.is_resyncing
+    assert dict(handler.bids) == {Decimal("3000"): Decimal("1")}
+
+
+@pytest.mark.asyncio
+async def test_stop_unregisters_reconnect_callback(ws_client):
+    handler = BookDepthHandler(4, ws_client)
+    await handler.start()
+    await handler.stop()
+
+    assert ws_client._reconnect_callbacks == []
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_keeps_private_stream_subaccount(ws_client):
+    await ws_client.subscribe("book_depth", 4, callback=Mock())
+    await ws_client.subscribe("fill", 4, callback=Mock(), subaccount=SUBACCOUNT)
+    ws_client._ws.send.reset_mock()
+
+    await ws_client._resubscribe_all()
+
+    streams = [json.loads(c.args[0])["stream"] for c in ws_client._ws.send.await_args_list]
+    assert {"type": "book_depth", "product_id": 4} in streams
+    assert {"type": "fill", "product_id": 4, "subaccount": SUBACCOUNT} in streams
+
+
+@pytest.mark.asyncio
+async def test_reconnect_notifies_listeners_after_connect(ws_client):
+    order = []
+    ws_client.register_reconnect_callback(lambda: order.append("notified"))
+
+    async def fake_connect():
+        order.append("connected")
+
+    with patch.object(ws_client, "connect", side_effect=fake_connect):
+        ws_client.RECONNECT_DELAY_BASE = 0
+        await ws_client._reconnect()
+
+    assert order == ["connected", "notified"]
@@ -0,0 +1,97 @@
+"""
+BookDepthHandler x18 integer book tests.
+
+The book is stored as x18 integers; public getters and the bids/asks views
+return the same Decimals the previous Decimal-keyed book did.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bookdepth_handler import BookDepthHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+@pytest.fixture
+def handler():
+    handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    handler._apply_delta({
+        "bids": [[x18("3000"), x18("0.5")], [x18("2999.9"), x18("1.25")], [x18("2999"), x18("2")]],
+        "asks": [[x18("3000.1"), x18("1")], [x18("3001"), x18("0.75")], [x18("3002.5"), x18("3")]],
+    })
+    return handler
+
+
+def test_levels_stored_as_x18_integers(handler):
+    assert handler._asks.peekitem(0) == (int(x18("3000.1")), int(x18("1")))
+    assert handler._bids.peekitem(0) == (-int(x18("3000")), int(x18("0.5")))
+
+
+def test_views_convert_at_the_boundary(handler):
+    assert list(handler.bids) == [Decimal("3000"), Decimal("2999.9"), Decimal("2999")]
+    assert handler.asks[Decimal("3001")] == Decimal("0.75")
+    assert Decimal("2999.9") in handler.bids
+    assert Decimal("2999.95") not in handler.bids
+    assert len(handler.asks) == 3
+
+
+def test_getters_return_decimals(handler):
+    assert handler.get_best_bid() == (Decimal("3000"), Decimal("0.5"))
+    assert handler.get_depth_at_level(2, "ask") == (Decimal("3002.5"), Decimal("3"))
+    assert handler.get_depth_at_level(3, "ask") == (None, None)
+    assert handler.get_available_liquidity("bid", max_depth=2) == Decimal("1.75")
+
+
+@pytest.mark.parametrize("side,quantity", [("buy", "1.5"), ("buy", "4.75"), ("sell", "0.5"), ("sell", "3")])
+def test_slippage_matches_decimal_walk(handler, side, quantity):
+    quantity = Decimal(quantity)
+    levels = list(handler.asks.items()) if side == "buy" else list(handler.bids.items())
+    best = levels[0][0]
+    remaining, notional = quantity, Decimal(0)
+    for price, qty in levels:
+        take = min(remaining, qty)
+        notional += price * take
+        remaining -= take
+    vwap = notional / quantity
+    expected = (vwap - best) / best * 10000 if side == "buy" else (best - vwap) / best * 10000
+
+    assert handler.estimate_slippage(side, quantity) == pytest.approx(expected, abs=Decimal("1e-20"))
+
+
+def test_insufficient_liquidity_and_zero_quantity(handler):
+    assert handler.estimate_slippage("buy", Decimal("5")) == Decimal(999999)
+    assert handler.estimate_slippage("sell", Decimal("0")) == Decimal(999999)
+
+
+def test_delete_level(handler):
+    handler._apply_delta({"bids": [[x18("2999.9"), "0"]], "asks": []})
+
+    assert Decimal("2999.9") not in handler.bids
+    assert handler.get_depth_at_level(1, "bid") == (Decimal("2999"), Decimal("2"))
+
+
+def test_top_levels_best_first(handler):
+    assert handler.get_top_levels("bid", 2) == [(Decimal("3000"), Decimal("0.5")), (Decimal("2999.9"), Decimal("1.25"))]
+    assert list(handler.iter_levels("ask")) == [
+        (Decimal("3000.1"), Decimal("1")), (Decimal("3001"), Decimal("0.75")), (Decimal("3002.5"), Decimal("3")),
+    ]
+    assert len(handler.get_top_levels("ask", 10)) == 3
+    assert handler.get_depth_at_level(-1, "bid") == (None, None)
+
+
+def test_order_book_summary(handler):
+    summary = handler.get_order_book_summary(max_levels=2)
+
+    assert summary["bid_levels"] == [
+        {"level": 0, "price": "3000", "quantity": "0.5"},
+        {"level": 1, "price": "2999.9", "quantity": "1.25"},
+    ]
+    assert [level["price"] for level in summary["ask_levels"]] == ["3000.1", "3001"]
+    assert summary["total_bid_liquidity"] == "3.75"
+    assert summary["total_ask_liquidity"] == "4.75"
+    assert summary["spread"] == "0.1"
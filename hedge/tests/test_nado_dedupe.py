@@ -0,0 +1,74 @@
+"""
+Dedupe cache tests.
+
+ExpiringDedupe forgets keys after its horizon and evicts the least recently
+added keys beyond max_size; FillHandler keeps its fill ledger in one.
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from exchanges.nado_dedupe import ExpiringDedupe
+from exchanges.nado_fill_handler import FillHandler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_set_operations_and_horizon():
+    clock = FakeClock()
+    seen = ExpiringDedupe(horizon_s=60, clock=clock)
+
+    seen.add(("0xabc", "1", "0"))
+    seen.add("bridge")
+    assert ("0xabc", "1", "0") in seen and len(seen) == 2
+
+    seen.discard("bridge")
+    assert "bridge" not in seen
+
+    clock.now += 61
+    assert ("0xabc", "1", "0") not in seen
+    assert seen.get_stats() == {"size": 0, "max_size": 100_000, "horizon_s": 60, "expired": 1, "evicted": 0}
+
+
+def test_readd_refreshes_age_and_lru_eviction():
+    clock = FakeClock()
+    cache = ExpiringDedupe(horizon_s=60, max_size=2, clock=clock)
+
+    cache.add("a", 1)
+    clock.now += 40
+    cache.add("b", 2)
+    cache.add("a", 3)  # refreshed: now newest
+    clock.now += 30
+    assert cache.get("a") == 3 and "b" in cache
+
+    cache.add("c", 4)  # over max_size: evicts least recently added ("b")
+    assert [key for key, _ in cache.items()] == ["a", "c"]
+    assert cache.evicted == 1
+    assert cache.pop("a") == 3 and cache.get("a") is None
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        ExpiringDedupe(horizon_s=0)
+
+
+@pytest.mark.asyncio
+async def test_fill_ledger_bounded():
+    handler = FillHandler(
+        product_id=4, subaccount="0x" + "00" * 32, ws_client=MagicMock(), ledger_max_orders=3
+    )
+    for index in range(5):
+        await handler._on_fill_message({"order_id": f"0x{index}", "filled_size": "1", "price": "3000"})
+
+    stats = handler.get_ledger_stats()
+    assert (stats["size"], stats["evicted"]) == (3, 2)
+    assert handler.get_fill_info("0x0") is None
+    assert handler.get_fill_info("0x4")["filled_quantity"] == Decimal("1")
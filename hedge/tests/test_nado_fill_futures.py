@@ -0,0 +1,170 @@
+"""
+Fill future tests.
+
+track_order() returns an awaitable that resolves on the WebSocket fill that
+completes the order; NadoClient waits on it and only reconciles over REST
+at FILL_RECONCILE_INTERVAL.
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from exchanges.nado import NadoClient
+from exchanges.nado_fill_handler import FillHandler
+
+ORDER = "0xabc123"
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def fill(qty, price, remaining=None, order_id=ORDER):
+    message = {"order_digest": order_id, "filled_qty": x18(qty), "price": x18(price), "is_bid": True}
+    if remaining is not None:
+        message["remaining_qty"] = x18(remaining)
+    return message
+
+
+@pytest.fixture
+def handler():
+    return FillHandler(product_id=4, subaccount="0x" + "00" * 32, ws_client=MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_future_resolves_on_completing_fill_with_vwap(handler):
+    future = handler.track_order(ORDER, Decimal("1.0"))
+    waiter = asyncio.ensure_future(future)
+
+    await handler._on_fill_message(fill("0.4", "3000", remaining="0.6"))
+    await asyncio.sleep(0)
+    assert not waiter.done() and handler.is_pending(ORDER)
+    assert handler.get_fill_info(ORDER) is None
+
+    await handler._on_fill_message(fill("0.6", "3005", remaining="0"))
+    info = await asyncio.wait_for(waiter, 1)
+
+    assert info["filled_quantity"] == Decimal("1.0")
+    assert info["price"] == (Decimal("0.4") * 3000 + Decimal("0.6") * 3005) / Decimal("1.0")
+    assert future.done() and handler.get_fill_info(ORDER) == info
+
+
+@pytest.mark.asyncio
+async def test_cumulative_quantity_completes_without_remaining(handler):
+    future = handler.track_order(ORDER, Decimal("0.2"))
+    await handler._on_fill_message({"order_id": ORDER, "filled_size": x18("0.1"), "price": x18("3000")})
+    assert not future.done()
+
+    await handler._on_fill_message({"order_id": ORDER, "filled_size": x18("0.1"), "price": x18("3010")})
+    info = await future
+    assert info["filled_quantity"] == Decimal("0.2")
+    assert info["price"] == Decimal("3005")
+
+
+@pytest.mark.asyncio
+async def test_fill_before_tracking(handler):
+    await handler._on_fill_message(fill("1", "3000", remaining="0"))
+
+    info = await handler.track_order(ORDER, Decimal("1"))
+    assert info["filled_quantity"] == Decimal("1")
+
+
+@pytest.mark.asyncio
+async def test_untrack_and_timeout_release_waiters(handler):
+    handler.track_order(ORDER, Decimal("1"))
+    assert await handler.wait_for_fill(ORDER, timeout=0.01) is None
+
+    waiter = asyncio.ensure_future(handler.wait_for_fill(ORDER))
+    await asyncio.sleep(0)
+    await handler._on_fill_message(fill("0.3", "3000", remaining="0.7"))
+
+    assert handler.untrack_order(ORDER) == Decimal("0.3")
+    assert await waiter is None
+    assert not handler.is_pending(ORDER)
+
+
+def make_client(handler, order_info, stream_live=True):
+    client = object.__new__(NadoClient)
+    client.logger = SimpleNamespace(log=lambda *args: None)
+    client._ws_connected = True
+    client._ws_client = MagicMock()
+    client._ws_client.is_stream_live.return_value = stream_live
+    client._fill_handler = handler
+    client.get_order_info = AsyncMock(return_value=order_info)
+    client.cancel_order = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_poll_wakes_on_ws_fill_without_rest(handler):
+    open_order = SimpleNamespace(remaining_size=Decimal("1"), filled_size=Decimal("0"), status="OPEN")
+    client = make_client(handler, open_order)
+    future = handler.track_order(ORDER, Decimal("1"))
+
+    async def fill_later():
+        await asyncio.sleep(0.05)
+        await handler._on_fill_message(fill("1", "3001", remaining="0"))
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    filler = asyncio.create_task(fill_later())
+    result = await client._poll_until_fill_or_timeout(ORDER, 10, future)
+    await filler
+
+    assert result == {"status": "FILLED", "filled_size": Decimal("1"), "avg_price": Decimal("3001")}
+    assert loop.time() - start < 0.5
+    client.get_order_info.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_poll_reconciles_over_rest_at_slow_cadence(handler):
+    open_order = SimpleNamespace(remaining_size=Decimal("1"), filled_size=Decimal("0"), status="OPEN")
+    client = make_client(handler, open_order)
+    client.FILL_RECONCILE_INTERVAL = 0.05
+    future = handler.track_order(ORDER, Decimal("1"))
+
+    result = await client._poll_until_fill_or_timeout(ORDER, 0.22, future)
+
+    assert result["status"] == "TIMEOUT"
+    client.cancel_order.assert_awaited_once_with(ORDER)
+    # ~4 reconciliations + the final status check, instead of ~2 per 100 ms
+    assert 3 <= client.get_order_info.await_count <= 7
+    assert not handler.is_pending(ORDER)
+
+
+@pytest.mark.asyncio
+async def test_poll_rest_safety_net_detects_fill(handler):
+    filled_order = SimpleNamespace(remaining_size=Decimal("0"), filled_size=Decimal("1"), status="OPEN")
+    client = make_client(handler, filled_order)
+    client.FILL_RECONCILE_INTERVAL = 0.01
+    future = handler.track_order(ORDER, Decimal("1"))
+
+    result = await client._poll_until_fill_or_timeout(ORDER, 5, future)
+
+    assert result == {"status": "FILLED", "filled_size": Decimal("1")}
+    assert not handler.is_pending(ORDER)
+
+
+@pytest.mark.asyncio
+async def test_poll_falls_back_to_fast_rest_when_socket_drops(handler):
+    open_order = SimpleNamespace(remaining_size=Decimal("1"), filled_size=Decimal("0"), status="OPEN")
+    client = make_client(handler, open_order)
+    client.REST_POLL_INTERVAL = 0.02
+    future = handler.track_order(ORDER, Decimal("1"))
+
+    async def drop_socket():
+        await asyncio.sleep(0.05)
+        client._ws_client.is_stream_live.return_value = False
+
+    dropper = asyncio.create_task(drop_socket())
+    result = await client._poll_until_fill_or_timeout(ORDER, 0.3, future)
+    await dropper
+
+    assert result["status"] == "TIMEOUT"
+    # FILL_RECONCILE_INTERVAL (2s) alone would allow no reconciliation in 0.3s
+    assert client.get_order_info.await_count >= 5
+    client._ws_client.is_stream_live.assert_called_with("fill", handler.product_id)
@@ -0,0 +1,137 @@
+"""
+Fill ledger tests.
+
+FillHandler accumulates quantity, notional, fee and fill count per order
+across partial fills; limit orders are priced at that VWAP.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from exchanges.base import OrderResult
+from exchanges.nado import NadoClient
+from exchanges.nado_fill_handler import FillHandler
+
+ORDER = "0xdef456"
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def fill(qty, price, remaining, fee="0"):
+    return {
+        "order_digest": ORDER,
+        "filled_qty": x18(qty),
+        "remaining_qty": x18(remaining),
+        "price": x18(price),
+        "fee": x18(fee),
+    }
+
+
+@pytest.fixture
+def handler():
+    return FillHandler(product_id=4, subaccount="0x" + "00" * 32, ws_client=MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_partials_accumulate(handler):
+    handler.track_order(ORDER, Decimal("1"))
+    await handler._on_fill_message(fill("0.25", "3000", "0.75", fee="0.15"))
+    await handler._on_fill_message(fill("0.25", "3002", "0.5", fee="0.15"))
+
+    fills = handler.get_order_fills(ORDER)
+    assert (fills.filled_quantity, fills.fill_count, fills.fee) == (Decimal("0.5"), 2, Decimal("0.3"))
+    assert fills.vwap == Decimal("3001")
+    assert handler.is_pending(ORDER)
+
+    await handler._on_fill_message(fill("0.5", "3004", "0", fee="0.3"))
+    info = handler.get_fill_info(ORDER)
+
+    assert not handler.is_pending(ORDER)
+    assert info["filled_quantity"] == Decimal("1")
+    assert info["price"] == Decimal("3002.5")
+    assert (info["fee"], info["fill_count"]) == (Decimal("0.6"), 3)
+
+
+@pytest.mark.asyncio
+async def test_replayed_fill_ignored(handler):
+    message = fill("0.4", "3000", "0.6")
+    await handler._on_fill_message(message)
+    await handler._on_fill_message(message)
+
+    assert handler.get_fill_info(ORDER)["filled_quantity"] == Decimal("0.4")
+
+
+@pytest.mark.asyncio
+async def test_replayed_fill_without_remaining_ignored(handler):
+    future = handler.track_order(ORDER, Decimal("0.8"))
+    message = {"order_id": ORDER, "filled_size": x18("0.4"), "price": x18("3000"), "timestamp": 1}
+    await handler._on_fill_message(message)
+    await handler._on_fill_message(message)
+
+    fills = handler.get_order_fills(ORDER)
+    assert (fills.filled_quantity, fills.fill_count) == (Decimal("0.4"), 1)
+    assert not future.done()
+
+
+@pytest.mark.asyncio
+async def test_partials_before_tracking_count(handler):
+    await handler._on_fill_message(fill("0.4", "3000", "0.6"))
+    assert handler.get_fill_info(ORDER)["filled_quantity"] == Decimal("0.4")
+
+    future = handler.track_order(ORDER, Decimal("1"))
+    assert not future.done()
+
+    await handler._on_fill_message(fill("0.6", "3010", "0"))
+    info = await future
+    assert info["filled_quantity"] == Decimal("1")
+    assert info["price"] == Decimal("3006")
+
+
+@pytest.mark.asyncio
+async def test_clear_completed_keeps_pending(handler):
+    await handler._on_fill_message(fill("1", "3000", "0"))
+    handler.track_order("0xpending", Decimal("1"))
+    await handler._on_fill_message({**fill("0.5", "3000", "0.5"), "order_digest": "0xpending"})
+
+    assert handler.clear_completed(older_than_seconds=-1) == 1
+    assert handler.get_order_fills(ORDER) is None
+    assert handler.get_order_fills("0xpending").filled_quantity == Decimal("0.5")
+
+
+@pytest.mark.asyncio
+async def test_limit_order_uses_fill_vwap(handler):
+    client = object.__new__(NadoClient)
+    client.logger = SimpleNamespace(log=lambda *args: None)
+    client._ws_connected = True
+    client._fill_handler = handler
+    client._round_quantity_up_to_size_increment = lambda product_id, quantity: quantity
+    client.place_limit_order = AsyncMock(return_value=OrderResult(success=True, order_id=ORDER))
+
+    async def poll(order_id, timeout_seconds, fill_future):
+        # Filled through the book at better prices than the 3010 limit
+        await handler._on_fill_message(fill("0.5", "3000", "0.5"))
+        await handler._on_fill_message(fill("0.5", "3004", "0"))
+        info = await fill_future
+        return {"status": "FILLED", "filled_size": info["filled_quantity"], "avg_price": info["price"]}
+
+    client._poll_until_fill_or_timeout = poll
+    result = await client.place_limit_order_with_timeout("4", Decimal("1"), "buy", price=Decimal("3010"), timeout_seconds=5)
+
+    assert result.status == "FILLED"
+    assert result.price == Decimal("3002")
+
+
+@pytest.mark.asyncio
+async def test_fill_vwap_falls_back_to_ledger_then_limit(handler):
+    client = object.__new__(NadoClient)
+    client._fill_handler = handler
+    assert client._get_fill_vwap(ORDER, {"status": "TIMEOUT"}, Decimal("3010")) == Decimal("3010")
+
+    # Partially filled before the timeout: REST reports the size, the ledger the price
+    await handler._on_fill_message(fill("0.2", "3001", "0.8"))
+    assert client._get_fill_vwap(ORDER, {"status": "TIMEOUT"}, Decimal("3010")) == Decimal("3001")
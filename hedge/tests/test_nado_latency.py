@@ -0,0 +1,74 @@
+"""
+Nado WebSocket latency histogram tests.
+"""
+
+import json
+import time
+
+import pytest
+
+from exchanges.nado_latency import LatencyHistogram
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+class FrameSocket:
+    """Yields the given raw frames, then ends."""
+
+    def __init__(self, frames):
+        self._frames = iter(frames)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._frames)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds():
+    hist = LatencyHistogram()
+    for _ in range(98):
+        hist.record_ns(300_000)  # 300us -> (250, 500] bucket
+    hist.record_ns(40_000_000)  # 40ms
+    hist.record_ns(70_000_000)  # 70ms
+
+    assert hist.count == 100
+    assert hist.percentile(50) == 500
+    assert hist.percentile(99) == 50_000
+    assert hist.percentile(100) == 70_000
+    assert hist.fraction_above(50_000) == pytest.approx(0.01)
+    assert hist.summary()["max_us"] == 70_000
+
+
+def test_negative_samples_clamped_to_zero():
+    hist = LatencyHistogram()
+    hist.record_ns(-5_000_000)  # exchange clock ahead of ours
+
+    assert hist.min_us == 0
+    assert hist.percentile(50) == 0
+
+
+@pytest.mark.asyncio
+async def test_client_records_each_stage_per_stream():
+    client = NadoWebSocketClient(product_ids=[4])
+    now_ns = time.time_ns()
+    client._ws = FrameSocket([
+        json.dumps({"type": "book_depth", "product_id": 4, "max_timestamp": str(now_ns - 20_000_000), "bids": [], "asks": []}),
+        json.dumps({"type": "best_bid_offer", "product_id": 4, "timestamp": str(now_ns)}),
+        json.dumps({"id": 1, "result": None}),
+    ])
+    await client._handle_messages()
+    await client._drain_lane(client._market_lane)
+
+    stats = client.get_latency_stats()
+    assert set(stats) == {"book_depth", "best_bid_offer"}
+    book = stats["book_depth"]
+    assert book["exchange_to_receive"]["count"] == 1
+    assert book["exchange_to_receive"]["min_us"] >= 20_000
+    assert book["receive_to_parsed"]["count"] == 1
+    assert book["parsed_to_handled"]["count"] == 1
+
+    client.reset_latency_stats()
+    assert client.get_latency_stats()["book_depth"]["receive_to_parsed"]["count"] == 0
@@ -0,0 +1,60 @@
+"""
+Nado stream frame decoder tests.
+
+Every backend must produce the same dicts as stdlib json, and the shared x18
+conversion must match the handlers' previous Decimal(1e18) arithmetic.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_message_decoder import (
+    available_decoders,
+    get_decoder,
+    x18_to_decimal,
+)
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+FRAME = (
+    '{"type":"best_bid_offer","timestamp":"1769702385345466465","product_id":4,'
+    '"bid_price":"2821900000000000000000","bid_qty":"417000000000000000",'
+    '"ask_price":"2822000000000000000000","ask_qty":"1334000000000000000"}'
+)
+
+
+@pytest.mark.parametrize("name", available_decoders())
+def test_backends_decode_identically(name):
+    decoder = get_decoder(name)
+
+    assert decoder.decode(FRAME) == get_decoder("json").decode(FRAME)
+
+
+@pytest.mark.parametrize("name", available_decoders())
+def test_backends_report_decode_errors(name):
+    decoder = get_decoder(name)
+
+    with pytest.raises(decoder.decode_errors):
+        decoder.decode("{not json")
+
+
+def test_default_decoder_is_fastest_available():
+    assert get_decoder().name == available_decoders()[0]
+    assert available_decoders()[-1] == "json"
+
+
+def test_unknown_decoder_rejected():
+    with pytest.raises(ValueError):
+        get_decoder("pickle")
+
+
+def test_x18_to_decimal_matches_previous_conversion():
+    for raw in ["2821900000000000000000", "417000000000000000", "0", "-1300000000000000000"]:
+        assert x18_to_decimal(raw) == Decimal(raw) / Decimal(1e18)
+
+
+def test_client_accepts_decoder_name():
+    client = NadoWebSocketClient(product_ids=[4], decoder="json")
+
+    assert client._decoder.name == "json"
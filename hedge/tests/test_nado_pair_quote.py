@@ -0,0 +1,155 @@
+"""
+Pair quote aggregator tests.
+
+One PairQuote is published per tick of either leg, carrying both legs'
+latest snapshots, their skew and the pair ratio.
+"""
+
+import statistics
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bbo_handler import BBOData, BBOHandler
+from exchanges.nado_pair_quote import PairQuote, PairQuoteAggregator
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+MS = 1_000_000
+
+
+def bbo_message(product_id, bid, ask, timestamp):
+    return {
+        "product_id": product_id,
+        "bid_price": str(int(Decimal(bid) * 10 ** 18)),
+        "bid_qty": str(10 ** 18),
+        "ask_price": str(int(Decimal(ask) * 10 ** 18)),
+        "ask_qty": str(10 ** 18),
+        "timestamp": str(timestamp),
+    }
+
+
+@pytest.fixture
+def handlers():
+    client = NadoWebSocketClient(product_ids=[4, 8])
+    return BBOHandler(4, client), BBOHandler(8, client)
+
+
+@pytest.mark.asyncio
+async def test_quote_needs_both_legs(handlers):
+    eth, sol = handlers
+    pair = PairQuoteAggregator(eth, sol)
+    pair.start()
+
+    await eth._on_bbo_message(bbo_message(4, 3000, 3001, 100 * MS))
+    assert pair.get_quote() is None
+
+    await sol._on_bbo_message(bbo_message(8, 149, 151, 130 * MS))
+    quote = pair.get_quote()
+
+    assert quote.leg_a is eth.get_latest_bbo()
+    assert quote.leg_b is sol.get_latest_bbo()
+    assert quote.skew_ns == 30 * MS
+    assert quote.skew_ms == 30.0
+    assert quote.timestamp == 130 * MS
+    assert quote.ratio == Decimal("3000.5") / Decimal("150")
+    assert quote.ratio_spread_bps is None
+
+
+@pytest.mark.asyncio
+async def test_skew_limit(handlers):
+    eth, sol = handlers
+    await eth._on_bbo_message(bbo_message(4, 3000, 3001, 0))
+    await sol._on_bbo_message(bbo_message(8, 149, 151, 500 * MS))
+    pair = PairQuoteAggregator(eth, sol)
+    pair.start()  # seeded from the handlers' latest snapshots
+
+    assert pair.get_quote(max_skew_ms=500) is not None
+    assert pair.get_quote(max_skew_ms=499) is None
+    assert pair.get_quote() is not None
+
+    # A fresh ETH tick brings the legs back in sync
+    await eth._on_bbo_message(bbo_message(4, 3002, 3003, 510 * MS))
+    assert pair.get_quote(max_skew_ms=20).leg_a.bid_price == Decimal("3002")
+
+
+@pytest.mark.asyncio
+async def test_quiet_live_leg_does_not_add_skew(handlers, monkeypatch):
+    eth, sol = handlers
+    for handler in handlers:
+        monkeypatch.setattr(handler, "is_stale", lambda: False)
+    clock = {"now": 1000 * MS}
+    monkeypatch.setattr("exchanges.nado_pair_quote.time.time_ns", lambda: clock["now"])
+    pair = PairQuoteAggregator(eth, sol)
+    pair.start()
+
+    # ETH received 5 ms after its exchange timestamp, then stays quiet
+    await eth._on_bbo_message(bbo_message(4, 3000, 3001, 995 * MS))
+    clock["now"] = 4000 * MS
+    await sol._on_bbo_message(bbo_message(8, 149, 151, 3998 * MS))
+
+    quote = pair.get_quote(max_skew_ms=10)
+    assert quote.timestamp_skew_ns == 3003 * MS
+    assert quote.skew_ns == 3 * MS
+
+    # A lagging SOL feed is still skew
+    clock["now"] = 5000 * MS
+    await sol._on_bbo_message(bbo_message(8, 150, 152, 4500 * MS))
+    assert pair.get_quote(max_skew_ms=10) is None
+    assert pair.get_quote().skew_ns == 495 * MS
+
+    # Without live streams the exchange timestamps decide
+    monkeypatch.setattr(sol, "is_stale", lambda: True)
+    await sol._on_bbo_message(bbo_message(8, 150, 152, 4600 * MS))
+    assert pair.get_quote().skew_ns == 3605 * MS
+
+
+@pytest.mark.asyncio
+async def test_ratio_stats_track_pair_ticks(handlers):
+    eth, sol = handlers
+    pair = PairQuoteAggregator(eth, sol, window_size=5)
+    pair.start()
+    ratios = []
+
+    await sol._on_bbo_message(bbo_message(8, 99, 101, 0))
+    for i in range(8):
+        await eth._on_bbo_message(bbo_message(4, 3000 + i, 3002 + i, i * MS))
+        ratios.append((3001 + i) / 100)
+
+    quote = pair.get_quote()
+    stats = pair.get_ratio_stats()
+    mean = statistics.fmean(ratios[-5:])
+
+    assert stats["count"] == 5
+    assert stats["mean"] == pytest.approx(mean)
+    assert quote.ratio_spread_bps == pytest.approx((ratios[-1] / mean - 1) * 10000)
+
+
+@pytest.mark.asyncio
+async def test_stop_detaches(handlers):
+    eth, sol = handlers
+    pair = PairQuoteAggregator(eth, sol)
+    pair.start()
+    await eth._on_bbo_message(bbo_message(4, 3000, 3001, 0))
+    await sol._on_bbo_message(bbo_message(8, 149, 151, 0))
+    held = pair.get_quote()
+
+    pair.stop()
+    assert eth._tick_listeners == [] and sol._tick_listeners == []
+
+    await eth._on_bbo_message(bbo_message(4, 3100, 3101, MS))
+    assert pair.get_quote() is held
+
+
+def test_pair_quote_is_immutable():
+    eth = BBOData(4, Decimal("3000"), Decimal("1"), Decimal("3001"), Decimal("1"), 5 * MS)
+    sol = BBOData(8, Decimal("149"), Decimal("1"), Decimal("151"), Decimal("1"), 2 * MS)
+    quote = PairQuote(eth, sol, eth.mid_price / sol.mid_price)
+
+    assert quote.skew_ms == 3.0
+    assert quote.is_synchronized(3) and not quote.is_synchronized(2.9)
+    assert quote.is_synchronized(None)
+
+    with pytest.raises(AttributeError):
+        quote.ratio = Decimal("1")
+    with pytest.raises(AttributeError):
+        del quote.skew_ns
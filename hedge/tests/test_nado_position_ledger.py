@@ -0,0 +1,136 @@
+"""
+Position ledger tests.
+
+Fills apply once per (digest, fill index), bridged order results are
+absorbed by their fills, PositionReconciler adopts REST only after a
+confirmed drift, and wait_for() wakes on the satisfying change.
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from exchanges.nado_position_ledger import (
+    PositionLedger, PositionLedgerView, PositionReconciler, fill_key, flat, near
+)
+
+
+def test_fills_apply_once():
+    ledger = PositionLedger(product_id=4)
+    message = {"order_digest": "0xa", "filled_qty": "1", "remaining_qty": "0", "timestamp": 1}
+
+    assert ledger.apply_fill(*fill_key(message), Decimal("0.5"))
+    assert not ledger.apply_fill(*fill_key(message), Decimal("0.5"))
+    assert ledger.apply_fill(*fill_key({**message, "submission_idx": 7}), Decimal("0.5"))
+    assert ledger.position == Decimal("1.0")
+
+
+def test_fills_sharing_submission_idx_apply_separately():
+    ledger = PositionLedger(product_id=4)
+    first = {"order_digest": "0xa", "submission_idx": 7, "filled_qty": "0.4", "remaining_qty": "0.6"}
+    second = {**first, "filled_qty": "0.6", "remaining_qty": "0"}
+
+    assert ledger.apply_fill(*fill_key(first), Decimal("0.4"))
+    assert ledger.apply_fill(*fill_key(second), Decimal("0.6"))
+    assert not ledger.apply_fill(*fill_key(second), Decimal("0.6"))
+    assert ledger.position == Decimal("1.0")
+
+
+def test_bridged_delta_absorbed_by_partial_fills():
+    ledger = PositionLedger()
+    ledger.apply_bridged("0xa", Decimal("-1"))
+    ledger.apply_bridged("0xa", Decimal("-1"))  # same order again: not added twice
+    assert (ledger.position, ledger.provisional_position) == (Decimal("-1"), Decimal("-1"))
+
+    ledger.apply_fill("0xa", 0, Decimal("-0.4"))
+    assert (ledger.position, ledger.provisional_position) == (Decimal("-1"), Decimal("-0.6"))
+    ledger.apply_fill("0xa", 1, Decimal("-0.6"))
+    ledger.apply_fill("0xb", 0, Decimal("-0.2"))  # unrelated order
+    assert (ledger.position, ledger.provisional_position) == (Decimal("-1.2"), Decimal("0"))
+
+
+def test_bridge_after_fill_not_double_counted():
+    ledger = PositionLedger()
+    ledger.apply_fill("0xa", 0, Decimal("0.3"))
+    assert ledger.apply_bridged("0xa", Decimal("0.5")) == Decimal("0.2")
+    assert ledger.position == Decimal("0.5")
+
+
+def test_rest_snapshot_keeps_pending_bridge():
+    ledger = PositionLedger()
+    ledger.apply_bridged("0xa", Decimal("1"))
+    assert ledger.reconcile(Decimal("1.5")) == Decimal("0.5")
+
+    ledger.apply_fill("0xa", 0, Decimal("1"))  # REST already included it
+    assert ledger.position == Decimal("1.5")
+
+
+def test_view_reads_and_sets_ledgers():
+    ledgers = {"ETH": PositionLedger(), "SOL": PositionLedger()}
+    view = PositionLedgerView(ledgers)
+
+    view["SOL"] = Decimal("-2")
+    assert view == {"ETH": Decimal("0"), "SOL": Decimal("-2")}
+    assert ledgers["SOL"].last_source == "override"
+
+
+@pytest.mark.asyncio
+async def test_reconciler_adopts_confirmed_drift():
+    ledger = PositionLedger()
+    on_drift = Mock()
+    reconciler = PositionReconciler(
+        {"ETH": (ledger, AsyncMock(return_value=Decimal("0.2")))}, confirmations=2, on_drift=on_drift
+    )
+
+    assert await reconciler.reconcile_once() == {"ETH": Decimal("0.2")}
+    assert ledger.position == Decimal("0")
+    await reconciler.reconcile_once()
+
+    assert ledger.position == Decimal("0.2")
+    on_drift.assert_called_once_with("ETH", Decimal("0"), Decimal("0.2"))
+    assert await reconciler.reconcile_once() == {"ETH": Decimal("0")}
+
+
+@pytest.mark.asyncio
+async def test_reconciler_skips_ledger_changed_during_request():
+    ledger = PositionLedger()
+
+    async def rest_position():
+        ledger.apply_fill("0xa", 0, Decimal("1"))  # fill lands while REST is in flight
+        return Decimal("0")
+
+    reconciler = PositionReconciler({"ETH": (ledger, rest_position)}, confirmations=1)
+    assert await reconciler.reconcile_once() == {"ETH": None}
+    assert ledger.position == Decimal("1")
+
+
+@pytest.mark.asyncio
+async def test_waiters_wake_on_satisfying_delta():
+    ledger = PositionLedger()
+    ledger.set_position(Decimal("1"))
+    view = PositionLedgerView({"ETH": ledger})
+
+    to_flat = [asyncio.create_task(view.wait_for("ETH", flat(), timeout=1)) for _ in range(3)]
+    to_half = asyncio.create_task(ledger.wait_for(near(Decimal("0.5")), timeout=1))
+    await asyncio.sleep(0)
+    assert ledger.get_stats()["waiters"] == 4
+
+    ledger.apply_fill("0xa", 0, Decimal("-0.5"))
+    assert await to_half is True
+    assert not any(task.done() for task in to_flat)
+
+    ledger.apply_fill("0xa", 1, Decimal("-0.4995"))  # dust left
+    assert await asyncio.gather(*to_flat) == [True, True, True]
+    assert ledger.get_stats()["waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_satisfied_immediately_or_times_out():
+    ledger = PositionLedger()
+    assert await ledger.wait_for(flat(), timeout=0) is True
+
+    ledger.set_position(Decimal("-1"))
+    assert await ledger.wait_for(flat(), timeout=0.01) is False
+    assert ledger.get_stats()["waiters"] == 0
@@ -0,0 +1,103 @@
+"""
+NadoWebSocketClient stream authentication tests.
+
+The subaccount hex is derived once, payloads are signed in a worker thread
+ahead of expiry, and reconnects re-authenticate with the cached payload.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from exchanges.nado_websocket_client import ETH_ACCOUNT_AVAILABLE, NadoWebSocketClient
+
+
+PRIVATE_KEY = "0x" + "11" * 32
+OWNER = "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A"
+
+requires_signing = pytest.mark.skipif(not ETH_ACCOUNT_AVAILABLE, reason="eth-account with encode_typed_data not installed")
+
+
+@pytest.fixture
+def ws_client():
+    client = NadoWebSocketClient(product_ids=[4], private_key=PRIVATE_KEY, owner=OWNER)
+    client._ws = Mock()
+    client._ws.send = AsyncMock()
+    client._state = "connected"
+    yield client
+    if client._auth_presign_task:
+        client._auth_presign_task.cancel()
+
+
+def sent_messages(client):
+    return [json.loads(c.args[0]) for c in client._ws.send.await_args_list]
+
+
+@requires_signing
+@pytest.mark.asyncio
+async def test_authenticate_sends_signed_payload(ws_client):
+    await ws_client.authenticate()
+
+    (auth,) = sent_messages(ws_client)
+    assert auth["method"] == "authenticate"
+    assert auth["tx"]["sender"] == ws_client._get_subaccount_hex()
+    assert auth["signature"]
+    assert isinstance(auth["id"], int)
+    assert ws_client._authenticated
+
+
+@requires_signing
+@pytest.mark.asyncio
+async def test_reauth_uses_cached_payload_without_signing(ws_client):
+    await ws_client.authenticate()
+
+    with patch.object(ws_client, "_sign_auth_payload") as sign:
+        await ws_client._send_auth()
+
+    sign.assert_not_called()
+    first, second = sent_messages(ws_client)
+    assert first["signature"] == second["signature"]
+
+
+@requires_signing
+@pytest.mark.asyncio
+async def test_expiring_payload_is_resigned_off_the_loop(ws_client):
+    await ws_client.authenticate()
+    ws_client._auth_presign_task.cancel()
+    ws_client._auth_payload["tx"]["expiration"] -= ws_client.AUTH_EXPIRATION_MS
+
+    with patch("exchanges.nado_websocket_client.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        await ws_client._send_auth()
+
+    to_thread.assert_awaited_once_with(ws_client._sign_auth_payload)
+    assert sent_messages(ws_client)[-1]["tx"]["expiration"] == ws_client._auth_payload["tx"]["expiration"]
+
+
+def test_subaccount_hex_derived_once(ws_client):
+    with patch("nado_protocol.utils.bytes32.subaccount_to_hex", return_value="0xabc") as to_hex:
+        ws_client._get_subaccount_hex()
+        ws_client._get_subaccount_hex()
+
+    assert to_hex.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_presign_loop_replaces_payload_before_expiry(ws_client):
+    ws_client.AUTH_REFRESH_MARGIN_MS = ws_client.AUTH_EXPIRATION_MS  # always due
+    payloads = iter([{"tx": {"expiration": 0}}, {"tx": {"expiration": 1}}])
+    signed = asyncio.Event()
+
+    def sign():
+        payload = next(payloads)
+        if payload["tx"]["expiration"] == 1:
+            signed.set()
+        return payload
+
+    with patch.object(ws_client, "_sign_auth_payload", side_effect=sign):
+        task = asyncio.create_task(ws_client._auth_presign_loop())
+        await asyncio.wait_for(signed.wait(), timeout=1.0)
+        task.cancel()
+
+    assert ws_client._auth_payload == {"tx": {"expiration": 1}}
@@ -0,0 +1,180 @@
+"""
+NadoWebSocketClient reader/dispatcher split tests.
+
+The reader only decodes; callbacks run on a priority lane (private streams,
+never coalesced or reordered) and a market lane (BookDepth deltas coalesced
+per product while waiting).
+"""
+
+import asyncio
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from exchanges.nado_bookdepth_handler import BookDepthHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+SUBACCOUNT = "0x" + "aa" * 32
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def book(product_id: int, last_max: int, max_ts: int, bids=()) -> dict:
+    return {
+        "type": "book_depth",
+        "product_id": product_id,
+        "last_max_timestamp": str(last_max),
+        "max_timestamp": str(max_ts),
+        "bids": [[x18(p), x18(q)] for p, q in bids],
+        "asks": [],
+    }
+
+
+def fill(n: int) -> dict:
+    return {"type": "fill", "product_id": 4, "subaccount": SUBACCOUNT, "submission_idx": str(n)}
+
+
+class FrameSocket:
+    """Yields the given raw frames, then ends."""
+
+    def __init__(self, frames):
+        self._frames = iter(frames)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._frames)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture
+def ws_client():
+    client = NadoWebSocketClient(product_ids=[4, 8])
+    client._ws = Mock()
+    client._ws.send = AsyncMock()
+    client._state = "connected"
+    yield client
+    for task in client._dispatch_tasks:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_book_depth_deltas_coalesced_per_product(ws_client):
+    handler = BookDepthHandler(4, ws_client)
+    await handler.start()
+    sol_cb = Mock()
+    await ws_client.subscribe("book_depth", 8, callback=sol_cb)
+
+    ws_client._enqueue_dispatch(book(4, 0, 100, bids=[("3000", "1"), ("2999", "1")]), 0)
+    ws_client._enqueue_dispatch(book(8, 0, 100, bids=[("120", "1")]), 0)
+    ws_client._enqueue_dispatch(book(4, 100, 200, bids=[("2999", "0"), ("2998", "3")]), 0)
+    ws_client._enqueue_dispatch(book(4, 200, 300, bids=[("3000", "2")]), 0)
+    await ws_client._drain_lane(ws_client._market_lane)
+
+    assert ws_client.get_dispatch_stats()["coalesced"] == 2
+    assert dict(handler.bids) == {Decimal("3000"): Decimal("2"), Decimal("2998"): Decimal("3")}
+    assert handler.last_timestamp == 300
+    sol_cb.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_message_keeps_gap_chain(ws_client):
+    ws_client._enqueue_dispatch(book(4, 100, 200), 0)
+    ws_client._enqueue_dispatch(book(4, 200, 300), 0)
+
+    (merged, _), = ws_client._market_lane
+    assert merged["last_max_timestamp"] == "100"
+    assert merged["max_timestamp"] == "300"
+
+
+@pytest.mark.asyncio
+async def test_private_messages_kept_in_order_on_priority_lane(ws_client):
+    seen = []
+    await ws_client.subscribe("fill", 4, callback=lambda m: seen.append(m["submission_idx"]), subaccount=SUBACCOUNT)
+
+    for n in range(5):
+        ws_client._enqueue_dispatch(fill(n), 0)
+    ws_client._enqueue_dispatch(book(4, 0, 100), 0)
+
+    assert len(ws_client._priority_lane) == 5
+    await ws_client._drain_lane(ws_client._priority_lane)
+    assert seen == ["0", "1", "2", "3", "4"]
+    assert ws_client.get_dispatch_stats()["coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_market_callback_does_not_delay_fills(ws_client):
+    release = asyncio.Event()
+    fill_seen = asyncio.Event()
+
+    async def slow_bbo(message):
+        await release.wait()
+
+    await ws_client.subscribe("best_bid_offer", 4, callback=slow_bbo)
+    await ws_client.subscribe("fill", 4, callback=lambda m: fill_seen.set(), subaccount=SUBACCOUNT)
+    ws_client._start_dispatchers()
+
+    ws_client._ws = FrameSocket([
+        json.dumps({"type": "best_bid_offer", "product_id": 4}),
+        json.dumps(fill(1)),
+    ])
+    await ws_client._handle_messages()
+
+    await asyncio.wait_for(fill_seen.wait(), timeout=1.0)
+    assert not release.is_set()
+    release.set()
+
+
+class QueueSocket:
+    """Yields frames put on its queue until closed."""
+
+    def __init__(self):
+        self.frames = asyncio.Queue()
+        self.send = AsyncMock()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        frame = await self.frames.get()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
+
+    async def close(self):
+        self.frames.put_nowait(None)
+
+
+@pytest.mark.asyncio
+async def test_callbacks_still_dispatched_after_disconnect_and_connect(monkeypatch):
+    import exchanges.nado_websocket_client as ws_module
+
+    sockets = []
+
+    async def fake_connect(*args, **kwargs):
+        sockets.append(QueueSocket())
+        return sockets[-1]
+
+    monkeypatch.setattr(ws_module.websockets, "connect", fake_connect)
+    client = NadoWebSocketClient(product_ids=[4], auto_reconnect=False)
+    fill_seen = asyncio.Event()
+    await client.subscribe("fill", 4, callback=lambda m: fill_seen.set(), subaccount=SUBACCOUNT)
+
+    await client.connect()
+    await client.disconnect()
+    await client.connect()
+    try:
+        sockets[-1].frames.put_nowait(json.dumps(fill(1)))
+        await asyncio.wait_for(fill_seen.wait(), timeout=1.0)
+        assert all(not task.done() for task in client._dispatch_tasks)
+        assert not client._watchdog_task.done()
+    finally:
+        await client.disconnect()
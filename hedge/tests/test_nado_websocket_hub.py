@@ -0,0 +1,162 @@
+"""
+Shared WebSocket connection hub tests.
+
+Two NadoClients (ETH, SOL) must share one socket: subscriptions are
+reference-counted per (stream, product_id, subaccount) and stream messages are
+routed to the handler of the matching product only.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from exchanges.nado_websocket_client import NadoWebSocketClient
+from exchanges.nado_websocket_hub import NadoWebSocketHub
+
+
+class FakeSocket:
+    """Minimal websockets connection: records sends, never yields frames."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self._closed_event = asyncio.Event()
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+        self._closed_event.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._closed_event.wait()
+        raise StopAsyncIteration
+
+
+@pytest.fixture(autouse=True)
+def reset_hub():
+    NadoWebSocketHub._clients = {}
+    NadoWebSocketHub._ref_counts = {}
+    NadoWebSocketHub._lock = None
+    yield
+    NadoWebSocketHub._clients = {}
+    NadoWebSocketHub._ref_counts = {}
+    NadoWebSocketHub._lock = None
+
+
+@pytest.fixture
+def sockets():
+    opened = []
+
+    async def fake_connect(*args, **kwargs):
+        ws = FakeSocket()
+        opened.append(ws)
+        return ws
+
+    with patch("exchanges.nado_websocket_client.websockets.connect", side_effect=fake_connect):
+        yield opened
+
+
+@pytest.mark.asyncio
+async def test_acquire_shares_one_socket_per_endpoint(sockets):
+    eth_ws = await NadoWebSocketHub.acquire(product_ids=[4])
+    sol_ws = await NadoWebSocketHub.acquire(product_ids=[8])
+
+    assert eth_ws is sol_ws
+    assert len(sockets) == 1
+    assert eth_ws.product_ids == [4, 8]
+    assert NadoWebSocketHub.get_ref_count() == 2
+
+    await NadoWebSocketHub.release(eth_ws)
+    assert sockets[0].closed is False
+
+    await NadoWebSocketHub.release(sol_ws)
+    assert sockets[0].closed is True
+    assert NadoWebSocketHub.get_ref_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_reference_counted(sockets):
+    ws_client = await NadoWebSocketHub.acquire(product_ids=[4])
+    subaccount = "0x" + "ab" * 32
+    handler_cb, bot_cb = AsyncMock(), AsyncMock()
+
+    await ws_client.subscribe("fill", 4, callback=handler_cb, subaccount=subaccount)
+    await ws_client.subscribe("fill", 4, callback=bot_cb, subaccount=subaccount)
+
+    subscribes = [m for m in sockets[0].sent if m["method"] == "subscribe"]
+    assert len(subscribes) == 1
+
+    await ws_client.unsubscribe("fill", 4, callback=handler_cb, subaccount=subaccount)
+    assert not any(m["method"] == "unsubscribe" for m in sockets[0].sent)
+
+    await ws_client.unsubscribe("fill", 4, callback=bot_cb, subaccount=subaccount)
+    unsubscribes = [m for m in sockets[0].sent if m["method"] == "unsubscribe"]
+    assert len(unsubscribes) == 1
+    assert unsubscribes[0]["stream"]["subaccount"] == subaccount
+
+    await NadoWebSocketHub.release(ws_client)
+
+
+@pytest.mark.asyncio
+async def test_messages_are_routed_by_product_id(sockets):
+    ws_client = await NadoWebSocketHub.acquire(product_ids=[4, 8])
+    eth_cb, sol_cb = AsyncMock(), AsyncMock()
+
+    await ws_client.subscribe("best_bid_offer", 4, callback=eth_cb)
+    await ws_client.subscribe("best_bid_offer", 8, callback=sol_cb)
+
+    await ws_client._process_message({"type": "best_bid_offer", "product_id": 8, "bid_price": "1"})
+
+    eth_cb.assert_not_awaited()
+    sol_cb.assert_awaited_once()
+
+    await NadoWebSocketHub.release(ws_client)
+
+
+@pytest.mark.asyncio
+async def test_release_of_unmanaged_client_disconnects_it(sockets):
+    ws_client = NadoWebSocketClient(product_ids=[4])
+    await ws_client.connect()
+
+    await NadoWebSocketHub.release(ws_client)
+
+    assert sockets[0].closed is True
+
+
+@pytest.mark.asyncio
+async def test_different_accounts_get_separate_sockets(sockets):
+    main = await NadoWebSocketHub.acquire(product_ids=[4], private_key="0x01", owner="0xAbC")
+    same = await NadoWebSocketHub.acquire(product_ids=[8], private_key="0x01", owner="0xabc")
+    other_owner = await NadoWebSocketHub.acquire(product_ids=[4], private_key="0x02", owner="0xdef")
+    other_subaccount = await NadoWebSocketHub.acquire(
+        product_ids=[4], private_key="0x01", owner="0xabc", subaccount_name="hedge"
+    )
+
+    assert main is same
+    assert len({id(main), id(other_owner), id(other_subaccount)}) == 3
+    assert len(sockets) == 3
+    assert NadoWebSocketHub.get_ref_count(owner="0xabc") == 2
+    assert NadoWebSocketHub.get_ref_count(owner="0xdef") == 1
+
+    for client in (main, same, other_owner, other_subaccount):
+        await NadoWebSocketHub.release(client)
+    assert all(ws.closed for ws in sockets)
+
+
+@pytest.mark.asyncio
+async def test_mismatched_private_key_for_shared_account_raises(sockets):
+    ws_client = await NadoWebSocketHub.acquire(product_ids=[4], private_key="0x01", owner="0xabc")
+
+    with pytest.raises(ValueError):
+        await NadoWebSocketHub.acquire(product_ids=[8], private_key="0x02", owner="0xabc")
+
+    assert len(sockets) == 1
+    assert NadoWebSocketHub.get_ref_count(owner="0xabc") == 1
+    await NadoWebSocketHub.release(ws_client)
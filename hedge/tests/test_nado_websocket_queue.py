@@ -0,0 +1,78 @@
+"""
+NadoWebSocketClient messages() queue tests.
+
+The queue is opt-in (created by iterating messages()), bounded, and either
+drops the oldest message or applies backpressure when full.
+"""
+
+import asyncio
+
+import pytest
+
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def bbo(n: int) -> dict:
+    return {"type": "best_bid_offer", "product_id": 4, "seq": n}
+
+
+@pytest.mark.asyncio
+async def test_no_queue_without_consumer():
+    client = NadoWebSocketClient(product_ids=[4])
+
+    for n in range(100):
+        await client._process_message(bbo(n))
+
+    stats = client.get_queue_stats()
+    assert stats["enabled"] is False
+    assert stats["size"] == 0
+    assert stats["dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy_keeps_newest_and_counts_drops():
+    client = NadoWebSocketClient(product_ids=[4], message_queue_maxsize=3)
+    stream = client.messages()
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)  # let the iterator create the queue
+
+    await client._process_message(bbo(0))
+    assert (await first)["seq"] == 0
+
+    for n in range(1, 6):
+        await client._process_message(bbo(n))
+
+    stats = client.get_queue_stats()
+    assert stats["size"] == 3
+    assert stats["dropped"] == 2
+    assert [(await stream.__anext__())["seq"] for _ in range(3)] == [3, 4, 5]
+
+    await stream.aclose()
+    assert client.get_queue_stats()["enabled"] is False
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    client = NadoWebSocketClient(product_ids=[4], message_queue_maxsize=1, message_queue_policy="block")
+    stream = client.messages()
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    await client._process_message(bbo(0))
+    await first
+    await client._process_message(bbo(1))
+
+    blocked = asyncio.ensure_future(client._process_message(bbo(2)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    assert (await stream.__anext__())["seq"] == 1
+    await asyncio.wait_for(blocked, timeout=1.0)
+    assert client.get_queue_stats()["dropped"] == 0
+
+    await stream.aclose()
+
+
+def test_invalid_queue_policy_rejected():
+    with pytest.raises(ValueError):
+        NadoWebSocketClient(product_ids=[4], message_queue_policy="unbounded")
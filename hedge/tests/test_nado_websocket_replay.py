@@ -0,0 +1,143 @@
+"""
+Nado WebSocket record/replay tests.
+
+Frames captured by the client tap replay through ReplayWebSocketClient into
+the same handler state as live processing.
+"""
+
+import json
+import time
+from decimal import Decimal
+
+import pytest
+
+from exchanges.nado_bbo_handler import BBOHandler
+from exchanges.nado_bookdepth_handler import BookDepthHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+from exchanges.nado_websocket_recorder import ZSTD_AVAILABLE, FrameRecorder, read_frames
+from exchanges.nado_websocket_replay import ReplayWebSocketClient
+
+
+def x18(value: str) -> str:
+    return str(int(Decimal(value) * 10 ** 18))
+
+
+def sample_frames() -> list:
+    frames = []
+    for i in range(20):
+        frames.append(json.dumps({
+            "type": "best_bid_offer", "product_id": 4, "timestamp": str(1_000 + i),
+            "bid_price": x18(str(3000 + i)), "bid_qty": x18("1"),
+            "ask_price": x18(str(3001 + i)), "ask_qty": x18("2"),
+        }))
+        frames.append(json.dumps({
+            "type": "book_depth", "product_id": 4,
+            "last_max_timestamp": str(1_000 + i - 1), "max_timestamp": str(1_000 + i),
+            "bids": [[x18(str(3000 + i)), x18("1")]], "asks": [[x18(str(3001 + i)), x18("2")]],
+        }))
+    return frames
+
+
+def write_recording(path, frames, gap_ns=1_000_000, compress=False):
+    recorder = FrameRecorder(str(path), compress=compress)
+    for i, frame in enumerate(frames):
+        recorder.write(frame, i * gap_ns)
+    recorder.close()
+
+
+class FrameSocket:
+    """Yields the given raw frames, then ends."""
+
+    def __init__(self, frames):
+        self._frames = iter(frames)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._frames)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def test_recording_round_trip(tmp_path):
+    path = tmp_path / "frames.nwsrec"
+    write_recording(path, ["a", b"\x00bin", "{}"])
+
+    assert list(read_frames(str(path))) == [(0, b"a"), (1_000_000, b"\x00bin"), (2_000_000, b"{}")]
+
+
+@pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+def test_compressed_recording_round_trip(tmp_path):
+    path = tmp_path / "frames.nwsrec.zst"
+    frames = sample_frames()
+    write_recording(path, frames, compress=True)
+
+    assert [frame.decode() for _, frame in read_frames(str(path))] == frames
+
+
+def test_truncated_recording_stops_at_last_complete_frame(tmp_path):
+    path = tmp_path / "frames.nwsrec"
+    write_recording(path, ["first", "second"])
+    with open(path, "r+b") as f:
+        f.truncate(path.stat().st_size - 3)
+
+    assert [frame for _, frame in read_frames(str(path))] == [b"first"]
+
+
+def test_non_recording_rejected(tmp_path):
+    path = tmp_path / "frames.jsonl"
+    path.write_text('{"type": "fill"}\n')
+
+    with pytest.raises(ValueError):
+        list(read_frames(str(path)))
+
+
+@pytest.mark.asyncio
+async def test_client_tap_records_raw_frames(tmp_path):
+    path = tmp_path / "tap.nwsrec"
+    frames = sample_frames()[:4]
+    client = NadoWebSocketClient(product_ids=[4])
+    client._ws = FrameSocket(frames)
+
+    client.start_recording(str(path))
+    await client._handle_messages()
+    assert client.stop_recording() == 4
+
+    recorded = list(read_frames(str(path)))
+    assert [frame.decode() for _, frame in recorded] == frames
+    assert [ts for ts, _ in recorded] == sorted(ts for ts, _ in recorded)
+
+
+@pytest.mark.asyncio
+async def test_replay_rebuilds_handler_state(tmp_path):
+    path = tmp_path / "frames.nwsrec"
+    write_recording(path, sample_frames())
+
+    client = ReplayWebSocketClient(str(path), speed=None)
+    bbo = BBOHandler(4, client)
+    book = BookDepthHandler(4, client)
+    await bbo.start()
+    await book.start()
+    stats = await client.replay()
+
+    assert stats["frames"] == 40
+    assert bbo.get_prices() == (Decimal("3019"), Decimal("3020"))
+    assert book.get_best_bid() == (Decimal("3019"), Decimal("1"))
+    assert book.last_timestamp == 1_019
+    assert len(book.bids) == 20
+    assert client._ws.sent[0]["method"] == "subscribe"
+
+
+@pytest.mark.asyncio
+async def test_replay_paces_frames_in_real_time(tmp_path):
+    path = tmp_path / "frames.nwsrec"
+    write_recording(path, sample_frames()[:6], gap_ns=20_000_000)  # 100ms span
+
+    client = ReplayWebSocketClient(str(path), speed=1.0)
+    start = time.perf_counter()
+    stats = await client.replay()
+
+    assert stats["frames"] == 6
+    assert time.perf_counter() - start >= 0.09
@@ -0,0 +1,97 @@
+"""
+NadoWebSocketClient routing table tests.
+
+Stream messages are dispatched through a table keyed by
+(type, product_id, subaccount) that is compiled at registration time.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+SUB_A = "0x" + "aa" * 32
+SUB_B = "0x" + "bb" * 32
+
+
+@pytest.fixture
+def ws_client():
+    client = NadoWebSocketClient(product_ids=[4, 8])
+    client._ws = Mock()
+    client._ws.send = AsyncMock()
+    client._state = "connected"
+    return client
+
+
+@pytest.mark.asyncio
+async def test_book_depth_routes_only_to_matching_product(ws_client):
+    eth_cb, sol_cb = AsyncMock(), AsyncMock()
+    await ws_client.subscribe("book_depth", 4, callback=eth_cb)
+    await ws_client.subscribe("book_depth", 8, callback=sol_cb)
+
+    await ws_client._process_message({"type": "book_depth", "product_id": 4, "bids": [], "asks": []})
+
+    eth_cb.assert_awaited_once()
+    sol_cb.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_private_streams_route_by_subaccount(ws_client):
+    cb_a, cb_b = Mock(), Mock()
+    await ws_client.subscribe("fill", 4, callback=cb_a, subaccount=SUB_A)
+    await ws_client.subscribe("fill", 4, callback=cb_b, subaccount=SUB_B)
+
+    # Exchange may echo the subaccount hex in a different case
+    await ws_client._process_message({"type": "fill", "product_id": 4, "subaccount": "0x" + "BB" * 32})
+
+    cb_a.assert_not_called()
+    cb_b.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_private_message_without_subaccount_reaches_product_route(ws_client):
+    cb = Mock()
+    await ws_client.subscribe("fill", 4, callback=cb, subaccount=SUB_A)
+
+    await ws_client._process_message({"type": "fill", "product_id": 4})
+
+    cb.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_wide_callbacks_run_before_product_callbacks(ws_client):
+    calls = []
+    ws_client.register_callback("best_bid_offer", lambda data: calls.append("wide"))
+    await ws_client.subscribe("best_bid_offer", 4, callback=lambda data: calls.append("eth"))
+
+    await ws_client._process_message({"type": "best_bid_offer", "product_id": 4})
+    await ws_client._process_message({"type": "best_bid_offer", "product_id": 99})
+
+    assert calls == ["wide", "eth", "wide"]
+
+
+@pytest.mark.asyncio
+async def test_callback_kind_resolved_at_registration_not_per_message(ws_client):
+    cb = AsyncMock()
+    await ws_client.subscribe("best_bid_offer", 4, callback=cb)
+
+    with patch("exchanges.nado_websocket_client.asyncio.iscoroutinefunction") as introspect:
+        for _ in range(10):
+            await ws_client._process_message({"type": "best_bid_offer", "product_id": 4})
+
+    introspect.assert_not_called()
+    assert cb.await_count == 10
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_removes_route(ws_client):
+    cb = Mock()
+    await ws_client.subscribe("book_depth", 4, callback=cb)
+    await ws_client.unsubscribe("book_depth", 4, callback=cb)
+
+    await ws_client._process_message({"type": "book_depth", "product_id": 4})
+
+    cb.assert_not_called()
+    assert ws_client._routes == {}
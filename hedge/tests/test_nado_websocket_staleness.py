@@ -0,0 +1,188 @@
+"""
+Nado WebSocket staleness watchdog tests.
+
+Each (stream, product) subscription tracks its last message. A stream past its
+quiet threshold is only recorded while the connection is alive; it is
+resubscribed after the larger resubscribe threshold, and NadoClient getters
+stop serving its data once the connection is dead or that bound is exceeded.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from exchanges.nado_bbo_handler import BBOHandler
+from exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+@pytest.fixture
+def ws_client():
+    client = NadoWebSocketClient(
+        product_ids=[4, 8],
+        staleness_thresholds={"best_bid_offer": 2.0},
+        resubscribe_thresholds={"best_bid_offer": 10.0},
+    )
+    client._ws = Mock()
+    client._ws.send = AsyncMock()
+    client._ws.ping = AsyncMock(side_effect=pong)
+    client._state = "connected"
+    client._last_socket_message_ns = time.perf_counter_ns()
+    return client
+
+
+async def pong():
+    waiter = asyncio.get_running_loop().create_future()
+    waiter.set_result(None)
+    return waiter
+
+
+async def no_pong():
+    return asyncio.get_running_loop().create_future()
+
+
+def age_stream(client, stream_type, product_id, seconds):
+    client._last_message_ns[(stream_type, product_id)] = time.perf_counter_ns() - int(seconds * 1e9)
+
+
+def silence_socket(client, seconds):
+    client._last_socket_message_ns = time.perf_counter_ns() - int(seconds * 1e9)
+
+
+def sent_methods(client):
+    return [json.loads(c.args[0])["method"] for c in client._ws.send.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_quiet_stream_on_live_connection_is_not_stale(ws_client):
+    await ws_client.subscribe("best_bid_offer", 4, callback=Mock())
+    ws_client._enqueue_dispatch({"type": "best_bid_offer", "product_id": 4}, time.perf_counter_ns())
+    assert not ws_client.is_stale("best_bid_offer", 4)
+
+    age_stream(ws_client, "best_bid_offer", 4, 3.0)
+    assert not ws_client.is_stale("best_bid_offer", 4)
+
+    age_stream(ws_client, "best_bid_offer", 4, 11.0)
+    assert ws_client.is_stale("best_bid_offer", 4)
+
+
+@pytest.mark.asyncio
+async def test_streams_without_threshold_never_stale(ws_client):
+    await ws_client.subscribe("fill", 4, callback=Mock(), subaccount="0x" + "aa" * 32)
+    age_stream(ws_client, "fill", 4, 3600)
+
+    assert not ws_client.is_stale("fill", 4)
+
+
+@pytest.mark.asyncio
+async def test_stream_live_follows_connection_not_stream_silence(ws_client):
+    assert not ws_client.is_stream_live("fill", 4)
+    await ws_client.subscribe("fill", 4, callback=Mock(), subaccount="0x" + "aa" * 32)
+    age_stream(ws_client, "fill", 4, 3600)
+    assert ws_client.is_stream_live("fill", 4)
+
+    silence_socket(ws_client, 6.0)
+    assert not ws_client.is_stream_live("fill", 4)
+
+    silence_socket(ws_client, 0.0)
+    ws_client._state = "disconnected"
+    assert not ws_client.is_stream_live("fill", 4)
+
+
+@pytest.mark.asyncio
+async def test_quiet_stream_recorded_without_resubscribe(ws_client):
+    await ws_client.subscribe("best_bid_offer", 4, callback=Mock())
+    await ws_client.subscribe("best_bid_offer", 8, callback=Mock())
+    ws_client._ws.send.reset_mock()
+
+    # ETH quiet while SOL keeps the socket busy: a calm market, not a dead socket
+    age_stream(ws_client, "best_bid_offer", 4, 3.0)
+    ws_client._enqueue_dispatch({"type": "best_bid_offer", "product_id": 8}, time.perf_counter_ns())
+    await ws_client._check_staleness()
+
+    assert sent_methods(ws_client) == []
+    stats = ws_client.get_staleness_stats()
+    assert stats["counts"] == {"quiet": 1, "dead": 0, "recovered": 0, "resubscribes": 0}
+    (event,) = stats["events"]
+    assert (event["event"], event["product_id"], event["socket_active"]) == ("quiet", 4, True)
+    assert [s["product_id"] for s in stats["quiet"]] == [4]
+
+    ws_client._enqueue_dispatch({"type": "best_bid_offer", "product_id": 4}, time.perf_counter_ns())
+    await ws_client._check_staleness()
+
+    stats = ws_client.get_staleness_stats()
+    assert stats["counts"]["recovered"] == 1
+    assert stats["events"][-1]["resubscribed"] is False
+    assert stats["quiet"] == []
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_after_resubscribe_threshold(ws_client):
+    await ws_client.subscribe("best_bid_offer", 4, callback=Mock())
+    ws_client._ws.send.reset_mock()
+
+    age_stream(ws_client, "best_bid_offer", 4, 11.0)
+    await ws_client._check_staleness()
+    await ws_client._check_staleness()  # no second resubscribe within the threshold
+
+    assert sent_methods(ws_client) == ["unsubscribe", "subscribe"]
+    assert ws_client.get_staleness_stats()["counts"]["resubscribes"] == 1
+
+    ws_client._enqueue_dispatch({"type": "best_bid_offer", "product_id": 4}, time.perf_counter_ns())
+    await ws_client._check_staleness()
+    assert ws_client.get_staleness_stats()["events"][-1]["resubscribed"] is True
+
+
+@pytest.mark.asyncio
+async def test_silent_socket_is_probed_before_declared_dead(ws_client):
+    await ws_client.subscribe("best_bid_offer", 4, callback=Mock())
+    age_stream(ws_client, "best_bid_offer", 4, 6.0)
+    silence_socket(ws_client, 6.0)
+
+    # Pong answered: only a quiet market
+    await ws_client._check_staleness()
+    assert ws_client._ws.ping.await_count == 1
+    assert ws_client.get_staleness_stats()["connection"]["alive"] is True
+    assert not ws_client.is_stale("best_bid_offer", 4)
+
+    # No pong: connection dead, no resubscribe, data stale
+    ws_client.CONNECTION_PING_TIMEOUT = 0.01
+    ws_client._ws.ping.side_effect = no_pong
+    silence_socket(ws_client, 6.0)
+    ws_client._ws.send.reset_mock()
+    await ws_client._check_staleness()
+
+    stats = ws_client.get_staleness_stats()
+    assert stats["connection"]["alive"] is False
+    assert stats["counts"]["dead"] == 1
+    assert stats["events"][-1]["event"] == "dead"
+    assert sent_methods(ws_client) == []
+    assert ws_client.is_stale("best_bid_offer", 4)
+
+    ws_client._enqueue_dispatch({"type": "best_bid_offer", "product_id": 4}, time.perf_counter_ns())
+    await ws_client._check_staleness()
+    assert ws_client.get_staleness_stats()["connection"]["alive"] is True
+    assert not ws_client.is_stale("best_bid_offer", 4)
+
+
+@pytest.mark.asyncio
+async def test_stale_bbo_handler_reports_stale(ws_client):
+    handler = BBOHandler(4, ws_client)
+    await handler.start()
+    assert not handler.is_stale()
+
+    age_stream(ws_client, "best_bid_offer", 4, 20.0)
+    assert handler.is_stale()
+
+
+@pytest.mark.asyncio
+async def test_last_unsubscribe_clears_tracking(ws_client):
+    cb = Mock()
+    await ws_client.subscribe("best_bid_offer", 4, callback=cb)
+    age_stream(ws_client, "best_bid_offer", 4, 10.0)
+    await ws_client.unsubscribe("best_bid_offer", 4, callback=cb)
+
+    await ws_client.subscribe("best_bid_offer", 4, callback=cb)
+    assert not ws_client.is_stale("best_bid_offer", 4)
@@ -63,12 +63,23 @@ class TestNadoClientIntegration:
         """Verify it returns BBOHandler when WebSocket is connected"""
         mock_nado_client._ws_connected = True
         mock_nado_client._bbo_handler = Mock(spec=BBOHandler)
+        mock_nado_client._bbo_handler.is_stale.return_value = False
 
         result = mock_nado_client.get_bbo_handler()
 
         assert result is not None, "get_bbo_handler() should return BBOHandler when connected"
         assert isinstance(result, Mock), "Should return the BBOHandler instance"
 
+    def test_get_bbo_handler_returns_none_when_stale(self, mock_nado_client):
+        """Verify it returns None when the BBO feed stopped updating"""
+        mock_nado_client._ws_connected = True
+        mock_nado_client._bbo_handler = Mock(spec=BBOHandler)
+        mock_nado_client._bbo_handler.is_stale.return_value = True
+
+        result = mock_nado_client.get_bbo_handler()
+
+        assert result is None, "get_bbo_handler() should return None when BBO is stale"
+
     def test_get_bbo_handler_returns_none_when_disconnected(self, mock_nado_client):
         """Verify it returns None when WebSocket is disconnected"""
         mock_nado_client._ws_connected = False
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -101,21 +102,18 @@ class TestFillBasedPositionTruth:
 
         assert bot._ws_positions["SOL"] == Decimal("-1.3")
 
-    def test_bridged_fill_is_ignored_once(self):
+    def test_bridged_fill_is_absorbed(self):
         bot = make_bot()
-        bot._bridged_fill_order_ids.add("eth-bridge")
+        result = Mock(success=True, order_id="eth-bridge", filled_size=Decimal("0.1"))
+        bot._apply_order_result_to_ws_positions("ETH", "buy", result, "BUILD")
+        assert bot._ws_positions["ETH"] == Decimal("0.1")
 
-        bot._on_fill_message(
-            make_fill(
-                4,
-                "100000000000000000",
-                is_bid=True,
-                order_digest="eth-bridge",
-            )
-        )
+        fill = make_fill(4, "100000000000000000", is_bid=True, order_digest="eth-bridge")
+        bot._on_fill_message(fill)
+        bot._on_fill_message(fill)
 
-        assert bot._ws_positions["ETH"] == Decimal("0")
-        assert "eth-bridge" not in bot._bridged_fill_order_ids
+        assert bot._ws_positions["ETH"] == Decimal("0.1")
+        assert bot._position_ledgers["ETH"].provisional_position == Decimal("0")
 
 
 class TestPositionWaitMechanism:
@@ -157,6 +155,30 @@ class TestPositionWaitMechanism:
         assert bot._ws_positions["ETH"] == Decimal("0.1")
 
 
+class TestVerifyPositionClosed:
+    @pytest.mark.asyncio
+    async def test_verify_wakes_on_closing_fill_without_rest(self):
+        bot = make_bot()
+        bot._ws_positions["ETH"] = Decimal("0.1")
+        bot.eth_client.get_account_positions = AsyncMock(return_value=Decimal("0.1"))
+
+        verify_task = asyncio.create_task(bot._verify_position_closed("ETH", max_wait_seconds=5))
+        await asyncio.sleep(0)
+        bot._on_fill_message(make_fill(4, "100000000000000000", is_bid=False, order_digest="eth-close"))
+
+        assert await asyncio.wait_for(verify_task, 1) is True
+        bot.eth_client.get_account_positions.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_check_remaining_position_reads_ledger(self):
+        bot = make_bot()
+        bot._ws_positions["SOL"] = Decimal("0.0004")
+        bot.sol_client.get_account_positions = AsyncMock()
+
+        assert await bot._check_and_close_remaining_position("ETH") is True
+        bot.sol_client.get_account_positions.assert_not_awaited()
+
+
 class TestPositionDriftDetection:
     @pytest.mark.asyncio
     async def test_detect_position_drift_uses_ws_positions_against_rest(self):
@@ -178,3 +200,22 @@ class TestPositionDriftDetection:
         drift = await bot._detect_position_drift("ETH", bot.eth_client)
 
         assert drift == Decimal("0")
+
+
+class TestVerifyPositionsBeforeBuild:
+    @pytest.mark.asyncio
+    async def test_legacy_close_resets_ledgers_to_rest(self):
+        bot = make_bot()
+        bot.USE_ASYNC_POSITION_WAIT = False
+        bot._ws_last_update_time = {"ETH": time.time(), "SOL": time.time()}
+        bot._ws_positions["ETH"] = Decimal("0.1")
+        bot._force_close_position = AsyncMock()
+        bot.eth_client.get_account_positions = AsyncMock(return_value=Decimal("0.0004"))
+        bot.sol_client.get_account_positions = AsyncMock(return_value=Decimal("0"))
+
+        assert await bot._verify_positions_before_build() is True
+
+        bot._force_close_position.assert_awaited_once_with("ETH")
+        assert bot._ws_positions["ETH"] == Decimal("0.0004")
+        assert bot._position_ledgers["ETH"].last_source == "rest_reset"
+        assert bot._position_ledgers["SOL"].last_source == "rest_reset"
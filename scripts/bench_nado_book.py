@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Nado Order Book Benchmark
+
+Replays a BookDepth stream through BookDepthHandler (x18 integer book) and
+through the previous Decimal-keyed implementation, reporting delta messages/sec
+and the cost of best-level reads, slippage walks and top-N book summaries
+(on a 500-level book by default) for both.
+
+Frames come from --frames (a recording made with
+NadoWebSocketClient.start_recording(), or one JSON frame per line); only
+book_depth frames are used. Otherwise a synthetic ETH book stream is generated.
+
+Usage:
+    python3 scripts/bench_nado_book.py
+    python3 scripts/bench_nado_book.py --frames logs/ws_frames.nwsrec --repeat 5
+    python3 scripts/bench_nado_book.py --levels 500
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+from sortedcontainers import SortedDict
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hedge.exchanges.nado_bookdepth_handler import BookDepthHandler
+from hedge.exchanges.nado_websocket_client import NadoWebSocketClient
+from hedge.exchanges.nado_websocket_recorder import is_recording, read_frames
+
+
+class DecimalBook:
+    """The previous BookDepthHandler book: Decimal levels, key-function SortedDict."""
+
+    def __init__(self):
+        self.bids = SortedDict(lambda x: -x)
+        self.asks = SortedDict()
+
+    def apply(self, message: dict) -> None:
+        for price_str, qty_str in message.get("bids", []):
+            price = Decimal(price_str) / Decimal(1e18)
+            qty = Decimal(qty_str) / Decimal(1e18)
+            if qty == 0:
+                self.bids.pop(price, None)
+            else:
+                self.bids[price] = qty
+        for price_str, qty_str in message.get("asks", []):
+            price = Decimal(price_str) / Decimal(1e18)
+            qty = Decimal(qty_str) / Decimal(1e18)
+            if qty == 0:
+                self.asks.pop(price, None)
+            else:
+                self.asks[price] = qty
+
+    def best(self):
+        bid = next(iter(self.bids.keys()))
+        ask = next(iter(self.asks.keys()))
+        return bid, self.bids[bid], ask, self.asks[ask]
+
+    def estimate_slippage(self, quantity: Decimal) -> Decimal:
+        best_price = next(iter(self.asks.keys()))
+        remaining = quantity
+        vwap = Decimal(0)
+        total_qty = Decimal(0)
+        for price in sorted(self.asks.keys()):
+            if remaining <= 0:
+                break
+            qty = min(remaining, self.asks[price])
+            vwap += price * qty
+            total_qty += qty
+            remaining -= qty
+        if total_qty < quantity:
+            return Decimal(999999)
+        vwap /= total_qty
+        return (vwap - best_price) / best_price * 10000
+
+    def summary(self, max_levels: int = 5) -> dict:
+        """Previous get_order_book_summary: a full key-list copy per level."""
+        bid_levels = []
+        for i in range(min(max_levels, len(self.bids))):
+            price = list(self.bids.keys())[i]
+            bid_levels.append({"level": i, "price": str(price), "quantity": str(self.bids[price])})
+        ask_levels = []
+        for i in range(min(max_levels, len(self.asks))):
+            price = list(self.asks.keys())[i]
+            ask_levels.append({"level": i, "price": str(price), "quantity": str(self.asks[price])})
+        return {
+            "bid_levels": bid_levels,
+            "ask_levels": ask_levels,
+            "total_bid_liquidity": str(sum(self.bids.values())),
+            "total_ask_liquidity": str(sum(self.asks.values())),
+        }
+
+
+def synthetic_frames(count: int, levels: int, seed: int = 7) -> list:
+    """BookDepth deltas around a drifting ETH mid: an initial full book, then small updates."""
+    rng = random.Random(seed)
+    tick = 10 ** 17
+    mid = 2822 * 10 ** 18
+    ts = 1769702385345466465
+
+    def qty() -> str:
+        return str(rng.randint(1, 400) * 10 ** 16)
+
+    frames = [json.dumps({
+        "type": "book_depth", "product_id": 4,
+        "last_max_timestamp": str(ts), "max_timestamp": str(ts + 1),
+        "bids": [[str(mid - (k + 1) * tick), qty()] for k in range(levels)],
+        "asks": [[str(mid + k * tick), qty()] for k in range(levels)],
+    })]
+    ts += 1
+
+    for _ in range(count):
+        mid += rng.choice((-1, 0, 0, 1)) * tick
+        bids, asks = [], []
+        for _ in range(rng.randint(2, 12)):
+            depth = int(rng.expovariate(0.3))
+            bids.append([str(mid - (depth + 1) * tick), "0" if rng.random() < 0.2 else qty()])
+            asks.append([str(mid + depth * tick), "0" if rng.random() < 0.2 else qty()])
+        frames.append(json.dumps({
+            "type": "book_depth", "product_id": 4,
+            "last_max_timestamp": str(ts), "max_timestamp": str(ts + 50_000_000),
+            "bids": bids, "asks": asks,
+        }))
+        ts += 50_000_000
+    return frames
+
+
+def load_frames(path: str) -> list:
+    if is_recording(path):
+        frames = [frame for _, frame in read_frames(path)]
+    else:
+        with open(path) as f:
+            frames = [line.strip() for line in f if line.strip()]
+    return [frame for frame in frames if b'"book_depth"' in (frame if isinstance(frame, bytes) else frame.encode())]
+
+
+def bench_apply(messages: list, repeat: int) -> tuple:
+    """Messages/sec applying the same deltas to both books (returns results and final books)."""
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        book = DecimalBook()
+        for message in messages:
+            book.apply(message)
+    results["decimal"] = len(messages) * repeat / (time.perf_counter() - start)
+
+    handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        handler._bids.clear()
+        handler._asks.clear()
+        for message in messages:
+            handler._apply_delta(message)
+    results["x18"] = len(messages) * repeat / (time.perf_counter() - start)
+
+    return results, book, handler
+
+
+def bench_reads(book: DecimalBook, handler: BookDepthHandler, quantity: Decimal, iterations: int) -> dict:
+    """Per-call microseconds for best-level reads, a slippage walk and an exit-capacity check."""
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        book.best()
+    results["best_decimal_us"] = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        handler.get_best_bid()
+        handler.get_best_ask()
+    results["best_x18_us"] = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        book.estimate_slippage(quantity)
+    results["slippage_decimal_us"] = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        handler.estimate_slippage("buy", quantity)
+    results["slippage_x18_us"] = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        handler._ladders.clear()  # as after every delta
+        handler.estimate_exit_capacity(-quantity * 4, max_slippage_bps=5)
+    results["exit_capacity_us"] = (time.perf_counter() - start) / iterations * 1e6
+
+    return results
+
+
+def bench_summary(levels: int, max_levels: int, iterations: int) -> dict:
+    """Per-call microseconds for a top-N summary of a deep book, updated between calls."""
+    snapshot, update = [json.loads(frame) for frame in synthetic_frames(1, levels)]
+    book = DecimalBook()
+    book.apply(snapshot)
+    handler = BookDepthHandler(4, NadoWebSocketClient(product_ids=[4]))
+    handler._apply_delta(snapshot)
+    results = {"levels": len(handler._bids)}
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        book.apply(update)
+        book.summary(max_levels)
+    results["summary_decimal_us"] = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        handler._apply_delta(update)
+        handler.get_order_book_summary(max_levels)
+    results["summary_x18_us"] = (time.perf_counter() - start) / iterations * 1e6
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Nado order book delta application")
+    parser.add_argument("--frames", help="Recording file, or file with one raw JSON frame per line")
+    parser.add_argument("--messages", type=int, default=20000, help="Synthetic delta count")
+    parser.add_argument("--levels", type=int, default=100, help="Synthetic initial levels per side")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the delta stream")
+    parser.add_argument("--quantity", default="5", help="Order size for the slippage walk")
+    parser.add_argument("--summary-book-levels", type=int, default=500, help="Levels per side for the summary benchmark")
+    parser.add_argument("--summary-levels", type=int, default=5, help="Levels per side in each summary")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames) if args.frames else synthetic_frames(args.messages, args.levels)
+    messages = [json.loads(frame) for frame in frames]
+    source = f"file: {args.frames}" if args.frames else f"synthetic, {args.levels} levels"
+    print(f"BookDepth messages: {len(messages)} ({source}), repeat={args.repeat}")
+
+    apply_results, book, handler = bench_apply(messages, args.repeat)
+    print(f"{'apply msgs/sec':<22} decimal={apply_results['decimal']:>10.0f}  x18={apply_results['x18']:>10.0f}  "
+          f"speedup={apply_results['x18'] / apply_results['decimal']:.2f}x")
+    print(f"book: {len(handler._bids)} bids, {len(handler._asks)} asks")
+
+    reads = bench_reads(book, handler, Decimal(args.quantity), 5000)
+    print(f"{'best bid+ask us':<22} decimal={reads['best_decimal_us']:>10.2f}  x18={reads['best_x18_us']:>10.2f}")
+    print(f"{'slippage walk us':<22} decimal={reads['slippage_decimal_us']:>10.2f}  x18={reads['slippage_x18_us']:>10.2f}")
+    print(f"{'exit capacity us':<22} x18={reads['exit_capacity_us']:>10.2f} (ladder rebuilt per call)")
+
+    summary = bench_summary(args.summary_book_levels, args.summary_levels, 2000)
+    print(f"{'summary us':<22} decimal={summary['summary_decimal_us']:>10.2f}  x18={summary['summary_x18_us']:>10.2f}  "
+          f"({summary['levels']} levels/side, top {args.summary_levels}, one delta per call)")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    main()
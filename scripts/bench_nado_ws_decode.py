@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Nado WebSocket Decode Benchmark
+
+Measures per-message cost of decoding Nado stream frames and dispatching them
+to the BBO/BookDepth handlers, for every decoder backend installed
+(msgspec, orjson, stdlib json).
+
+Frames come from --frames: a recording made with
+NadoWebSocketClient.start_recording() (see record_nado_ws.py) or a file of raw
+frames, one JSON frame per line. Otherwise a built-in sample set shaped like recorded mainnet traffic
+(BBO ticks, 50ms BookDepth deltas, fills, position changes) is used.
+
+Usage:
+    python3 scripts/bench_nado_ws_decode.py
+    python3 scripts/bench_nado_ws_decode.py --frames logs/ws_frames.jsonl --repeat 20
+    python3 scripts/bench_nado_ws_decode.py --frames logs/ws_frames.nwsrec
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hedge.exchanges.nado_message_decoder import available_decoders, get_decoder
+from hedge.exchanges.nado_websocket_recorder import is_recording, read_frames
+from hedge.exchanges.nado_websocket_client import NadoWebSocketClient, ConnectionState
+from hedge.exchanges.nado_bbo_handler import BBOHandler
+from hedge.exchanges.nado_bookdepth_handler import BookDepthHandler
+
+
+SUBACCOUNT = "0x7a5ec2748e9065794491a8d29dcf3f9edb8d7c43746573743000000000000000"
+
+
+def sample_frames() -> list:
+    """Build a frame mix shaped like mainnet ETH/SOL traffic."""
+    frames = []
+    ts = 1769702385345466465
+    for i in range(2000):
+        ts += 3_000_000
+        product_id = 4 if i % 2 == 0 else 8
+        mid = 2822 * 10**18 if product_id == 4 else 123 * 10**18
+        tick = 10**17 if product_id == 4 else 10**16
+        step = (i % 7 - 3) * tick
+
+        frames.append(json.dumps({
+            "type": "best_bid_offer",
+            "timestamp": str(ts),
+            "product_id": product_id,
+            "bid_price": str(mid + step - tick),
+            "bid_qty": "417000000000000000",
+            "ask_price": str(mid + step),
+            "ask_qty": "1334000000000000000",
+        }))
+
+        if i % 3 == 0:
+            levels = 3 + i % 8
+            frames.append(json.dumps({
+                "type": "book_depth",
+                "min_timestamp": str(ts - 50_000_000),
+                "max_timestamp": str(ts),
+                "last_max_timestamp": str(ts - 50_000_000),
+                "product_id": product_id,
+                "bids": [[str(mid + step - (k + 1) * tick), str((k % 4) * 250000000000000000)] for k in range(levels)],
+                "asks": [[str(mid + step + k * tick), str(((k + 1) % 4) * 250000000000000000)] for k in range(levels)],
+            }))
+
+        if i % 200 == 0:
+            frames.append(json.dumps({
+                "type": "fill",
+                "timestamp": str(ts),
+                "product_id": product_id,
+                "subaccount": SUBACCOUNT,
+                "order_digest": "0x" + f"{i:064x}",
+                "filled_qty": "100000000000000000",
+                "remaining_qty": "0",
+                "original_qty": "100000000000000000",
+                "price": str(mid),
+                "is_taker": False,
+                "is_bid": i % 400 == 0,
+                "fee": "-10000000000000000",
+                "submission_idx": str(1000 + i),
+            }))
+            frames.append(json.dumps({
+                "type": "position_change",
+                "timestamp": str(ts),
+                "product_id": product_id,
+                "subaccount": SUBACCOUNT,
+                "amount": "100000000000000000",
+                "v_quote_amount": str(-mid // 10),
+                "reason": "match_orders",
+            }))
+    return frames
+
+
+def load_frames(path: str) -> list:
+    if is_recording(path):
+        return [frame for _, frame in read_frames(path)]
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+async def make_pipeline(decoder_name: str) -> NadoWebSocketClient:
+    """Client with BBO/BookDepth handlers for ETH and SOL subscribed (no socket)."""
+
+    class NullSocket:
+        async def send(self, message):
+            pass
+
+    client = NadoWebSocketClient(product_ids=[4, 8], decoder=decoder_name)
+    client._ws = NullSocket()
+    client._state = ConnectionState.CONNECTED
+    for product_id in (4, 8):
+        await BBOHandler(product_id, client).start()
+        await BookDepthHandler(product_id, client).start()
+    return client
+
+
+async def bench_backend(decoder_name: str, frames: list, repeat: int) -> dict:
+    decoder = get_decoder(decoder_name)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for frame in frames:
+            decoder.decode(frame)
+    decode_ns = (time.perf_counter() - start) / (repeat * len(frames)) * 1e9
+
+    client = await make_pipeline(decoder_name)
+    decode = client._decoder.decode
+    process = client._process_message
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for frame in frames:
+            await process(decode(frame))
+    total_ns = (time.perf_counter() - start) / (repeat * len(frames)) * 1e9
+
+    return {"decode_ns": decode_ns, "decode_dispatch_ns": total_ns}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Nado WS frame decode + dispatch")
+    parser.add_argument("--frames", help="Recording file, or file with one raw JSON frame per line")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the frame set")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames) if args.frames else sample_frames()
+    print(f"Frames: {len(frames)} ({'file: ' + args.frames if args.frames else 'built-in sample'}), repeat={args.repeat}")
+    print(f"{'backend':<10} {'decode ns/msg':>15} {'decode+dispatch ns/msg':>24}")
+
+    for name in available_decoders():
+        result = await bench_backend(name, frames, args.repeat)
+        print(f"{name:<10} {result['decode_ns']:>15.0f} {result['decode_dispatch_ns']:>24.0f}")
+
+
+if __name__ == "__main__":
+    # Handler log lines would dominate the measurement
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Nado WebSocket Recorder
+
+Records raw mainnet WebSocket frames (BBO, BookDepth and, with credentials,
+Fill/PositionChange) to a recording file that ReplayWebSocketClient and
+bench_nado_ws_decode.py can play back offline.
+
+Private streams need NADO_PRIVATE_KEY (and optionally NADO_SUBACCOUNT_NAME)
+in the environment or .env.
+
+Usage:
+    python3 scripts/record_nado_ws.py --seconds 300 --out logs/ws_frames.nwsrec
+    python3 scripts/record_nado_ws.py --products 4 8 --zstd --out logs/ws_frames.nwsrec.zst
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hedge.exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def get_subaccount(private_key: str, subaccount_name: str):
+    """Derive (owner, subaccount hex) from the private key."""
+    from eth_account import Account
+    from nado_protocol.utils.bytes32 import subaccount_to_hex
+    from nado_protocol.utils.subaccount import SubaccountParams
+
+    owner = Account.from_key(private_key).address
+    subaccount_hex = subaccount_to_hex(SubaccountParams(
+        subaccount_owner=owner,
+        subaccount_name=subaccount_name,
+    ))
+    return owner, subaccount_hex
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Record Nado WebSocket frames for offline replay")
+    parser.add_argument("--out", required=True, help="Recording file path")
+    parser.add_argument("--products", type=int, nargs="+", default=[4, 8], help="Product IDs (default: 4 8)")
+    parser.add_argument("--seconds", type=float, default=60, help="Recording duration")
+    parser.add_argument("--zstd", action="store_true", help="zstd-compress the recording")
+    parser.add_argument("--public-only", action="store_true", help="Skip fill/position_change streams")
+    args = parser.parse_args()
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    private_key = os.getenv("NADO_PRIVATE_KEY")
+    subaccount_name = os.getenv("NADO_SUBACCOUNT_NAME", "default")
+    owner, subaccount_hex = None, None
+    if private_key and not args.public_only:
+        owner, subaccount_hex = get_subaccount(private_key, subaccount_name)
+
+    client = NadoWebSocketClient(
+        product_ids=args.products,
+        private_key=private_key,
+        owner=owner,
+        subaccount_name=subaccount_name,
+    )
+    await client.connect()
+    client.start_recording(args.out, compress=args.zstd)
+
+    for product_id in args.products:
+        await client.subscribe("best_bid_offer", product_id)
+        await client.subscribe("book_depth", product_id)
+        if subaccount_hex:
+            await client.subscribe("fill", product_id, subaccount=subaccount_hex)
+            await client.subscribe("position_change", product_id, subaccount=subaccount_hex)
+
+    print(f"Recording products {args.products} for {args.seconds:.0f}s -> {args.out}")
+    await asyncio.sleep(args.seconds)
+
+    count = client.stop_recording()
+    await client.disconnect()
+    print(f"Recorded {count} frames")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
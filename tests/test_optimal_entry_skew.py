@@ -0,0 +1,79 @@
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hedge.DN_pair_eth_sol_nado import DNPairBot
+from hedge.exchanges.nado_bbo_handler import BBOHandler
+from hedge.exchanges.nado_websocket_client import NadoWebSocketClient
+
+
+def make_bot() -> DNPairBot:
+    with patch.dict(
+        "os.environ",
+        {
+            "NADO_PRIVATE_KEY": "0x" + "1" * 64,
+            "NADO_MODE": "MAINNET",
+            "NADO_SUBACCOUNT_NAME": "test",
+        },
+    ):
+        bot = DNPairBot(
+            target_notional=Decimal("100"),
+            csv_path="/tmp/test_optimal_entry_skew.csv",
+            max_leg_skew_ms=50,
+        )
+    return bot
+
+
+def bbo_message(product_id, bid, ask, timestamp):
+    return {
+        "product_id": product_id,
+        "bid_price": str(int(Decimal(bid) * 10 ** 18)),
+        "bid_qty": str(10 ** 18),
+        "ask_price": str(int(Decimal(ask) * 10 ** 18)),
+        "ask_qty": str(10 ** 18),
+        "timestamp": str(timestamp),
+    }
+
+
+def live_client(handler):
+    handler.is_stale = lambda: False
+    client = Mock()
+    client.config = Mock(contract_id=handler.product_id)
+    client.get_bbo_handler = Mock(return_value=handler)
+    client.get_bbo_snapshot = Mock(side_effect=handler.get_latest_bbo)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_skewed_profitable_quote_does_not_block_the_loop():
+    ws_client = NadoWebSocketClient(product_ids=[4, 8])
+    eth, sol = BBOHandler(4, ws_client), BBOHandler(8, ws_client)
+    bot = make_bot()
+    bot.eth_client, bot.sol_client = live_client(eth), live_client(sol)
+
+    # Wide spreads on both legs, but the SOL feed lags ETH by 500 ms
+    bot._get_pair_quote()
+    now = time.time_ns()
+    await eth._on_bbo_message(bbo_message(4, 3000, 3030, now))
+    await sol._on_bbo_message(bbo_message(8, 149, 151, now - 500_000_000))
+    assert bot._get_pair_quote().skew_ms > bot.max_leg_skew_ms
+
+    heartbeats = 0
+
+    async def heartbeat():
+        nonlocal heartbeats
+        while True:
+            await asyncio.sleep(0.01)
+            heartbeats += 1
+
+    ticker = asyncio.create_task(heartbeat())
+    try:
+        result = await bot._wait_for_optimal_entry(timeout=1)
+    finally:
+        ticker.cancel()
+
+    assert result["reason"] == "timeout"
+    assert heartbeats >= 20